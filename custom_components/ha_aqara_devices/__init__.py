@@ -5,47 +5,53 @@ from contextlib import suppress
 from datetime import timedelta
 from functools import partial
 import logging
+import os
+import time
 from typing import Any, Awaitable, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers import aiohttp_client, config_validation as cv, entity_registry as er
+from homeassistant.helpers import (
+    aiohttp_client,
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
-    A100_PRO_MODELS,
-    ACN002_MODELS,
     BRIDGE_SANITY_INTERVAL_SECONDS,
     BRIDGE_UNAVAILABLE_AFTER_FAILURES,
     CONF_APP_ID,
     CONF_APP_KEY,
+    CONF_BRIDGE_ACTIVE_ACTIVE,
     CONF_BRIDGE_TOKEN,
     CONF_BRIDGE_URL,
+    CONF_COUNT_STATISTICS,
     CONF_KEY_ID,
+    COUNT_STATISTICS_FLUSH_SECONDS,
+    DEVICE_DISCOVERY_INTERVAL_SECONDS,
+    DEVICE_DISCOVERY_REMOVE_AFTER_MISSES,
+    DEVICE_STATE_GROUP,
     DOMAIN,
     DEFAULT_BRIDGE_URL,
-    FP2_MODEL,
-    FP300_MODEL,
-    G2H_PRO_MODELS,
-    G410_MODELS,
-    G4_MODELS,
-    G3_MODELS,
-    M100_MODELS,
-    M200_MODELS,
-    M3_MODELS,
     PLATFORMS,
-    PRESENCE_MODELS,
+    POLL_PRIORITY_LOCK,
     TOKEN_REFRESH_STARTUP_MARGIN_SECONDS,
     U200_INTERVAL_SECONDS,
-    U200_MODELS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 BRIDGE_START_RETRY_INITIAL_SECONDS = 5
 BRIDGE_START_RETRY_MAX_SECONDS = 30
+SUBSCRIPTION_UPDATE_COOLDOWN_SECONDS = 2
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
@@ -59,6 +65,7 @@ def _build_resilient_update(
     did: str,
     label: str,
     unavailable_after_failures: int,
+    record_result: Callable[[str, str, bool], None] | None = None,
 ) -> Callable[[], Awaitable[dict[str, Any]]]:
     from .api import AqaraAuthError
 
@@ -71,6 +78,8 @@ def _build_resilient_update(
             raise ConfigEntryAuthFailed(str(err)) from err
         except Exception as err:
             state["failures"] += 1
+            if record_result is not None:
+                record_result(did, label, False)
             if state["last_data"] is not None and state["failures"] < unavailable_after_failures:
                 _LOGGER.warning(
                     "Aqara %s update failed for %s (%s/%s), keeping last known state: %s",
@@ -85,6 +94,8 @@ def _build_resilient_update(
 
         state["last_data"] = data
         state["failures"] = 0
+        if record_result is not None:
+            record_result(did, label, True)
         return data
 
     return _async_update
@@ -92,25 +103,37 @@ def _build_resilient_update(
 
 def _create_resilient_coordinator(
     hass: HomeAssistant,
+    scheduler,
     did: str,
     label: str,
     fetch_method: Callable[[], Awaitable[dict[str, Any]]],
     interval_seconds: int,
     unavailable_after_failures: int,
+    priority: int,
+    *,
+    push_managed: bool = True,
 ) -> DataUpdateCoordinator:
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
         name=f"{DOMAIN}-{label}-{did}",
         update_method=_build_resilient_update(
-            fetch_method,
+            scheduler.limited(fetch_method),
             did,
             label,
             unavailable_after_failures,
+            scheduler.record_poll_result,
         ),
         update_interval=timedelta(seconds=interval_seconds),
     )
-    hass.async_create_task(coordinator.async_refresh())
+    scheduler.register(
+        coordinator,
+        did,
+        label,
+        interval_seconds,
+        priority,
+        push_managed=push_managed,
+    )
     return coordinator
 
 
@@ -136,142 +159,224 @@ async def _async_refresh_coordinators_after_setup(
             )
 
 
-def _setup_device_state_coordinators(
+def _create_swept_coordinator(
     hass: HomeAssistant,
+    scheduler,
+    sweeper,
     api,
-    devices: list[dict[str, Any]],
+    did: str,
     label: str,
-    state_defs: list[dict[str, Any]],
-) -> dict[str, DataUpdateCoordinator]:
-    coordinators: dict[str, DataUpdateCoordinator] = {}
-    for device in devices:
-        did = device["did"]
-        coordinators[did] = _create_resilient_coordinator(
-            hass,
+    poll: dict[str, Any],
+    priority: int,
+) -> DataUpdateCoordinator:
+    """Create a coordinator that the fleet sweeper keeps up to date.
+
+    It does not poll on its own; its update method only runs for explicit
+    refreshes (for example after a write).
+    """
+
+    async def _async_fetch() -> dict[str, Any]:
+        return await api.run_resource_poll(did, sweeper.filtered_poll(did, poll))
+
+    coordinator = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=f"{DOMAIN}-{label}-{did}",
+        update_method=_build_resilient_update(
+            scheduler.limited(_async_fetch),
             did,
             label,
-            partial(api.get_device_states, did, state_defs),
-            BRIDGE_SANITY_INTERVAL_SECONDS,
             BRIDGE_UNAVAILABLE_AFTER_FAILURES,
-        )
-    return coordinators
+        ),
+        update_interval=None,
+    )
+    sweeper.add(coordinator, did, poll, priority)
+    return coordinator
 
 
-def _setup_presence_coordinators(
+def _create_device_coordinators(
     hass: HomeAssistant,
+    scheduler,
+    sweeper,
     api,
-    presence_devices: list[dict[str, Any]],
-) -> dict[str, dict[str, DataUpdateCoordinator]]:
-    coordinators: dict[str, dict[str, DataUpdateCoordinator]] = {}
-
-    for presence in presence_devices:
-        did = presence["did"]
-        model = str(presence.get("model") or "")
-        if model == FP2_MODEL:
-            device_coordinators = {
-                "fast": _create_resilient_coordinator(
-                    hass,
-                    did,
-                    "presence-fast",
-                    partial(api.get_presence_fast_state, did, model),
-                    BRIDGE_SANITY_INTERVAL_SECONDS,
-                    BRIDGE_UNAVAILABLE_AFTER_FAILURES,
-                ),
-                "presence": _create_resilient_coordinator(
-                    hass,
-                    did,
-                    "presence-presence",
-                    partial(api.get_fp2_presence, did),
-                    BRIDGE_SANITY_INTERVAL_SECONDS,
-                    BRIDGE_UNAVAILABLE_AFTER_FAILURES,
-                ),
-                "medium": _create_resilient_coordinator(
-                    hass,
-                    did,
-                    "presence-medium",
-                    partial(api.get_presence_medium_state, did, model),
-                    BRIDGE_SANITY_INTERVAL_SECONDS,
-                    BRIDGE_UNAVAILABLE_AFTER_FAILURES,
-                ),
-                "slow": _create_resilient_coordinator(
-                    hass,
-                    did,
-                    "presence-slow",
-                    partial(api.get_presence_slow_state, did, model),
-                    BRIDGE_SANITY_INTERVAL_SECONDS,
-                    BRIDGE_UNAVAILABLE_AFTER_FAILURES,
-                ),
-            }
-        elif model == FP300_MODEL:
-            device_coordinators = {
-                "fast": _create_resilient_coordinator(
-                    hass,
-                    did,
-                    "presence-fast",
-                    partial(api.get_presence_fast_state, did, model),
-                    BRIDGE_SANITY_INTERVAL_SECONDS,
-                    BRIDGE_UNAVAILABLE_AFTER_FAILURES,
-                ),
-                "medium": _create_resilient_coordinator(
-                    hass,
-                    did,
-                    "presence-medium",
-                    partial(api.get_presence_medium_state, did, model),
-                    BRIDGE_SANITY_INTERVAL_SECONDS,
-                    BRIDGE_UNAVAILABLE_AFTER_FAILURES,
-                ),
-                "slow": _create_resilient_coordinator(
+    record: dict[str, Any],
+) -> None:
+    """Create the coordinators of an indexed device as its model profile describes."""
+    did = record["did"]
+    profile = record["profile"]
+    kind = profile["coordinator"]
+    if kind == "device_state":
+        record["coordinators"][DEVICE_STATE_GROUP] = _create_swept_coordinator(
+            hass,
+            scheduler,
+            sweeper,
+            api,
+            did,
+            profile["coordinator_label"],
+            api.device_state_poll(did, profile["state_specs"]),
+            profile["poll_priorities"][DEVICE_STATE_GROUP],
+        )
+    elif kind == "presence":
+        model = str(record["device"].get("model") or "")
+        record["coordinators"].update(
+            {
+                group: _create_swept_coordinator(
                     hass,
+                    scheduler,
+                    sweeper,
+                    api,
                     did,
-                    "presence-slow",
-                    partial(api.get_presence_slow_state, did, model),
-                    BRIDGE_SANITY_INTERVAL_SECONDS,
-                    BRIDGE_UNAVAILABLE_AFTER_FAILURES,
-                ),
+                    f"presence-{group}",
+                    api.presence_poll(did, model, group),
+                    profile["poll_priorities"][group],
+                )
+                for group in profile["poll_groups"]
             }
-        else:
-            continue
-
-        coordinators[did] = device_coordinators
-
-    return coordinators
-
-
-def _setup_u200_coordinators(
-    hass: HomeAssistant,
-    api,
-    u200_locks: list[dict[str, Any]],
-) -> dict[str, DataUpdateCoordinator]:
-    coordinators: dict[str, DataUpdateCoordinator] = {}
-    for lock in u200_locks:
-        did = lock["did"]
-        coordinators[did] = _create_resilient_coordinator(
+        )
+    elif kind == "u200":
+        record["coordinators"][DEVICE_STATE_GROUP] = _create_resilient_coordinator(
             hass,
+            scheduler,
             did,
-            "u200-lock-state",
+            profile["coordinator_label"],
             partial(api.get_u200_state, did),
             U200_INTERVAL_SECONDS,
             BRIDGE_UNAVAILABLE_AFTER_FAILURES,
+            profile["poll_priorities"][DEVICE_STATE_GROUP],
+            push_managed=False,
         )
-    return coordinators
 
 
 def _entry_bridge_value(entry: ConfigEntry, key: str, default: str = "") -> str:
     return str(entry.options.get(key) or entry.data.get(key) or default).strip()
 
 
+def _push_journal_path(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry.entry_id}.journal")
+
+
+def _entry_bridge_urls(entry: ConfigEntry) -> list[str]:
+    """Return the configured bridge URLs; the option accepts a comma-separated list."""
+    raw_value = _entry_bridge_value(entry, CONF_BRIDGE_URL, DEFAULT_BRIDGE_URL)
+    return [url.strip() for url in raw_value.split(",") if url.strip()]
+
+
 def _enabled_unique_ids_for_entry(hass: HomeAssistant, entry: ConfigEntry) -> set[str]:
     entity_registry = er.async_get(hass)
-    return {
+    enabled = {
         str(registry_entry.unique_id)
         for registry_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
         if registry_entry.unique_id and registry_entry.disabled_by is None
     }
+    # Imported count statistics need their resources even with the sensors disabled.
+    count_statistics = hass.data.get(DOMAIN, {}).get(entry.entry_id, {}).get("count_statistics")
+    if count_statistics is not None:
+        enabled |= count_statistics.unique_ids()
+    return enabled
+
 
+async def _async_discover_device_changes(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    entry_data: dict[str, Any],
+    misses: dict[str, int],
+    subscription_debouncer: Debouncer,
+) -> None:
+    """Add devices that appeared in the account and remove the ones that are gone.
 
-async def _async_start_bridge_with_retry(entry: ConfigEntry, bridge_manager) -> None:
+    Only the changed devices get coordinators, entities and subscriptions;
+    the stream and the other devices are left alone.  A device has to be
+    missing from DEVICE_DISCOVERY_REMOVE_AFTER_MISSES listings in a row
+    before it is removed.
+    """
     from .api import AqaraAuthError
+    from .device_info import forget_device_info
+    from .discovery import diff_devices, signal_devices_added
+
+    try:
+        devices = await entry_data["api"].get_devices()
+    except AqaraAuthError as err:
+        _LOGGER.warning("Aqara device discovery skipped because authentication failed: %s", err)
+        return
+    except Exception as err:
+        _LOGGER.debug("Aqara device discovery failed: %s", err)
+        return
+    if not devices:
+        return
 
+    device_index = entry_data["device_index"]
+    added, missing = diff_devices(device_index, devices)
+    seen = {device["did"] for device in devices}
+    for did in [did for did in misses if did in seen]:
+        misses.pop(did)
+    removed_dids: set[str] = set()
+    for did in missing:
+        misses[did] = misses.get(did, 0) + 1
+        if misses[did] >= DEVICE_DISCOVERY_REMOVE_AFTER_MISSES:
+            removed_dids.add(did)
+    if not added and not removed_dids:
+        return
+
+    state_store = entry_data["state_store"]
+    bridge_manager = entry_data["bridge_manager"]
+    if removed_dids:
+        state_store.async_forget(device_index.subset(removed_dids).all_coordinators())
+        entry_data["occupancy"].remove_devices(removed_dids)
+        if entry_data["count_statistics"] is not None:
+            entry_data["count_statistics"].remove_devices(removed_dids)
+        for did in removed_dids:
+            device_index.remove(did)
+            misses.pop(did, None)
+        entry_data["fleet_sweeper"].remove_devices(removed_dids)
+        entry_data["poll_scheduler"].unregister_devices(removed_dids)
+        bridge_manager.remove_devices(removed_dids)
+        forget_device_info(removed_dids)
+        device_registry = dr.async_get(hass)
+        for did in removed_dids:
+            device = device_registry.async_get_device(identifiers={(DOMAIN, did)})
+            if device is not None:
+                device_registry.async_update_device(device.id, remove_config_entry_id=entry.entry_id)
+
+    added_dids: set[str] = set()
+    for device in added:
+        record = device_index.add(device)
+        if record is None:
+            continue
+        _create_device_coordinators(
+            hass,
+            entry_data["poll_scheduler"],
+            entry_data["fleet_sweeper"],
+            entry_data["api"],
+            record,
+        )
+        added_dids.add(record["did"])
+    if added_dids:
+        state_store.async_track(device_index.subset(added_dids).all_coordinators())
+        entry_data["occupancy"].add_devices(device_index.subset(added_dids))
+        if entry_data["count_statistics"] is not None:
+            entry_data["count_statistics"].add_devices(device_index.subset(added_dids))
+        bridge_manager.add_devices(added_dids)
+        async_dispatcher_send(hass, signal_devices_added(entry.entry_id), added_dids)
+
+    _LOGGER.info(
+        "Aqara device discovery for %s: %s added, %s removed",
+        entry.title,
+        sorted(added_dids),
+        sorted(removed_dids),
+    )
+    # Subscriptions and the poll filter follow the new entities once they are registered.
+    await subscription_debouncer.async_call()
+    if added_dids:
+        await entry_data["fleet_sweeper"].async_sweep_devices(added_dids)
+        for record in device_index.subset(added_dids):
+            if record["profile"]["coordinator"] == "u200":
+                await record["coordinators"][DEVICE_STATE_GROUP].async_refresh()
+
+
+async def _async_start_bridge_with_retry(entry: ConfigEntry, bridge_manager, profiler) -> None:
+    from .api import AqaraAuthError
+
+    started = time.perf_counter()
     delay = BRIDGE_START_RETRY_INITIAL_SECONDS
     attempt = 1
     while True:
@@ -296,27 +401,40 @@ async def _async_start_bridge_with_retry(entry: ConfigEntry, bridge_manager) ->
             attempt += 1
             continue
 
-        _LOGGER.info("Aqara bridge started for %s", entry.title)
+        profiler.record("bridge_startup", time.perf_counter() - started)
+        _LOGGER.info(
+            "Aqara bridge started for %s after %.0f ms",
+            entry.title,
+            (time.perf_counter() - started) * 1000,
+        )
         return
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
+    from .profiling import SETUP_MODULES, AqaraSetupProfiler, time_module_imports
+
+    profiler = AqaraSetupProfiler()
+    # Importing on the event loop would block it; the imports below then hit sys.modules.
+    profiler.record_imports(await hass.async_add_executor_job(time_module_imports, __name__, SETUP_MODULES))
     from .api import AqaraApi, AqaraAuthError
-    from .bridge_specs import (
-        A100_PRO_STATE_SPECS,
-        ACN002_STATE_SPECS,
-        G2H_PRO_STATE_SPECS,
-        G410_STATE_SPECS,
-        G4_STATE_SPECS,
-        G3_STATE_SPECS,
-        M100_STATE_SPECS,
-        M200_STATE_SPECS,
-        M3_STATE_SPECS,
-        build_active_subscriptions,
-    )
+    from .client import async_get_app_client, async_release_app_client
+    from .count_statistics import AqaraCountStatistics, async_get_statistics_importer
+    from .bridge_specs import build_active_subscriptions, build_disabled_poll_resources
+    from .device_index import AqaraDeviceIndex
+    from .journal import AqaraPushJournal
+    from .occupancy import AqaraOccupancyAnalytics
     from .push import AqaraBridgePushManager
+    from .scheduler import AqaraPollScheduler
+    from .state_store import AqaraStateStore
+    from .sweep import AqaraFleetSweeper
+
+    profiler.lap("imports")
+
+    state_store = AqaraStateStore(hass, entry.entry_id)
+    await state_store.async_load()
+    profiler.lap("state_load")
 
     session = aiohttp_client.async_get_clientsession(hass)
     api = AqaraApi(
@@ -330,6 +448,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         open_id=entry.data.get("open_id"),
         expires_at=entry.data.get("expires_at"),
     )
+    app_client = async_get_app_client(hass, session, api.server, api.app_id, entry.entry_id)
+    api.use_app_client(app_client)
+    entry.async_on_unload(partial(async_release_app_client, hass, api.server, api.app_id, entry.entry_id))
 
     try:
         if not entry.data.get(CONF_APP_ID) or not entry.data.get(CONF_APP_KEY) or not entry.data.get(CONF_KEY_ID):
@@ -341,6 +462,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 "Aqara Open API tokens missing. Reconfigure the integration with the new authorization-code flow."
             )
         await api.ensure_valid_access_token(TOKEN_REFRESH_STARTUP_MARGIN_SECONDS)
+        profiler.lap("token_validation")
         if api.export_auth() != {
             "access_token": entry.data.get("access_token"),
             "refresh_token": entry.data.get("refresh_token"),
@@ -349,32 +471,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         }:
             hass.config_entries.async_update_entry(entry, data={**entry.data, **api.export_auth()})
         devices = await api.get_devices()
+        profiler.lap("get_devices")
 
-        cameras = [device for device in devices if device.get("model") in G3_MODELS]
-        g2h_pro_cameras = [device for device in devices if device.get("model") in G2H_PRO_MODELS]
-        g410_doorbells = [device for device in devices if device.get("model") in G410_MODELS]
-        g4_doorbells = [device for device in devices if device.get("model") in G4_MODELS]
-        hubs_m3 = [device for device in devices if device.get("model") in M3_MODELS]
-        hubs_m100 = [device for device in devices if device.get("model") in M100_MODELS]
-        hubs_m200 = [device for device in devices if device.get("model") in M200_MODELS]
-        a100_pro_locks = [device for device in devices if device.get("model") in A100_PRO_MODELS]
-        acn002_locks = [device for device in devices if device.get("model") in ACN002_MODELS]
-        presence_devices = [device for device in devices if device.get("model") in PRESENCE_MODELS]
-        u200_locks = [device for device in devices if device.get("model") in U200_MODELS]
-
-        if (
-            not cameras
-            and not g2h_pro_cameras
-            and not g410_doorbells
-            and not g4_doorbells
-            and not hubs_m3
-            and not hubs_m100
-            and not hubs_m200
-            and not a100_pro_locks
-            and not acn002_locks
-            and not presence_devices
-            and not u200_locks
-        ):
+        device_index = AqaraDeviceIndex(devices)
+        if not device_index:
             raise ConfigEntryNotReady(
                 "No Aqara G2H Pro, G3, G410, G4, M3, M100, M200, A100, A100 Pro, ACN002, FP2, FP300, or U200 devices found"
             )
@@ -388,77 +488,72 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception as e:
         raise ConfigEntryNotReady(f"Aqara setup not ready: {e}") from e
 
-    camera_coordinators = _setup_device_state_coordinators(hass, api, cameras, "camera-state", G3_STATE_SPECS)
-    g2h_pro_coordinators = _setup_device_state_coordinators(
-        hass,
-        api,
-        g2h_pro_cameras,
-        "g2h-pro-state",
-        G2H_PRO_STATE_SPECS,
-    )
-    g410_coordinators = _setup_device_state_coordinators(
-        hass,
-        api,
-        g410_doorbells,
-        "g410-state",
-        G410_STATE_SPECS,
-    )
-    g4_coordinators = _setup_device_state_coordinators(
-        hass,
-        api,
-        g4_doorbells,
-        "g4-state",
-        G4_STATE_SPECS,
-    )
-    m3_coordinators = _setup_device_state_coordinators(hass, api, hubs_m3, "hub-m3-state", M3_STATE_SPECS)
-    m100_coordinators = _setup_device_state_coordinators(hass, api, hubs_m100, "hub-m100-state", M100_STATE_SPECS)
-    m200_coordinators = _setup_device_state_coordinators(hass, api, hubs_m200, "hub-m200-state", M200_STATE_SPECS)
-    a100_pro_coordinators = _setup_device_state_coordinators(
-        hass,
-        api,
-        a100_pro_locks,
-        "a100-pro-state",
-        A100_PRO_STATE_SPECS,
-    )
-    acn002_coordinators = _setup_device_state_coordinators(
-        hass,
-        api,
-        acn002_locks,
-        "acn002-state",
-        ACN002_STATE_SPECS,
-    )
-    presence_coordinators = _setup_presence_coordinators(hass, api, presence_devices)
-    u200_coordinators = _setup_u200_coordinators(hass, api, u200_locks)
-
-    bridge_url = _entry_bridge_value(entry, CONF_BRIDGE_URL, DEFAULT_BRIDGE_URL)
+    # Check before any coordinator exists, so an aborted setup leaves nothing scheduled.
+    bridge_urls = _entry_bridge_urls(entry)
     bridge_token = _entry_bridge_value(entry, CONF_BRIDGE_TOKEN)
-    if not bridge_url or not bridge_token:
+    if not bridge_urls or not bridge_token:
         raise ConfigEntryNotReady("Aqara bridge configuration missing. Update the integration options.")
 
+    scheduler = AqaraPollScheduler(hass)
+    sweeper = AqaraFleetSweeper(api)
+    for record in device_index:
+        _create_device_coordinators(hass, scheduler, sweeper, api, record)
+    fleet_coordinator = _create_resilient_coordinator(
+        hass,
+        scheduler,
+        entry.entry_id,
+        "fleet-sweep",
+        sweeper.async_sweep,
+        BRIDGE_SANITY_INTERVAL_SECONDS,
+        BRIDGE_UNAVAILABLE_AFTER_FAILURES,
+        POLL_PRIORITY_LOCK,
+    )
+    # No entity listens to the sweep itself; keep it scheduled while polling is armed.
+    entry.async_on_unload(fleet_coordinator.async_add_listener(lambda: None))
+
+    swept_coordinators = [
+        coordinator
+        for record in device_index
+        if record["profile"]["coordinator"] != "u200"
+        for coordinator in record["coordinators"].values()
+    ]
+    seeded = state_store.seed(device_index.all_coordinators())
+    if seeded:
+        _LOGGER.info("Aqara coordinators seeded from last known state: %s", seeded)
+    state_age = state_store.age_seconds()
+    if (
+        swept_coordinators
+        and all(coordinator.data is not None for coordinator in swept_coordinators)
+        and state_age is not None
+        and state_age < BRIDGE_SANITY_INTERVAL_SECONDS
+    ):
+        # Everything the sweep would fetch is recent; the bridge catch-up on first
+        # connect refreshes it instead, and the sweep runs at its polling phase.
+        scheduler.defer_startup_refresh(fleet_coordinator)
+    occupancy = AqaraOccupancyAnalytics(hass, entry.entry_id)
+    occupancy.add_devices(device_index)
+    count_statistics: AqaraCountStatistics | None = None
+    if entry.data.get(CONF_COUNT_STATISTICS, False):
+        add_statistics = async_get_statistics_importer(hass)
+        if add_statistics is None:
+            _LOGGER.warning("Aqara people count statistics need the recorder; they are not imported")
+        else:
+            count_statistics = AqaraCountStatistics(hass, add_statistics)
+            count_statistics.add_devices(device_index)
+    profiler.lap("coordinator_creation")
+
     entry_data = {
         "api": api,
-        "cameras": cameras,
-        "g2h_pro_cameras": g2h_pro_cameras,
-        "g410_doorbells": g410_doorbells,
-        "g4_doorbells": g4_doorbells,
-        "hubs_m3": hubs_m3,
-        "hubs_m100": hubs_m100,
-        "hubs_m200": hubs_m200,
-        "a100_pro_locks": a100_pro_locks,
-        "acn002_locks": acn002_locks,
-        "presence_devices": presence_devices,
-        "u200_locks": u200_locks,
-        "camera_coordinators": camera_coordinators,
-        "g2h_pro_coordinators": g2h_pro_coordinators,
-        "g410_coordinators": g410_coordinators,
-        "g4_coordinators": g4_coordinators,
-        "m3_coordinators": m3_coordinators,
-        "m100_coordinators": m100_coordinators,
-        "m200_coordinators": m200_coordinators,
-        "a100_pro_coordinators": a100_pro_coordinators,
-        "acn002_coordinators": acn002_coordinators,
-        "presence_coordinators": presence_coordinators,
-        "u200_coordinators": u200_coordinators,
+        "app_client": app_client,
+        "device_index": device_index,
+        "setup_profile": profiler,
+        "poll_scheduler": scheduler,
+        "fleet_sweeper": sweeper,
+        "fleet_coordinator": fleet_coordinator,
+        "push_journal": None,
+        "state_store": state_store,
+        "occupancy": occupancy,
+        "count_statistics": count_statistics,
         "bridge_manager": None,
         "bridge_task": None,
         "warmup_tasks": [],
@@ -470,65 +565,68 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     except Exception:
         await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        state_store.async_stop()
         hass.data[DOMAIN].pop(entry.entry_id, None)
         raise
+    profiler.lap("platform_forwarding")
 
     enabled_unique_ids = _enabled_unique_ids_for_entry(hass, entry)
-    active_subscriptions = build_active_subscriptions(
-        enabled_unique_ids,
-        cameras,
-        g2h_pro_cameras,
-        g410_doorbells,
-        g4_doorbells,
-        hubs_m3,
-        hubs_m100,
-        hubs_m200,
-        a100_pro_locks,
-        acn002_locks,
-        presence_devices,
-    )
+    active_subscriptions = build_active_subscriptions(enabled_unique_ids, device_index)
     entry_data["active_subscriptions"] = active_subscriptions
+    sweeper.set_disabled_resources(build_disabled_poll_resources(enabled_unique_ids, device_index))
+    profiler.lap("subscription_building")
+
+    journal: AqaraPushJournal | None = AqaraPushJournal(_push_journal_path(hass, entry))
+    try:
+        await hass.async_add_executor_job(journal.open)
+    except OSError as err:
+        _LOGGER.warning("Aqara push journal unavailable; continuing without it: %s", err)
+        journal = None
+    entry_data["push_journal"] = journal
 
     bridge_manager = AqaraBridgePushManager(
         hass,
         session,
         api,
-        bridge_url,
+        bridge_urls,
         bridge_token,
-        cameras,
-        g2h_pro_cameras,
-        g410_doorbells,
-        g4_doorbells,
-        hubs_m3,
-        hubs_m100,
-        hubs_m200,
-        a100_pro_locks,
-        acn002_locks,
-        presence_devices,
-        camera_coordinators,
-        g2h_pro_coordinators,
-        g410_coordinators,
-        g4_coordinators,
-        m3_coordinators,
-        m100_coordinators,
-        m200_coordinators,
-        a100_pro_coordinators,
-        acn002_coordinators,
-        presence_coordinators,
+        device_index,
         active_subscriptions,
+        poll_scheduler=scheduler,
+        active_active=bool(entry.data.get(CONF_BRIDGE_ACTIVE_ACTIVE, False)),
+        journal=journal,
+        sweeper=sweeper,
     )
 
     entry_data["bridge_manager"] = bridge_manager
+    profiler.lap("push_setup")
+    # Journaled events that predate the last save would overwrite fresher restored state.
+    await bridge_manager.async_replay_journal(state_store.saved_at if seeded else None)
+    state_store.async_watch()
+    if state_store.saved_at is not None and seeded:
+        bridge_manager.note_restored_state(state_store.saved_at)
+    profiler.lap("journal_replay")
+    entry_data["warmup_tasks"].append(
+        hass.async_create_background_task(
+            scheduler.async_start(),
+            f"{DOMAIN} staggered startup refresh",
+        )
+    )
     entry_data["bridge_task"] = hass.async_create_background_task(
-        _async_start_bridge_with_retry(entry, bridge_manager),
+        _async_start_bridge_with_retry(entry, bridge_manager, profiler),
         f"{DOMAIN} bridge startup",
     )
+    acn002_coordinators = [
+        record["coordinators"][DEVICE_STATE_GROUP]
+        for record in device_index
+        if record["profile"]["family"] == "acn002_locks"
+    ]
     if acn002_coordinators:
         entry_data["warmup_tasks"].append(
             hass.async_create_background_task(
                 _async_refresh_coordinators_after_setup(
                     "acn002-state",
-                    list(acn002_coordinators.values()),
+                    acn002_coordinators,
                 ),
                 f"{DOMAIN} ACN002 delayed refresh",
             )
@@ -540,6 +638,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         len(active_subscriptions),
         total_resources,
     )
+    profiler.log_summary(entry.title)
+
+    async def _async_update_active_subscriptions() -> None:
+        enabled_unique_ids = _enabled_unique_ids_for_entry(hass, entry)
+        subscriptions = build_active_subscriptions(enabled_unique_ids, device_index)
+        entry_data["active_subscriptions"] = subscriptions
+        sweeper.set_disabled_resources(build_disabled_poll_resources(enabled_unique_ids, device_index))
+        try:
+            await bridge_manager.async_update_subscriptions(subscriptions)
+        except AqaraAuthError as err:
+            _LOGGER.error("Aqara subscription update stopped because authentication failed: %s", err)
+        except Exception as err:
+            # Rejected subscriptions are retried by the manager; rejected unsubscriptions
+            # stay tracked and are retried with the next registry change.
+            _LOGGER.warning("Aqara subscription update was only partially applied: %s", err)
+
+    subscription_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=SUBSCRIPTION_UPDATE_COOLDOWN_SECONDS,
+        immediate=False,
+        function=_async_update_active_subscriptions,
+    )
+    entry.async_on_unload(subscription_debouncer.async_cancel)
 
     @callback
     def _handle_entity_registry_update(event) -> None:
@@ -558,11 +680,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if registry_entry is None or registry_entry.config_entry_id != entry.entry_id:
             return
 
-        change_label = "enabled" if changes["disabled_by"] is None else "disabled"
-        _LOGGER.info("Aqara entity %s was %s; scheduling integration reload", entity_id, change_label)
-        hass.config_entries.async_schedule_reload(entry.entry_id)
+        if registry_entry.disabled_by is None:
+            # Home Assistant still reloads the entry about 30 s after an enable, because only
+            # a setup run can add the entity; the diff just subscribes its resources earlier.
+            _LOGGER.info(
+                "Aqara entity %s was enabled; subscribing its resources until Home Assistant reloads the entry",
+                entity_id,
+            )
+        else:
+            _LOGGER.info("Aqara entity %s was disabled; updating bridge subscriptions and poll plan", entity_id)
+        hass.async_create_task(subscription_debouncer.async_call())
 
     entry.async_on_unload(hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _handle_entity_registry_update))
+
+    discovery_misses: dict[str, int] = {}
+
+    async def _async_discover_devices(_now) -> None:
+        await _async_discover_device_changes(hass, entry, entry_data, discovery_misses, subscription_debouncer)
+
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            _async_discover_devices,
+            timedelta(seconds=DEVICE_DISCOVERY_INTERVAL_SECONDS),
+            name=f"{DOMAIN} device discovery",
+        )
+    )
+    if count_statistics is not None:
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                count_statistics.async_flush,
+                timedelta(seconds=COUNT_STATISTICS_FLUSH_SECONDS),
+                name=f"{DOMAIN} count statistics flush",
+            )
+        )
     return True
 
 
@@ -583,8 +735,41 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     bridge_manager = None if entry_data is None else entry_data.get("bridge_manager")
     if bridge_manager is not None:
         await bridge_manager.async_stop()
+    poll_scheduler = None if entry_data is None else entry_data.get("poll_scheduler")
+    if poll_scheduler is not None:
+        poll_scheduler.async_shutdown()
+    fleet_coordinator = None if entry_data is None else entry_data.get("fleet_coordinator")
+    if fleet_coordinator is not None:
+        await fleet_coordinator.async_shutdown()
+    push_journal = None if entry_data is None else entry_data.get("push_journal")
+    if push_journal is not None:
+        await hass.async_add_executor_job(push_journal.close)
+    state_store = None if entry_data is None else entry_data.get("state_store")
+    if state_store is not None:
+        await state_store.async_unload()
+    occupancy = None if entry_data is None else entry_data.get("occupancy")
+    if occupancy is not None:
+        await occupancy.async_unload()
+    count_statistics = None if entry_data is None else entry_data.get("count_statistics")
+    if count_statistics is not None:
+        count_statistics.async_unload()
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         domain_data.pop(entry.entry_id, None)
+        device_index = None if entry_data is None else entry_data.get("device_index")
+        if device_index is not None:
+            from .device_info import forget_device_info
+
+            # A reload or re-add must not reuse names or labels cached for this entry.
+            forget_device_info({record["did"] for record in device_index})
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    from .state_store import AqaraStateStore
+
+    await AqaraStateStore(hass, entry.entry_id).async_remove()
+    journal_path = _push_journal_path(hass, entry)
+    with suppress(FileNotFoundError):
+        await hass.async_add_executor_job(os.remove, journal_path)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache
+from functools import lru_cache, partial
 import hashlib
 import json
 import logging
@@ -20,11 +20,15 @@ from .const import (
     FP2_MODEL,
     FP2_RESOURCE_IDS,
     FP2_RESOURCE_KEY_MAP,
+    FP2_ZONES_KEY,
     FP300_MODEL,
     G3_MODELS,
     OPEN_API_PATH,
+    RESOURCE_QUERY_CHUNK_RESOURCES,
     TOKEN_REFRESH_REQUEST_MARGIN_SECONDS,
 )
+from .client import AqaraAppClient
+from .fp2_zones import FP2_ZONE_SLOTS, AqaraFP2Zones
 from .u200 import (
     U200_LOCK_ENDPOINT_ID,
     U200_LOCK_FUNCTION,
@@ -35,6 +39,8 @@ from .u200 import (
 )
 _LOGGER = logging.getLogger(__name__)
 
+_SHAREABLE_INTENT_PREFIXES = ("query.", "fetch.")
+
 
 @lru_cache(maxsize=1)
 def _all_device_defs() -> tuple[dict[str, Any], ...]:
@@ -73,6 +79,35 @@ def _bridge_runtime() -> dict[str, Any]:
     }
 
 
+def chunk_subject_resources(
+    resources: list[dict[str, Any]],
+    max_resources: int,
+) -> list[list[dict[str, Any]]]:
+    """Split {subjectId, resourceIds} items into groups of at most max_resources resources.
+
+    Subjects with more resources than the limit (an FP2 with every zone
+    enabled) are spread over several groups.
+    """
+    chunks: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    current_size = 0
+    for item in resources:
+        resource_ids = list(item.get("resourceIds") or [])
+        offset = 0
+        while offset < len(resource_ids):
+            if current_size >= max_resources:
+                chunks.append(current)
+                current = []
+                current_size = 0
+            take = resource_ids[offset : offset + max_resources - current_size]
+            current.append({"subjectId": item["subjectId"], "resourceIds": take})
+            current_size += len(take)
+            offset += len(take)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 class AqaraAuthError(RuntimeError):
     """Raised when Aqara credentials are missing, expired, or rejected."""
 
@@ -112,6 +147,19 @@ class AqaraApi:
         self._open_id = open_id
         self._expires_at = float(expires_at) if expires_at else None
         self._refresh_lock = asyncio.Lock()
+        self._app_client: AqaraAppClient | None = None
+
+    @property
+    def server(self) -> str:
+        return self._server
+
+    @property
+    def app_id(self) -> str:
+        return self._appid
+
+    def use_app_client(self, app_client: AqaraAppClient | None) -> None:
+        """Send requests through a client shared with other entries of the same app."""
+        self._app_client = app_client
 
     @property
     def access_token(self) -> str | None:
@@ -291,12 +339,23 @@ class AqaraApi:
             self._area,
             self._redact_data(data),
         )
-        async with self._session.post(url, data=body, headers=self._open_headers(access_token)) as resp:
-            response_data = await self._decode_response(resp)
+        if self._app_client is not None:
+            status, response_data = await self._app_client.async_request(
+                url,
+                body,
+                partial(self._open_headers, access_token),
+                self._decode_response,
+                # Reads can be shared by identical concurrent requests of the same account.
+                dedup_key=(access_token, body) if authenticated and intent.startswith(_SHAREABLE_INTENT_PREFIXES) else None,
+            )
+        else:
+            async with self._session.post(url, data=body, headers=self._open_headers(access_token)) as resp:
+                response_data = await self._decode_response(resp)
+            status = getattr(resp, "status", "unknown")
         _LOGGER.debug(
             "Aqara Open API response: intent=%s status=%s summary=%s",
             intent,
-            getattr(resp, "status", "unknown"),
+            status,
             self._summarize_response(response_data),
         )
 
@@ -404,6 +463,56 @@ class AqaraApi:
                 return fallback
         return response
 
+    async def query_resource_values(
+        self,
+        resources: list[dict[str, Any]],
+        max_resources: int = RESOURCE_QUERY_CHUNK_RESOURCES,
+    ) -> tuple[list[dict[str, Any]], dict[str, str]]:
+        """Query resources of several subjects with as few requests as possible.
+
+        A chunk that fails is retried one subject at a time, so one offline
+        or rejected device cannot sink the others.  Returns the items and the
+        last error per subject that could not be fully queried.
+        """
+        items: list[dict[str, Any]] = []
+        failures: dict[str, str] = {}
+        for chunk in chunk_subject_resources(resources, max_resources):
+            error = await self._query_resource_chunk(chunk, items)
+            if error is None:
+                continue
+            subjects = list(dict.fromkeys(item["subjectId"] for item in chunk))
+            if len(subjects) == 1:
+                failures[subjects[0]] = error
+                continue
+            for subject_id in subjects:
+                subject_error = await self._query_resource_chunk(
+                    [item for item in chunk if item["subjectId"] == subject_id],
+                    items,
+                )
+                if subject_error is not None:
+                    failures[subject_id] = subject_error
+        _LOGGER.debug(
+            "Aqara resource values fetched: subjects=%s resources=%s returned=%s failed_subjects=%s",
+            len({item["subjectId"] for item in resources}),
+            sum(len(item.get("resourceIds") or []) for item in resources),
+            len(items),
+            len(failures),
+        )
+        return items, failures
+
+    async def _query_resource_chunk(self, chunk: list[dict[str, Any]], items: list[dict[str, Any]]) -> str | None:
+        """Query one chunk into items; return the error instead of raising it."""
+        try:
+            data = await self.res_query({"data": chunk})
+        except AqaraAuthError:
+            raise
+        except Exception as err:
+            return str(err) or type(err).__name__
+        if str(data.get("code")) != "0":
+            return f"Failed to query resource values: {data}"
+        items.extend(self._flatten_result_items(data))
+        return None
+
     async def _query_resources_individually(self, resources: list[dict[str, Any]]) -> Any | None:
         merged_items: list[dict[str, Any]] = []
         skipped: list[str] = []
@@ -600,49 +709,135 @@ class AqaraApi:
             return True
         return all(str(item.get("code", 0)) == "0" for item in items)
 
-    async def get_device_states(
+    def device_state_poll(
         self,
         did: str,
         switch_defs: Iterable[Dict[str, Any]] | None = None,
     ) -> Dict[str, Any]:
+        """Describe a device state poll: resources to query, how to map them, per-device extras."""
         if switch_defs is None:
             switch_defs = _all_device_defs()
+        switch_defs = list(switch_defs)
         standard_defs = [spec for spec in switch_defs if spec.get("api") and spec.get("queryable", True)]
         history_defs = [spec for spec in switch_defs if spec.get("history_resource")]
-        result_map: Dict[str, Any] = {spec["inApp"]: spec.get("default", 0) for spec in switch_defs}
-
-        if standard_defs:
-            api_to_spec = {spec["api"]: spec for spec in standard_defs}
-            payload = {
-                "data": [
-                    {
-                        "options": list(api_to_spec.keys()),
-                        "subjectId": did,
-                    }
-                ]
-            }
-            data = await self.res_query(payload)
-            if str(data.get("code")) != "0":
-                raise RuntimeError(f"Failed to query device states: {data}")
-            _LOGGER.debug(
-                "Aqara device states fetched: did=%s requested=%s returned=%s",
-                did,
-                list(api_to_spec.keys()),
-                [str(item.get("resourceId") or item.get("attr") or "") for item in self._flatten_result_items(data)],
-            )
+        api_to_spec = {spec["api"]: spec for spec in standard_defs}
 
-            for item in self._flatten_result_items(data):
+        def _map_items(items: Iterable[dict]) -> Dict[str, Any]:
+            result_map: Dict[str, Any] = {spec["inApp"]: spec.get("default", 0) for spec in switch_defs}
+            for item in items:
                 key = str(item.get("resourceId") or item.get("attr") or "")
-                val = self._attr_value_from_item(item)
                 spec = api_to_spec.get(key)
                 if spec:
-                    result_map[spec["inApp"]] = _bridge_runtime()["coerce_spec_value"](spec, val, apply_scale=True)
+                    result_map[spec["inApp"]] = _bridge_runtime()["coerce_spec_value"](
+                        spec,
+                        self._attr_value_from_item(item),
+                        apply_scale=True,
+                    )
+            return result_map
 
-        if history_defs:
-            result_map.update(await self._history_states(did, history_defs))
+        return {
+            "label": "device states",
+            "resource_ids": list(api_to_spec),
+            "map_items": _map_items,
+            "extra": partial(self._history_states, did, history_defs) if history_defs else None,
+            "extra_keys": [spec["inApp"] for spec in history_defs],
+            "extra_resource_ids": list(dict.fromkeys(str(spec["history_resource"]) for spec in history_defs)),
+        }
+
+    def presence_poll(self, did: str, model: str, group: str) -> Dict[str, Any]:
+        """Describe the poll behind one presence coordinator group."""
+        runtime = _bridge_runtime()
+        if model == FP2_MODEL:
+            status_specs = {
+                **runtime["FP2_GROUP_SPEC_MAPS"]["fast"],
+                **runtime["FP2_GROUP_SPEC_MAPS"]["medium"],
+                **runtime["FP2_GROUP_SPEC_MAPS"]["slow"],
+            }
+            if group == "presence":
+                return self._status_poll(
+                    runtime["FP2_PRESENCE_RESOURCE_IDS"],
+                    runtime["FP2_GROUP_SPEC_MAPS"]["presence"],
+                )
+            if group == "slow":
+                status_ids = list(dict.fromkeys(runtime["FP2_SLOW_RESOURCE_IDS"]))
+                status_id_set = set(status_ids)
+                settings_id_set = set(FP2_RESOURCE_IDS)
+
+                def _map_slow_items(items: Iterable[dict]) -> Dict[str, Any]:
+                    items = list(items)
+                    status = self._map_resource_items(
+                        [item for item in items if self._item_resource_id(item) in status_id_set],
+                        status_specs,
+                        apply_scale=False,
+                    )
+                    settings = self._map_fp2_settings_items(
+                        [item for item in items if self._item_resource_id(item) in settings_id_set]
+                    )
+                    return self._merge_states(status, settings)
+
+                return {
+                    "label": "presence status",
+                    "resource_ids": list(dict.fromkeys([*status_ids, *FP2_RESOURCE_IDS])),
+                    "map_items": _map_slow_items,
+                    "extra": None,
+                }
+            group_ids = {"fast": "FP2_FAST_RESOURCE_IDS", "medium": "FP2_MEDIUM_RESOURCE_IDS"}.get(group)
+            if group_ids is not None:
+                return {
+                    **self._status_poll(runtime[group_ids], status_specs),
+                    "map_items": partial(self._map_fp2_zone_items, resource_specs=status_specs),
+                }
+        if model == FP300_MODEL:
+            group_ids = {
+                "fast": "FP300_FAST_RESOURCE_IDS",
+                "medium": "FP300_MEDIUM_RESOURCE_IDS",
+                "slow": "FP300_SLOW_RESOURCE_IDS",
+            }.get(group)
+            if group_ids is not None:
+                return self._status_poll(runtime[group_ids], runtime["FP300_GROUP_SPEC_MAPS"][group])
+        raise RuntimeError(f"Unsupported presence model: {model}")
 
+    def _status_poll(
+        self,
+        resource_ids: Iterable[str],
+        resource_specs: dict[str, dict[str, Any]],
+    ) -> Dict[str, Any]:
+        return {
+            "label": "presence status",
+            "resource_ids": list(dict.fromkeys(resource_ids)),
+            "map_items": partial(self._map_resource_items, resource_specs=resource_specs, apply_scale=False),
+            "extra": None,
+            "extra_keys": [],
+        }
+
+    async def run_resource_poll(self, did: str, poll: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a poll described by device_state_poll or presence_poll for one device."""
+        items: list[dict] = []
+        if poll["resource_ids"]:
+            data = await self.res_query({"data": [{"options": poll["resource_ids"], "subjectId": did}]})
+            if str(data.get("code")) != "0":
+                raise RuntimeError(f"Failed to query {poll['label']}: {data}")
+            items = self._flatten_result_items(data)
+            _LOGGER.debug(
+                "Aqara %s fetched: did=%s requested=%s returned=%s",
+                poll["label"],
+                did,
+                poll["resource_ids"],
+                [self._item_resource_id(item) for item in items],
+            )
+
+        result_map = poll["map_items"](items)
+        if poll["extra"] is not None:
+            result_map.update(await poll["extra"]())
         return result_map
 
+    async def get_device_states(
+        self,
+        did: str,
+        switch_defs: Iterable[Dict[str, Any]] | None = None,
+    ) -> Dict[str, Any]:
+        return await self.run_resource_poll(did, self.device_state_poll(did, switch_defs))
+
     async def get_u200_state(self, did: str) -> dict[str, Any]:
         traits = [u200_trait_request(did, spec) for spec in U200_STATE_TRAITS]
         data = await self.query_traits(traits)
@@ -815,17 +1010,30 @@ class AqaraApi:
             merged.update(part)
         return merged
 
+    @staticmethod
+    def _item_resource_id(item: dict) -> str:
+        return str(item.get("resourceId") or item.get("attr") or "")
+
     def _map_resource_status(
         self,
         data: Any,
         resource_specs: dict[str, dict[str, Any]],
         *,
         apply_scale: bool,
+    ) -> dict[str, Any]:
+        return self._map_resource_items(self._flatten_result_items(data), resource_specs, apply_scale=apply_scale)
+
+    def _map_resource_items(
+        self,
+        items: Iterable[dict],
+        resource_specs: dict[str, dict[str, Any]],
+        *,
+        apply_scale: bool,
     ) -> dict[str, Any]:
         runtime = _bridge_runtime()
         status: dict[str, Any] = {}
-        for item in self._flatten_result_items(data):
-            resource_id = str(item.get("resourceId") or item.get("attr") or "")
+        for item in items:
+            resource_id = self._item_resource_id(item)
             spec = resource_specs.get(resource_id)
             if not spec:
                 continue
@@ -835,6 +1043,26 @@ class AqaraApi:
             status[key] = runtime["coerce_spec_value"](spec, self._attr_value_from_item(item), apply_scale=apply_scale)
         return status
 
+    def _map_fp2_zone_items(
+        self,
+        items: Iterable[dict],
+        resource_specs: dict[str, dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Map an FP2 fast or medium poll, decoding zone resources in bulk into AqaraFP2Zones."""
+        zone_values: list[tuple[str, Any]] = []
+        other_items: list[dict] = []
+        for item in items:
+            resource_id = self._item_resource_id(item)
+            if resource_id in FP2_ZONE_SLOTS:
+                zone_values.append((resource_id, self._attr_value_from_item(item)))
+            else:
+                other_items.append(item)
+        status = self._map_resource_items(other_items, resource_specs, apply_scale=False)
+        zones = AqaraFP2Zones()
+        zones.decode(zone_values)
+        status[FP2_ZONES_KEY] = zones
+        return status
+
     async def get_presence_core_state(self, did: str, model: str) -> dict[str, Any]:
         runtime = _bridge_runtime()
         if model == FP2_MODEL:
@@ -856,44 +1084,13 @@ class AqaraApi:
         raise RuntimeError(f"Unsupported presence model: {model}")
 
     async def get_presence_fast_state(self, did: str, model: str) -> dict[str, Any]:
-        runtime = _bridge_runtime()
-        if model == FP2_MODEL:
-            return await self.get_fp2_status(did, runtime["FP2_FAST_RESOURCE_IDS"])
-        if model == FP300_MODEL:
-            return await self._query_presence_status_attrs(
-                did,
-                runtime["FP300_FAST_RESOURCE_IDS"],
-                runtime["FP300_GROUP_SPEC_MAPS"]["fast"],
-            )
-        raise RuntimeError(f"Unsupported presence model: {model}")
+        return await self.run_resource_poll(did, self.presence_poll(did, model, "fast"))
 
     async def get_presence_medium_state(self, did: str, model: str) -> dict[str, Any]:
-        runtime = _bridge_runtime()
-        if model == FP2_MODEL:
-            return await self.get_fp2_status(did, runtime["FP2_MEDIUM_RESOURCE_IDS"])
-        if model == FP300_MODEL:
-            return await self._query_presence_status_attrs(
-                did,
-                runtime["FP300_MEDIUM_RESOURCE_IDS"],
-                runtime["FP300_GROUP_SPEC_MAPS"]["medium"],
-            )
-        raise RuntimeError(f"Unsupported presence model: {model}")
+        return await self.run_resource_poll(did, self.presence_poll(did, model, "medium"))
 
     async def get_presence_slow_state(self, did: str, model: str) -> dict[str, Any]:
-        runtime = _bridge_runtime()
-        if model == FP2_MODEL:
-            status, settings = await asyncio.gather(
-                self.get_fp2_status(did, runtime["FP2_SLOW_RESOURCE_IDS"]),
-                self.get_fp2_settings(did),
-            )
-            return self._merge_states(status, settings)
-        if model == FP300_MODEL:
-            return await self._query_presence_status_attrs(
-                did,
-                runtime["FP300_SLOW_RESOURCE_IDS"],
-                runtime["FP300_GROUP_SPEC_MAPS"]["slow"],
-            )
-        raise RuntimeError(f"Unsupported presence model: {model}")
+        return await self.run_resource_poll(did, self.presence_poll(did, model, "slow"))
 
     async def get_fp2_status(self, did: str, attrs: Iterable[str] | None = None) -> dict[str, Any]:
         runtime = _bridge_runtime()
@@ -916,22 +1113,19 @@ class AqaraApi:
             FP2_RESOURCE_IDS,
             [str(item.get("resourceId") or item.get("attr") or "") for item in self._flatten_result_items(data)],
         )
+        return self._map_fp2_settings_items(self._flatten_result_items(data))
+
+    def _map_fp2_settings_items(self, items: Iterable[dict]) -> dict[str, Any]:
         settings: dict[str, Any] = {}
-        for item in self._flatten_result_items(data):
-            rid = str(item.get("resourceId") or item.get("attr") or "")
-            key = FP2_RESOURCE_KEY_MAP.get(rid)
+        for item in items:
+            key = FP2_RESOURCE_KEY_MAP.get(self._item_resource_id(item))
             if not key:
                 continue
             settings[key] = self._attr_value_from_item(item)
         return settings
 
     async def get_fp2_presence(self, did: str) -> dict[str, Any]:
-        runtime = _bridge_runtime()
-        return await self._query_presence_status_attrs(
-            did,
-            runtime["FP2_PRESENCE_RESOURCE_IDS"],
-            runtime["FP2_GROUP_SPEC_MAPS"]["presence"],
-        )
+        return await self.run_resource_poll(did, self.presence_poll(did, FP2_MODEL, "presence"))
 
     async def get_fp2_full_state(self, did: str) -> dict[str, Any]:
         status, settings, presence = await asyncio.gather(
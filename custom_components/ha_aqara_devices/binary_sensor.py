@@ -1,15 +1,14 @@
 from __future__ import annotations
 
+from functools import partial
 import logging
 import time
-from typing import Any, Callable, Dict
+from typing import Any, Dict
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
     DataUpdateCoordinator,
 )
 
@@ -30,32 +29,34 @@ from .const import (
     U200_DEVICE_LABEL,
 )
 from .device_info import build_device_info
+from .entity import AqaraCoordinatorEntity
 from .fp300 import FP300_BINARY_SENSORS_DEF
 from .fp2 import FP2_BINARY_SENSORS_DEF
+from .fp2_zones import zone_reader
 from .u200 import U200_BINARY_SENSORS_DEF
+from .device_index import AqaraDeviceIndex
+from .discovery import async_listen_devices_added
+from .hold_timers import AqaraHoldTimers, async_get_hold_timers
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
-    data = hass.data[DOMAIN][entry.entry_id]
+    _add_entities(hass.data[DOMAIN][entry.entry_id], async_add_entities)
+    async_listen_devices_added(hass, entry, partial(_add_entities, async_add_entities=async_add_entities))
+
+
+def _add_entities(data: dict, async_add_entities) -> None:
     api = data["api"]
-    cameras: list[dict] = data["cameras"]
-    g410_doorbells: list[dict] = data.get("g410_doorbells", [])
-    g4_doorbells: list[dict] = data.get("g4_doorbells", [])
-    hubs_m3: list[dict] = data.get("hubs_m3", [])
-    hubs_m100: list[dict] = data.get("hubs_m100", [])
-    hubs_m200: list[dict] = data.get("hubs_m200", [])
-    presence_devices: list[dict] = data.get("presence_devices", [])
-    u200_locks: list[dict] = data.get("u200_locks", [])
-    camera_coordinators: dict[str, DataUpdateCoordinator] = data.get("camera_coordinators", {})
-    g410_coordinators: dict[str, DataUpdateCoordinator] = data.get("g410_coordinators", {})
-    g4_coordinators: dict[str, DataUpdateCoordinator] = data.get("g4_coordinators", {})
-    m3_coordinators: dict[str, DataUpdateCoordinator] = data.get("m3_coordinators", {})
-    m100_coordinators: dict[str, DataUpdateCoordinator] = data.get("m100_coordinators", {})
-    m200_coordinators: dict[str, DataUpdateCoordinator] = data.get("m200_coordinators", {})
-    presence_coordinators: dict[str, dict[str, DataUpdateCoordinator]] = data.get("presence_coordinators", {})
-    u200_coordinators: dict[str, DataUpdateCoordinator] = data.get("u200_coordinators", {})
+    device_index: AqaraDeviceIndex = data["device_index"]
+    cameras: list[dict] = device_index.devices("cameras")
+    g410_doorbells: list[dict] = device_index.devices("g410_doorbells")
+    g4_doorbells: list[dict] = device_index.devices("g4_doorbells")
+    hubs_m3: list[dict] = device_index.devices("hubs_m3")
+    hubs_m100: list[dict] = device_index.devices("hubs_m100")
+    hubs_m200: list[dict] = device_index.devices("hubs_m200")
+    presence_devices: list[dict] = device_index.devices("presence_devices")
+    u200_locks: list[dict] = device_index.devices("u200_locks")
 
     entities = []
 
@@ -63,7 +64,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = cam["did"]
         name = cam["deviceName"]
         model = cam.get("model") or G3_MODEL
-        coordinator = camera_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -84,7 +85,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = doorbell["did"]
         name = doorbell["deviceName"]
         model = doorbell["model"]
-        coordinator = g410_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -105,7 +106,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = doorbell["did"]
         name = doorbell["deviceName"]
         model = doorbell["model"]
-        coordinator = g4_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -126,7 +127,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m3_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -147,7 +148,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m100_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -168,7 +169,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m200_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -198,7 +199,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         else:
             continue
 
-        device_coordinators = presence_coordinators.get(did)
+        device_coordinators = device_index.coordinators(did)
         if not device_coordinators:
             continue
 
@@ -221,7 +222,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = lock["did"]
         name = lock["deviceName"]
         model = lock["model"]
-        coordinator = u200_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -241,7 +242,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities(entities)
 
 
-class AqaraBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class AqaraBinarySensor(AqaraCoordinatorEntity, BinarySensorEntity):
     _attr_has_entity_name = True
 
     def __init__(
@@ -271,9 +272,12 @@ class AqaraBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_unique_id = f"{did}_{spec['inApp']}"
         self._value_type = spec.get("value_type")
         self._hold_seconds = spec.get("hold_seconds", 5)
-        self._clear_listener: Callable[[], None] | None = None
+        self._hold_timers: AqaraHoldTimers | None = None
         self._last_timestamp: float | None = None
         self._event_active_until: float | None = None
+        self._state_on = self._truthy((coordinator.data or {}).get(spec["inApp"]))
+        if self._value_type == "timestamp":
+            self._last_timestamp = self._normalize_timestamp((coordinator.data or {}).get(spec["inApp"]))
 
         device_class = spec.get("device_class")
         if isinstance(device_class, BinarySensorDeviceClass):
@@ -292,6 +296,7 @@ class AqaraBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
+        self._hold_timers = async_get_hold_timers(self.hass)
         if self._value_type == "timestamp":
             self._schedule_auto_clear(self.coordinator.data or {})
         elif self._value_type == "event" and self._truthy((self.coordinator.data or {}).get(self._spec["inApp"])):
@@ -316,9 +321,11 @@ class AqaraBinarySensor(CoordinatorEntity, BinarySensorEntity):
             return False
 
     def _cancel_auto_clear(self) -> None:
-        if self._clear_listener is not None:
-            self._clear_listener()
-            self._clear_listener = None
+        if self._hold_timers is not None:
+            self._hold_timers.cancel(self)
+
+    def _is_clear_pending(self) -> bool:
+        return self._hold_timers is not None and self._hold_timers.is_pending(self)
 
     def _normalize_timestamp(self, raw: Any) -> float | None:
         if not raw:
@@ -336,73 +343,57 @@ class AqaraBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def _schedule_auto_clear(self, data: dict[str, Any]) -> None:
         raw = data.get(self._spec["inApp"])
         ts = self._normalize_timestamp(raw)
-        self._cancel_auto_clear()
         self._last_timestamp = ts
-        if ts is None:
-            return
-
-        clear_at = ts + max(self._hold_seconds, 1)
-        delay = clear_at - time.time()
-        if delay <= 0:
+        clear_at = None if ts is None else ts + max(self._hold_seconds, 1)
+        if clear_at is None or clear_at <= time.time() or self._hold_timers is None:
+            self._cancel_auto_clear()
             return
-
-        @callback
-        def _clear_state(_now) -> None:
-            self._clear_listener = None
-            self.async_write_ha_state()
-
-        self._clear_listener = async_call_later(self.hass, delay, _clear_state)
+        # Scheduling replaces any pending clear of this sensor.
+        self._hold_timers.schedule(self, clear_at, self.async_write_ha_state)
 
     def _schedule_event_clear(self) -> None:
-        self._cancel_auto_clear()
         self._event_active_until = time.time() + max(self._hold_seconds, 1)
+        if self._hold_timers is not None:
+            self._hold_timers.schedule(self, self._event_active_until, self._clear_event)
 
-        @callback
-        def _clear_state(_now) -> None:
-            self._clear_listener = None
-            self._event_active_until = None
-            self.async_write_ha_state()
-
-        self._clear_listener = async_call_later(self.hass, max(self._hold_seconds, 1), _clear_state)
+    @callback
+    def _clear_event(self) -> None:
+        self._event_active_until = None
+        self.async_write_ha_state()
 
     @callback
     def _handle_coordinator_update(self) -> None:
+        data = self.coordinator.data or {}
         if self._value_type == "timestamp":
-            data = self.coordinator.data or {}
             ts = self._normalize_timestamp(data.get(self._spec["inApp"]))
             if ts != self._last_timestamp:
                 self._schedule_auto_clear(data)
-            elif ts is not None and self._clear_listener is None and self.is_on:
+            elif ts is not None and not self._is_clear_pending() and self.is_on:
                 self._schedule_auto_clear(data)
         elif self._value_type == "event":
-            data = self.coordinator.data or {}
             if self._truthy(data.get(self._spec["inApp"])):
                 self._schedule_event_clear()
+        else:
+            self._state_on = self._truthy(data.get(self._spec["inApp"]))
         super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool:
-        data = self.coordinator.data or {}
-        raw = data.get(self._spec["inApp"])
+        # Timestamp and event states expire with time, so only those compare against now.
         if self._value_type == "timestamp":
-            if not raw:
+            ts = self._last_timestamp
+            if ts is None:
                 return False
-            try:
-                ts = float(raw)
-            except (TypeError, ValueError):
-                return False
-            if ts > 1_000_000_000_000:  # milliseconds
-                ts /= 1000.0
             now = time.time()
-            if ts <= 0 or ts > now + 5:
+            if ts > now + 5:
                 return False
             return (now - ts) <= max(self._hold_seconds, 1)
         if self._value_type == "event":
             return self._event_active_until is not None and time.time() <= self._event_active_until
-        return self._truthy(raw)
+        return self._state_on
 
 
-class AqaraFP2BinarySensor(CoordinatorEntity, BinarySensorEntity):
+class AqaraFP2BinarySensor(AqaraCoordinatorEntity, BinarySensorEntity):
     _attr_has_entity_name = True
 
     def __init__(
@@ -422,6 +413,7 @@ class AqaraFP2BinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._device_label = device_label
         self._key = spec["key"]
         self._fallback_key = spec.get("fallback_key")
+        self._zone_reader = zone_reader(spec)
         self._on_values = {str(v) for v in spec.get("on_values", set())}
         translation_key = spec.get("translation_key")
         if translation_key:
@@ -444,6 +436,7 @@ class AqaraFP2BinarySensor(CoordinatorEntity, BinarySensorEntity):
                 self._attr_device_class = None
         else:
             self._attr_device_class = None
+        self._compute_state()
 
     @property
     def device_info(self):
@@ -451,17 +444,24 @@ class AqaraFP2BinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     def _coordinator_value(self):
         data = self.coordinator.data or {}
+        if self._zone_reader is not None:
+            return self._zone_reader(data)
         if self._key in data:
             return data.get(self._key)
         if self._fallback_key and self._fallback_key in data:
             return data.get(self._fallback_key)
         return None
 
-    @property
-    def is_on(self) -> bool:
+    def _compute_state(self) -> None:
         raw = self._coordinator_value()
         if raw is None:
-            return False
-        if self._on_values:
-            return str(raw) in self._on_values
-        return str(raw).strip() not in ("0", "false", "off")
+            self._attr_is_on = False
+        elif self._on_values:
+            self._attr_is_on = str(raw) in self._on_values
+        else:
+            self._attr_is_on = str(raw).strip() not in ("0", "false", "off")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._compute_state()
+        super()._handle_coordinator_update()
@@ -13,8 +13,8 @@ from .binary_sensors import (
     M3_BINARY_SENSORS_DEF,
 )
 from .const import FP2_MODEL, FP300_MODEL
-from .fp2 import FP2_BINARY_SENSORS_DEF, FP2_SENSOR_SPECS
-from .fp300 import FP300_BINARY_SENSORS_DEF, FP300_SENSOR_SPECS
+from .fp2 import FP2_BINARY_SENSORS_DEF, FP2_OCCUPANCY_SENSORS_DEF, FP2_SENSOR_SPECS
+from .fp300 import FP300_BINARY_SENSORS_DEF, FP300_OCCUPANCY_SENSORS_DEF, FP300_SENSOR_SPECS
 from .numbers import ALL_NUMBERS_DEF, G2H_PRO_NUMBERS_DEF, G410_NUMBERS_DEF, G4_NUMBERS_DEF, M100_NUMBERS_DEF, M200_NUMBERS_DEF, M3_NUMBERS_DEF
 from .selects import FP300_SELECTS_DEF, G410_SELECTS_DEF, G4_SELECTS_DEF, M100_SELECTS_DEF, M200_SELECTS_DEF, M3_SELECTS_DEF
 from .sensors import A100_PRO_SENSORS_DEF, ACN002_SENSORS_DEF, G410_SENSORS_DEF, G4_SENSORS_DEF, M100_SENSORS_DEF, M3_SENSORS_DEF
@@ -208,6 +208,40 @@ FP300_GROUP_SPEC_MAPS = {
 FP300_SUBSCRIPTION_RESOURCE_IDS = unique_api_resource_ids(FP300_STATE_SPECS)
 
 
+_DEVICE_STATE_SPECS = [
+    *G3_STATE_SPECS,
+    *G2H_PRO_STATE_SPECS,
+    *G410_STATE_SPECS,
+    *G4_STATE_SPECS,
+    *M3_STATE_SPECS,
+    *M100_STATE_SPECS,
+    *M200_STATE_SPECS,
+    *A100_PRO_STATE_SPECS,
+    *ACN002_STATE_SPECS,
+]
+
+# Resources whose every push is a separate trigger (motion, gestures): two
+# pushes of the same value are two events and must never be merged.
+EVENT_RESOURCE_IDS = frozenset(
+    {
+        GESTURE_RESOURCE_ID,
+        *(
+            str(spec["api"])
+            for spec in _DEVICE_STATE_SPECS
+            if spec.get("api") and spec.get("value_type") == "event"
+        ),
+    }
+)
+
+# Resources whose value is a transient event rather than a state: querying them
+# after a stream outage would either fail or replay an old trigger.
+RESYNC_SKIPPED_RESOURCE_IDS = EVENT_RESOURCE_IDS | frozenset(
+    str(spec["api"])
+    for spec in _DEVICE_STATE_SPECS
+    if spec.get("api") and not spec.get("queryable", True)
+)
+
+
 def _spec_resource_id(spec: dict[str, Any]) -> str | None:
     resource_id = spec.get("api") or spec.get("history_resource")
     if not resource_id:
@@ -217,74 +251,77 @@ def _spec_resource_id(spec: dict[str, Any]) -> str | None:
 
 def _append_resource_if_enabled(
     resource_ids: dict[str, None],
-    enabled_unique_ids: set[str],
+    enabled_unique_ids: set[str] | None,
     unique_id: str,
     spec: dict[str, Any],
 ) -> None:
-    if unique_id not in enabled_unique_ids:
+    """Add the spec's resource if its entity is enabled; None counts every entity as enabled."""
+    if enabled_unique_ids is not None and unique_id not in enabled_unique_ids:
         return
     resource_id = _spec_resource_id(spec)
     if resource_id:
         resource_ids[resource_id] = None
+    for resource_id in spec.get("zone_resources", ()):
+        resource_ids[resource_id] = None
 
 
-def _collect_g3_resources(enabled_unique_ids: set[str], did: str) -> list[str]:
+def _collect_g3_resources(enabled_unique_ids: set[str] | None, did: str) -> list[str]:
     resource_ids: dict[str, None] = {}
     for spec in G3_STATE_SPECS:
         _append_resource_if_enabled(resource_ids, enabled_unique_ids, f"{did}_{spec['inApp']}", spec)
     return list(resource_ids)
 
 
-def _collect_g2h_pro_resources(enabled_unique_ids: set[str], did: str) -> list[str]:
+def _collect_g2h_pro_resources(enabled_unique_ids: set[str] | None, did: str) -> list[str]:
     resource_ids: dict[str, None] = {}
     for spec in G2H_PRO_STATE_SPECS:
         _append_resource_if_enabled(resource_ids, enabled_unique_ids, f"{did}_{spec['inApp']}", spec)
     return list(resource_ids)
 
 
-def _collect_g410_resources(enabled_unique_ids: set[str], did: str) -> list[str]:
+def _collect_g410_resources(enabled_unique_ids: set[str] | None, did: str) -> list[str]:
     resource_ids: dict[str, None] = {}
     for spec in G410_STATE_SPECS:
         _append_resource_if_enabled(resource_ids, enabled_unique_ids, f"{did}_{spec['inApp']}", spec)
     return list(resource_ids)
 
 
-def _collect_g4_resources(enabled_unique_ids: set[str], did: str) -> list[str]:
+def _collect_g4_resources(enabled_unique_ids: set[str] | None, did: str) -> list[str]:
     resource_ids: dict[str, None] = {}
     for spec in G4_STATE_SPECS:
         _append_resource_if_enabled(resource_ids, enabled_unique_ids, f"{did}_{spec['inApp']}", spec)
     return list(resource_ids)
 
 
-def _collect_m3_resources(enabled_unique_ids: set[str], did: str) -> list[str]:
+def _collect_m3_resources(enabled_unique_ids: set[str] | None, did: str) -> list[str]:
     resource_ids: dict[str, None] = {}
     for spec in M3_STATE_SPECS:
         _append_resource_if_enabled(resource_ids, enabled_unique_ids, f"{did}_{spec['inApp']}", spec)
     return list(resource_ids)
 
 
-def _collect_m100_resources(enabled_unique_ids: set[str], did: str) -> list[str]:
+def _collect_m100_resources(enabled_unique_ids: set[str] | None, did: str) -> list[str]:
     resource_ids: dict[str, None] = {}
     for spec in M100_STATE_SPECS:
         _append_resource_if_enabled(resource_ids, enabled_unique_ids, f"{did}_{spec['inApp']}", spec)
     return list(resource_ids)
 
 
-def _collect_m200_resources(enabled_unique_ids: set[str], did: str) -> list[str]:
+def _collect_m200_resources(enabled_unique_ids: set[str] | None, did: str) -> list[str]:
     resource_ids: dict[str, None] = {}
     for spec in M200_STATE_SPECS:
         _append_resource_if_enabled(resource_ids, enabled_unique_ids, f"{did}_{spec['inApp']}", spec)
     return list(resource_ids)
 
 
-def _collect_a100_pro_resources(enabled_unique_ids: set[str], did: str) -> list[str]:
+def _collect_a100_pro_resources(enabled_unique_ids: set[str] | None, did: str) -> list[str]:
     resource_ids: dict[str, None] = {}
     for spec in A100_PRO_STATE_SPECS:
         _append_resource_if_enabled(resource_ids, enabled_unique_ids, f"{did}_{spec['inApp']}", spec)
     return list(resource_ids)
 
 
-def _collect_acn002_resources(enabled_unique_ids: set[str], did: str) -> list[str]:
+def _collect_acn002_resources(enabled_unique_ids: set[str] | None, did: str) -> list[str]:
     resource_ids: dict[str, None] = {}
     for spec in ACN002_STATE_SPECS:
         _append_resource_if_enabled(resource_ids, enabled_unique_ids, f"{did}_{spec['inApp']}", spec)
@@ -292,7 +329,7 @@ def _collect_acn002_resources(enabled_unique_ids: set[str], did: str) -> list[st
 
 
 def _collect_presence_resources(
-    enabled_unique_ids: set[str],
+    enabled_unique_ids: set[str] | None,
     did: str,
     binary_specs: Iterable[dict[str, Any]],
     sensor_specs: Iterable[dict[str, Any]],
@@ -308,96 +345,81 @@ def _collect_presence_resources(
     return list(resource_ids)
 
 
-def build_active_subscriptions(
-    enabled_unique_ids: set[str],
-    cameras: list[dict[str, Any]],
-    g2h_pro_cameras: list[dict[str, Any]],
-    g410_doorbells: list[dict[str, Any]],
-    g4_doorbells: list[dict[str, Any]],
-    hubs_m3: list[dict[str, Any]],
-    hubs_m100: list[dict[str, Any]],
-    hubs_m200: list[dict[str, Any]],
-    a100_pro_locks: list[dict[str, Any]],
-    acn002_locks: list[dict[str, Any]],
-    presence_devices: list[dict[str, Any]],
-) -> list[dict[str, Any]]:
-    subscriptions: list[dict[str, Any]] = []
-
-    for camera in cameras:
-        did = str(camera["did"])
-        resource_ids = _collect_g3_resources(enabled_unique_ids, did)
-        if resource_ids:
-            subscriptions.append({"subjectId": did, "resourceIds": resource_ids})
-
-    for camera in g2h_pro_cameras:
-        did = str(camera["did"])
-        resource_ids = _collect_g2h_pro_resources(enabled_unique_ids, did)
-        if resource_ids:
-            subscriptions.append({"subjectId": did, "resourceIds": resource_ids})
+_FAMILY_RESOURCE_COLLECTORS = {
+    "cameras": _collect_g3_resources,
+    "g2h_pro_cameras": _collect_g2h_pro_resources,
+    "g410_doorbells": _collect_g410_resources,
+    "g4_doorbells": _collect_g4_resources,
+    "hubs_m3": _collect_m3_resources,
+    "hubs_m100": _collect_m100_resources,
+    "hubs_m200": _collect_m200_resources,
+    "a100_pro_locks": _collect_a100_pro_resources,
+    "acn002_locks": _collect_acn002_resources,
+}
 
-    for doorbell in g410_doorbells:
-        did = str(doorbell["did"])
-        resource_ids = _collect_g410_resources(enabled_unique_ids, did)
-        if resource_ids:
-            subscriptions.append({"subjectId": did, "resourceIds": resource_ids})
 
-    for doorbell in g4_doorbells:
-        did = str(doorbell["did"])
-        resource_ids = _collect_g4_resources(enabled_unique_ids, did)
-        if resource_ids:
-            subscriptions.append({"subjectId": did, "resourceIds": resource_ids})
-
-    for hub in hubs_m3:
-        did = str(hub["did"])
-        resource_ids = _collect_m3_resources(enabled_unique_ids, did)
-        if resource_ids:
-            subscriptions.append({"subjectId": did, "resourceIds": resource_ids})
+def _collect_device_resources(enabled_unique_ids: set[str] | None, record: dict[str, Any]) -> list[str]:
+    did = str(record["did"])
+    family = record["profile"]["family"]
+    collector = _FAMILY_RESOURCE_COLLECTORS.get(family)
+    if collector is not None:
+        return collector(enabled_unique_ids, did)
+    if family != "presence_devices":
+        return []
+
+    model = str(record["device"].get("model") or "")
+    if model == FP2_MODEL:
+        return _collect_presence_resources(
+            enabled_unique_ids,
+            did,
+            FP2_BINARY_SENSORS_DEF,
+            [*FP2_SENSOR_SPECS, *FP2_OCCUPANCY_SENSORS_DEF],
+        )
+    if model == FP300_MODEL:
+        return _collect_presence_resources(
+            enabled_unique_ids,
+            did,
+            FP300_BINARY_SENSORS_DEF,
+            [*FP300_SENSOR_SPECS, *FP300_OCCUPANCY_SENSORS_DEF],
+            FP300_SELECTS_DEF,
+        )
+    return []
 
-    for hub in hubs_m100:
-        did = str(hub["did"])
-        resource_ids = _collect_m100_resources(enabled_unique_ids, did)
-        if resource_ids:
-            subscriptions.append({"subjectId": did, "resourceIds": resource_ids})
-
-    for hub in hubs_m200:
-        did = str(hub["did"])
-        resource_ids = _collect_m200_resources(enabled_unique_ids, did)
-        if resource_ids:
-            subscriptions.append({"subjectId": did, "resourceIds": resource_ids})
-    for lock in a100_pro_locks:
-        did = str(lock["did"])
-        resource_ids = _collect_a100_pro_resources(enabled_unique_ids, did)
-        if resource_ids:
-            subscriptions.append({"subjectId": did, "resourceIds": resource_ids})
 
-    for lock in acn002_locks:
-        did = str(lock["did"])
-        resource_ids = _collect_acn002_resources(enabled_unique_ids, did)
+def build_active_subscriptions(
+    enabled_unique_ids: set[str] | None,
+    device_index: Iterable[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Return the bridge subscriptions for the records of a device index."""
+    subscriptions: list[dict[str, Any]] = []
+    for record in device_index:
+        resource_ids = _collect_device_resources(enabled_unique_ids, record)
         if resource_ids:
-            subscriptions.append({"subjectId": did, "resourceIds": resource_ids})
-
-    for presence in presence_devices:
-        did = str(presence["did"])
-        model = str(presence.get("model") or "")
-        if model == FP2_MODEL:
-            resource_ids = _collect_presence_resources(
-                enabled_unique_ids,
-                did,
-                FP2_BINARY_SENSORS_DEF,
-                FP2_SENSOR_SPECS,
-            )
-        elif model == FP300_MODEL:
-            resource_ids = _collect_presence_resources(
-                enabled_unique_ids,
-                did,
-                FP300_BINARY_SENSORS_DEF,
-                FP300_SENSOR_SPECS,
-                FP300_SELECTS_DEF,
-            )
-        else:
-            continue
+            subscriptions.append({"subjectId": str(record["did"]), "resourceIds": resource_ids})
+    return subscriptions
 
-        if resource_ids:
-            subscriptions.append({"subjectId": did, "resourceIds": resource_ids})
 
-    return subscriptions
+def build_disabled_poll_resources(
+    enabled_unique_ids: set[str],
+    device_index: Iterable[dict[str, Any]],
+) -> dict[str, frozenset[str]]:
+    """Return, per did, the resources that only back disabled entities.
+
+    Takes the same device index as ``build_active_subscriptions``.
+    Resources that no entity owns (settings read as a block, derived
+    values) are never listed, so polls keep fetching them.
+    """
+    owned = {
+        item["subjectId"]: set(item["resourceIds"])
+        for item in build_active_subscriptions(None, device_index)
+    }
+    enabled = {
+        item["subjectId"]: set(item["resourceIds"])
+        for item in build_active_subscriptions(enabled_unique_ids, device_index)
+    }
+    disabled: dict[str, frozenset[str]] = {}
+    for did, resource_ids in owned.items():
+        unused = resource_ids - enabled.get(did, set())
+        if unused:
+            disabled[did] = frozenset(unused)
+    return disabled
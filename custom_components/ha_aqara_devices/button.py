@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import partial
 import asyncio
 from homeassistant.components.button import ButtonEntity
 from homeassistant.core import HomeAssistant
@@ -7,6 +8,8 @@ from homeassistant.config_entries import ConfigEntry
 from .api import AqaraApi
 from .const import DOMAIN, G2H_PRO_DEVICE_LABEL, G410_DEVICE_LABEL, G4_DEVICE_LABEL, G3_MODEL, G3_DEVICE_LABEL
 from .device_info import build_device_info
+from .device_index import AqaraDeviceIndex
+from .discovery import async_listen_devices_added
 
 PTZ_ACTIONS: dict[str, str] = {
     "up": "up_always",
@@ -28,12 +31,17 @@ ICONS: dict[str, str] = {
 RING_ALARM_BELL = "14.1.111"
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
-    data = hass.data[DOMAIN][entry.entry_id]
+    _add_entities(hass.data[DOMAIN][entry.entry_id], async_add_entities)
+    async_listen_devices_added(hass, entry, partial(_add_entities, async_add_entities=async_add_entities))
+
+
+def _add_entities(data: dict, async_add_entities) -> None:
     api = data["api"]
-    cameras: list[dict] = data["cameras"]
-    g2h_pro_cameras: list[dict] = data.get("g2h_pro_cameras", [])
-    g410_doorbells: list[dict] = data.get("g410_doorbells", [])
-    g4_doorbells: list[dict] = data.get("g4_doorbells", [])
+    device_index: AqaraDeviceIndex = data["device_index"]
+    cameras: list[dict] = device_index.devices("cameras")
+    g2h_pro_cameras: list[dict] = device_index.devices("g2h_pro_cameras")
+    g410_doorbells: list[dict] = device_index.devices("g410_doorbells")
+    g4_doorbells: list[dict] = device_index.devices("g4_doorbells")
 
     entities: list[ButtonEntity] = []
     for cam in cameras:
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+from aiohttp import ClientResponse, ClientSession
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    APP_REQUEST_BURST,
+    APP_REQUESTS_PER_SECOND,
+    DATA_APP_CLIENTS,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AqaraAppClient:
+    """Open API transport shared by every config entry of one developer app.
+
+    Aqara meters requests per ``app_id``, so entries that sign with the same
+    app share one token-bucket rate limiter here.  Identical read requests
+    that are in flight at the same time, whichever entry sends them, are
+    answered by a single HTTP call.  Tokens, signing and auth retries stay in
+    each entry's ``AqaraApi``.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        *,
+        requests_per_second: float = APP_REQUESTS_PER_SECOND,
+        burst: int = APP_REQUEST_BURST,
+    ) -> None:
+        self._session = session
+        self._rate = requests_per_second
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._throttle_lock = asyncio.Lock()
+        self._inflight: dict[Hashable, asyncio.Task[tuple[int | None, Any]]] = {}
+        self._entries: set[str] = set()
+        self._metrics = {
+            "requests": 0,
+            "deduplicated": 0,
+            "throttled": 0,
+            "throttled_seconds": 0.0,
+        }
+
+    async def async_request(
+        self,
+        url: str,
+        body: str,
+        headers_factory: Callable[[], dict[str, str]],
+        decode: Callable[[ClientResponse], Awaitable[Any]],
+        *,
+        dedup_key: Hashable | None = None,
+    ) -> tuple[int | None, Any]:
+        """POST body to url; return (HTTP status, decoded response).
+
+        Headers are built after throttling so their timestamp and signature
+        stay fresh.  Requests sharing a dedup_key share one response object,
+        which callers must treat as read-only.  The shared call runs in its
+        own task: a cancelled requester stops waiting for it, but the call
+        still finishes for everyone else.
+        """
+        if dedup_key is None:
+            return await self._async_send(url, body, headers_factory, decode)
+
+        pending = self._inflight.get(dedup_key)
+        if pending is not None:
+            self._metrics["deduplicated"] += 1
+        else:
+            pending = asyncio.get_running_loop().create_task(
+                self._async_send(url, body, headers_factory, decode)
+            )
+            self._inflight[dedup_key] = pending
+            pending.add_done_callback(partial(self._async_forget_inflight, dedup_key))
+        return await asyncio.shield(pending)
+
+    def _async_forget_inflight(self, dedup_key: Hashable, task: asyncio.Task[tuple[int | None, Any]]) -> None:
+        if self._inflight.get(dedup_key) is task:
+            del self._inflight[dedup_key]
+        if not task.cancelled():
+            # Waiters re-raise it; mark it retrieved when every requester gave up.
+            task.exception()
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    def add_entry(self, entry_id: str) -> None:
+        self._entries.add(entry_id)
+
+    def remove_entry(self, entry_id: str) -> bool:
+        """Forget an entry; return True when no entry uses the client anymore."""
+        self._entries.discard(entry_id)
+        return not self._entries
+
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "entries": self.entry_count,
+            "requests_per_second": self._rate,
+            "burst": self._burst,
+            "in_flight": len(self._inflight),
+            **self._metrics,
+            "throttled_seconds": round(self._metrics["throttled_seconds"], 3),
+        }
+
+    async def _async_send(
+        self,
+        url: str,
+        body: str,
+        headers_factory: Callable[[], dict[str, str]],
+        decode: Callable[[ClientResponse], Awaitable[Any]],
+    ) -> tuple[int | None, Any]:
+        await self._async_throttle()
+        self._metrics["requests"] += 1
+        async with self._session.post(url, data=body, headers=headers_factory()) as resp:
+            return getattr(resp, "status", None), await decode(resp)
+
+    async def _async_throttle(self) -> None:
+        async with self._throttle_lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled_at) * self._rate)
+            self._refilled_at = now
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self._rate
+                self._metrics["throttled"] += 1
+                self._metrics["throttled_seconds"] += wait
+                # Holding the lock keeps waiting requests in arrival order.
+                await asyncio.sleep(wait)
+                self._tokens = 1.0
+                self._refilled_at = time.monotonic()
+            self._tokens -= 1
+
+
+def _app_client_key(server: str, app_id: str) -> tuple[str, str]:
+    return (server, app_id)
+
+
+def async_get_app_client(
+    hass: HomeAssistant,
+    session: ClientSession,
+    server: str,
+    app_id: str,
+    entry_id: str,
+) -> AqaraAppClient:
+    """Return the shared client for this app and region, creating it on first use."""
+    clients: dict[tuple[str, str], AqaraAppClient] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_APP_CLIENTS, {}
+    )
+    key = _app_client_key(server, app_id)
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = AqaraAppClient(session)
+    client.add_entry(entry_id)
+    if client.entry_count > 1:
+        _LOGGER.debug("Aqara app %s is shared by %s config entries", app_id, client.entry_count)
+    return client
+
+
+def async_release_app_client(hass: HomeAssistant, server: str, app_id: str, entry_id: str) -> None:
+    clients: dict[tuple[str, str], AqaraAppClient] = hass.data.get(DOMAIN, {}).get(DATA_APP_CLIENTS, {})
+    key = _app_client_key(server, app_id)
+    client = clients.get(key)
+    if client is not None and client.remove_entry(entry_id):
+        clients.pop(key, None)
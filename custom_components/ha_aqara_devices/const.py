@@ -5,12 +5,63 @@ PLATFORMS: list[str] = ["switch", "button", "binary_sensor", "number", "sensor",
 
 CONF_BRIDGE_URL = "bridge_url"
 CONF_BRIDGE_TOKEN = "bridge_token"
+CONF_BRIDGE_ACTIVE_ACTIVE = "bridge_active_active"
+CONF_COUNT_STATISTICS = "count_statistics"
 CONF_APP_ID = "app_id"
 CONF_APP_KEY = "app_key"
 CONF_KEY_ID = "key_id"
 DEFAULT_BRIDGE_URL = "http://aqara-rocketmq-bridge:8080"
 BRIDGE_SANITY_INTERVAL_SECONDS = 300
 BRIDGE_UNAVAILABLE_AFTER_FAILURES = 3
+BRIDGE_SUBSCRIBE_CHUNK_RESOURCES = 100
+BRIDGE_SUBSCRIBE_CONCURRENCY = 4
+BRIDGE_SUBSCRIBE_ATTEMPTS = 3
+BRIDGE_SUBSCRIBE_RETRY_SECONDS = 300
+BRIDGE_POLLING_FALLBACK_DELAY_SECONDS = 60
+BRIDGE_CATCH_UP_ATTEMPTS = 3
+BRIDGE_HEALTH_TIMEOUT_SECONDS = 5
+BRIDGE_STABLE_STREAM_SECONDS = 30
+BRIDGE_EVENT_DEDUP_WINDOW = 2048
+BRIDGE_READ_IDLE_TIMEOUT_SECONDS = 90
+BRIDGE_WATCHDOG_TICK_SECONDS = 5
+BRIDGE_HEALTH_RECHECK_SECONDS = 60
+BRIDGE_HEALTH_RECHECK_FAILURES = 2
+BRIDGE_INGEST_QUEUE_EVENTS = 1000
+SSE_EXECUTOR_DECODE_BYTES = 64 * 1024
+PUSH_JOURNAL_SLOTS = 4096
+PUSH_JOURNAL_SLOT_BYTES = 256
+PUSH_JOURNAL_DIAGNOSTICS_ENTRIES = 200
+DEVICE_LIVENESS_TICK_SECONDS = 60
+DEVICE_LIVENESS_EWMA_ALPHA = 0.2
+DEVICE_LIVENESS_FACTOR = 4
+DEVICE_LIVENESS_MIN_SAMPLES = 5
+DEVICE_LIVENESS_MIN_QUIET_SECONDS = 300
+DEVICE_LIVENESS_MAX_SILENCE_SECONDS = 3600
+STATE_STORE_VERSION = 1
+ATTR_RESTORED_STATE = "restored_state"
+DEVICE_DISCOVERY_INTERVAL_SECONDS = 3600
+DEVICE_DISCOVERY_REMOVE_AFTER_MISSES = 2
+STATE_STORE_SAVE_DELAY_SECONDS = 30
+RESOURCE_QUERY_CHUNK_RESOURCES = 100
+APP_REQUESTS_PER_SECOND = 10
+APP_REQUEST_BURST = 20
+DATA_APP_CLIENTS = "app_clients"
+DATA_HOLD_TIMERS = "hold_timers"
+HOLD_TIMER_TICK_SECONDS = 0.5
+OCCUPANCY_BUCKET_SECONDS = 900
+OCCUPANCY_WINDOW_BUCKETS = 96
+OCCUPANCY_UPDATE_SECONDS = 300
+# Upper edges of the dwell-time bins, in seconds; the last bin is open-ended.
+OCCUPANCY_DWELL_BIN_EDGES = (60, 300, 900, 3600, 14400)
+COUNT_STATISTICS_PERIOD_SECONDS = 3600
+COUNT_STATISTICS_FLUSH_SECONDS = 300
+POLL_MAX_CONCURRENCY = 4
+POLL_BACKOFF_MAX_SECONDS = 3600
+POLL_BACKOFF_JITTER = 0.2
+POLL_PRIORITY_LOCK = 0
+POLL_PRIORITY_PRESENCE = 1
+POLL_PRIORITY_CAMERA = 2
+POLL_PRIORITY_SETTINGS = 3
 
 OPEN_API_PATH = "/v3.0/open/api"
 AQARA_MQ_SERVER = "3rd-subscription.aqara.cn:9876"
@@ -50,6 +101,12 @@ ACN002_MODELS = {ACN002_MODEL}
 G4_MODELS = {G4_MODEL, "lumi.camera.acn005"}
 PRESENCE_MODELS = {FP2_MODEL, FP300_MODEL}
 U200_MODELS = {U200_MODEL}
+# Coordinator group of the models that keep all their state in one coordinator.
+DEVICE_STATE_GROUP = "state"
+PRESENCE_COORDINATOR_GROUPS = {
+    FP2_MODEL: ("fast", "presence", "medium", "slow"),
+    FP300_MODEL: ("fast", "medium", "slow"),
+}
 
 G3_DEVICE_LABEL = "Aqara G3"
 G2H_PRO_DEVICE_LABEL = "Aqara Camera Hub G2H Pro"
@@ -117,6 +174,8 @@ FP2_SLOW_STATUS_ATTRS: list[str] = [
 
 FP2_ZONE_COUNT = 30
 FP2_MINUTE_ZONE_COUNT = 7
+# Coordinator data key holding the AqaraFP2Zones of an FP2 poll group.
+FP2_ZONES_KEY = "zones"
 
 FP2_GLOBAL_COUNT_ATTRS: list[str] = [
     "13.120.85",
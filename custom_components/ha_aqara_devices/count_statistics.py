@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from array import array
+from functools import partial
+import logging
+import math
+import time
+from typing import Any, Callable, Iterable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import COUNT_STATISTICS_PERIOD_SECONDS, DOMAIN, FP2_MODEL
+from .fp2 import FP2_COUNT_SENSORS_DEF
+from .fp2_zones import zone_reader
+
+_LOGGER = logging.getLogger(__name__)
+
+# Model -> (poll group, specs of the count sensors whose values are aggregated).
+COUNT_STATISTIC_SOURCES: dict[str, tuple[str, list[dict[str, Any]]]] = {
+    FP2_MODEL: ("medium", FP2_COUNT_SENSORS_DEF),
+}
+
+
+def async_get_statistics_importer(hass: HomeAssistant) -> Callable[..., None] | None:
+    """Return the recorder's external statistics importer, or None when there is no recorder."""
+    if "recorder" not in hass.config.components:
+        return None
+    try:
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+    except ImportError:
+        return None
+    return async_add_external_statistics
+
+
+def _value_reader(spec: dict[str, Any]) -> Callable[[dict[str, Any]], float | None]:
+    reader = zone_reader(spec)
+    if reader is not None:
+        return reader
+    key = spec["key"]
+
+    def _read(data: dict[str, Any]) -> float | None:
+        try:
+            return float(data[key])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    return _read
+
+
+class AqaraCountAggregator:
+    """Time-weighted mean, min and max of a device's count series per period.
+
+    Values are sampled on every coordinator update and weighted by how long
+    they held, like the recorder's own statistics.  Running sums live in
+    arrays indexed by series; closed periods wait in ``take_pending`` until
+    they are imported.
+    """
+
+    def __init__(
+        self,
+        specs: list[dict[str, Any]],
+        now: float,
+        *,
+        period_seconds: int = COUNT_STATISTICS_PERIOD_SECONDS,
+    ) -> None:
+        count = len(specs)
+        self._readers = [_value_reader(spec) for spec in specs]
+        self._period_seconds = period_seconds
+        self._period_start = now - now % period_seconds
+        self._last = array("d", [math.nan]) * count
+        self._last_time = array("d", [now]) * count
+        self._weighted = array("d", [0.0]) * count
+        self._covered = array("d", [0.0]) * count
+        self._min = array("d", [math.inf]) * count
+        self._max = array("d", [-math.inf]) * count
+        self._pending: list[list[dict[str, Any]]] = [[] for _ in range(count)]
+
+    def observe(self, data: dict[str, Any], now: float) -> None:
+        self.advance(now)
+        for index, read in enumerate(self._readers):
+            value = read(data)
+            self._accrue(index, now)
+            if value is None or not math.isfinite(value):
+                self._last[index] = math.nan
+                continue
+            self._last[index] = value
+            if value < self._min[index]:
+                self._min[index] = value
+            if value > self._max[index]:
+                self._max[index] = value
+
+    def advance(self, now: float) -> None:
+        """Close every period that ended by now."""
+        while now >= self._period_start + self._period_seconds:
+            end = self._period_start + self._period_seconds
+            start = dt_util.utc_from_timestamp(self._period_start)
+            for index, last in enumerate(self._last):
+                self._accrue(index, end)
+                if self._covered[index] > 0:
+                    self._pending[index].append(
+                        {
+                            "start": start,
+                            "mean": self._weighted[index] / self._covered[index],
+                            "min": self._min[index],
+                            "max": self._max[index],
+                        }
+                    )
+                # The value still held carries into the next period.
+                known = not math.isnan(last)
+                self._min[index] = last if known else math.inf
+                self._max[index] = last if known else -math.inf
+                self._weighted[index] = 0.0
+                self._covered[index] = 0.0
+            self._period_start = end
+
+    def take_pending(self) -> list[tuple[int, list[dict[str, Any]]]]:
+        """Return and forget the closed periods, by series index."""
+        pending = [(index, statistics) for index, statistics in enumerate(self._pending) if statistics]
+        for index, _ in pending:
+            self._pending[index] = []
+        return pending
+
+    def _accrue(self, index: int, until: float) -> None:
+        last = self._last[index]
+        elapsed = until - self._last_time[index]
+        if elapsed > 0 and not math.isnan(last):
+            self._weighted[index] += last * elapsed
+            self._covered[index] += elapsed
+        self._last_time[index] = max(until, self._last_time[index])
+
+
+class AqaraCountStatistics:
+    """Feed FP2 people counts into long-term statistics without state writes.
+
+    Each tracked device's count coordinator feeds an AqaraCountAggregator
+    on every update, pushed or polled.  ``async_flush`` imports the closed
+    hours of every series as external statistics, one recorder job per
+    series, so the per-zone count sensors can stay disabled.
+    """
+
+    def __init__(self, hass: HomeAssistant, add_statistics: Callable[..., None]) -> None:
+        self._hass = hass
+        self._add_statistics = add_statistics
+        self._devices: dict[str, dict[str, Any]] = {}
+        self._metrics = {"flushes": 0, "imported": 0, "failed": 0}
+
+    @callback
+    def add_devices(self, records: Iterable[dict[str, Any]]) -> None:
+        """Start aggregating the supported devices of these device index records."""
+        now = time.time()
+        for record in records:
+            source = COUNT_STATISTIC_SOURCES.get(str(record["device"].get("model") or ""))
+            if source is None:
+                continue
+            group, specs = source
+            coordinator = record["coordinators"].get(group)
+            if coordinator is None:
+                continue
+            did = record["did"]
+            device_name = record["device"].get("deviceName") or did
+            self.remove_devices((did,))
+            self._devices[did] = {
+                "aggregator": AqaraCountAggregator(specs, now),
+                "metadata": [
+                    {
+                        "has_mean": True,
+                        "has_sum": False,
+                        "name": f"{device_name} {spec['name']}",
+                        "source": DOMAIN,
+                        "statistic_id": f"{DOMAIN}:{slugify(did)}_{spec['key']}",
+                        "unit_of_measurement": None,
+                    }
+                    for spec in specs
+                ],
+                "unique_ids": {f"{did}_fp2_sensor_{spec['key']}" for spec in specs},
+                "unsub": coordinator.async_add_listener(partial(self._async_observe, did, coordinator)),
+            }
+
+    @callback
+    def remove_devices(self, dids: Iterable[str]) -> None:
+        for did in dids:
+            device = self._devices.pop(did, None)
+            if device is not None:
+                device["unsub"]()
+
+    def unique_ids(self) -> set[str]:
+        """Return the sensors whose resources have to stay polled and subscribed."""
+        return {unique_id for device in self._devices.values() for unique_id in device["unique_ids"]}
+
+    @callback
+    def _async_observe(self, did: str, coordinator: DataUpdateCoordinator) -> None:
+        device = self._devices.get(did)
+        if device is not None and isinstance(coordinator.data, dict):
+            device["aggregator"].observe(coordinator.data, time.time())
+
+    @callback
+    def async_flush(self, _now: Any = None) -> None:
+        """Import every hour closed since the last flush."""
+        now = time.time()
+        self._metrics["flushes"] += 1
+        for did, device in self._devices.items():
+            aggregator: AqaraCountAggregator = device["aggregator"]
+            aggregator.advance(now)
+            for index, statistics in aggregator.take_pending():
+                try:
+                    self._add_statistics(self._hass, device["metadata"][index], statistics)
+                except HomeAssistantError as err:
+                    self._metrics["failed"] += len(statistics)
+                    _LOGGER.warning(
+                        "Aqara count statistics for %s rejected by the recorder: %s",
+                        device["metadata"][index]["statistic_id"],
+                        err,
+                    )
+                    continue
+                self._metrics["imported"] += len(statistics)
+
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "devices": len(self._devices),
+            "series": sum(len(device["metadata"]) for device in self._devices.values()),
+            **self._metrics,
+        }
+
+    @callback
+    def async_unload(self) -> None:
+        self.async_flush()
+        self.remove_devices(list(self._devices))
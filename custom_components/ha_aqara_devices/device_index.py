@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .bridge_specs import (
+    A100_PRO_RESOURCE_SPEC_MAP,
+    A100_PRO_STATE_SPECS,
+    ACN002_RESOURCE_SPEC_MAP,
+    ACN002_STATE_SPECS,
+    FP2_GROUP_SPEC_MAPS,
+    FP300_GROUP_SPEC_MAPS,
+    G2H_PRO_RESOURCE_SPEC_MAP,
+    G2H_PRO_STATE_SPECS,
+    G3_RESOURCE_SPEC_MAP,
+    G3_STATE_SPECS,
+    G410_RESOURCE_SPEC_MAP,
+    G410_STATE_SPECS,
+    G4_RESOURCE_SPEC_MAP,
+    G4_STATE_SPECS,
+    M100_RESOURCE_SPEC_MAP,
+    M100_STATE_SPECS,
+    M200_RESOURCE_SPEC_MAP,
+    M200_STATE_SPECS,
+    M3_RESOURCE_SPEC_MAP,
+    M3_STATE_SPECS,
+)
+from .const import (
+    A100_DEVICE_LABEL,
+    A100_MODEL,
+    A100_PRO_DEVICE_LABEL,
+    A100_PRO_MODELS,
+    ACN002_DEVICE_LABEL,
+    ACN002_MODELS,
+    DEVICE_STATE_GROUP,
+    FP2_DEVICE_LABEL,
+    FP2_MODEL,
+    FP300_DEVICE_LABEL,
+    FP300_MODEL,
+    G2H_PRO_DEVICE_LABEL,
+    G2H_PRO_MODELS,
+    G3_DEVICE_LABEL,
+    G3_MODELS,
+    G410_DEVICE_LABEL,
+    G410_MODELS,
+    G4_DEVICE_LABEL,
+    G4_MODELS,
+    M100_DEVICE_LABEL,
+    M100_MODELS,
+    M200_DEVICE_LABEL,
+    M200_MODELS,
+    M3_DEVICE_LABEL,
+    M3_MODELS,
+    POLL_PRIORITY_CAMERA,
+    POLL_PRIORITY_LOCK,
+    POLL_PRIORITY_PRESENCE,
+    POLL_PRIORITY_SETTINGS,
+    PRESENCE_COORDINATOR_GROUPS,
+    U200_DEVICE_LABEL,
+    U200_MODELS,
+)
+from .fp2_zones import FP2_ZONE_SLOTS
+
+# Device families in the order setup and the platforms walk them.
+DEVICE_FAMILIES = (
+    "cameras",
+    "g2h_pro_cameras",
+    "g410_doorbells",
+    "g4_doorbells",
+    "hubs_m3",
+    "hubs_m100",
+    "hubs_m200",
+    "a100_pro_locks",
+    "acn002_locks",
+    "presence_devices",
+    "u200_locks",
+)
+
+
+def _device_state_profile(
+    family: str,
+    label: str,
+    coordinator_label: str,
+    state_specs: list[dict[str, Any]],
+    resource_spec_map: dict[str, dict[str, Any]],
+    poll_priority: int,
+) -> dict[str, Any]:
+    return {
+        "family": family,
+        "label": label,
+        "coordinator": "device_state",
+        "coordinator_label": coordinator_label,
+        "state_specs": state_specs,
+        "resource_spec_map": resource_spec_map,
+        "poll_groups": (DEVICE_STATE_GROUP,),
+        "poll_priorities": {DEVICE_STATE_GROUP: poll_priority},
+    }
+
+
+def _presence_profile(model: str, label: str, group_spec_maps: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "family": "presence_devices",
+        "label": label,
+        "coordinator": "presence",
+        "group_spec_maps": group_spec_maps,
+        "poll_groups": PRESENCE_COORDINATOR_GROUPS[model],
+        # Slow groups carry settings rather than presence.
+        "poll_priorities": {
+            group: POLL_PRIORITY_SETTINGS if group == "slow" else POLL_PRIORITY_PRESENCE
+            for group in PRESENCE_COORDINATOR_GROUPS[model]
+        },
+    }
+
+
+def _build_model_profiles() -> dict[str, dict[str, Any]]:
+    families: list[tuple[Iterable[str], dict[str, Any]]] = [
+        (
+            G3_MODELS,
+            _device_state_profile(
+                "cameras",
+                G3_DEVICE_LABEL,
+                "camera-state",
+                G3_STATE_SPECS,
+                G3_RESOURCE_SPEC_MAP,
+                POLL_PRIORITY_CAMERA,
+            ),
+        ),
+        (
+            G2H_PRO_MODELS,
+            _device_state_profile(
+                "g2h_pro_cameras",
+                G2H_PRO_DEVICE_LABEL,
+                "g2h-pro-state",
+                G2H_PRO_STATE_SPECS,
+                G2H_PRO_RESOURCE_SPEC_MAP,
+                POLL_PRIORITY_CAMERA,
+            ),
+        ),
+        (
+            G410_MODELS,
+            _device_state_profile(
+                "g410_doorbells",
+                G410_DEVICE_LABEL,
+                "g410-state",
+                G410_STATE_SPECS,
+                G410_RESOURCE_SPEC_MAP,
+                POLL_PRIORITY_CAMERA,
+            ),
+        ),
+        (
+            G4_MODELS,
+            _device_state_profile(
+                "g4_doorbells",
+                G4_DEVICE_LABEL,
+                "g4-state",
+                G4_STATE_SPECS,
+                G4_RESOURCE_SPEC_MAP,
+                POLL_PRIORITY_CAMERA,
+            ),
+        ),
+        (
+            M3_MODELS,
+            _device_state_profile(
+                "hubs_m3",
+                M3_DEVICE_LABEL,
+                "hub-m3-state",
+                M3_STATE_SPECS,
+                M3_RESOURCE_SPEC_MAP,
+                POLL_PRIORITY_SETTINGS,
+            ),
+        ),
+        (
+            M100_MODELS,
+            _device_state_profile(
+                "hubs_m100",
+                M100_DEVICE_LABEL,
+                "hub-m100-state",
+                M100_STATE_SPECS,
+                M100_RESOURCE_SPEC_MAP,
+                POLL_PRIORITY_SETTINGS,
+            ),
+        ),
+        (
+            M200_MODELS,
+            _device_state_profile(
+                "hubs_m200",
+                M200_DEVICE_LABEL,
+                "hub-m200-state",
+                M200_STATE_SPECS,
+                M200_RESOURCE_SPEC_MAP,
+                POLL_PRIORITY_SETTINGS,
+            ),
+        ),
+        (
+            A100_PRO_MODELS,
+            _device_state_profile(
+                "a100_pro_locks",
+                A100_PRO_DEVICE_LABEL,
+                "a100-pro-state",
+                A100_PRO_STATE_SPECS,
+                A100_PRO_RESOURCE_SPEC_MAP,
+                POLL_PRIORITY_LOCK,
+            ),
+        ),
+        (
+            ACN002_MODELS,
+            _device_state_profile(
+                "acn002_locks",
+                ACN002_DEVICE_LABEL,
+                "acn002-state",
+                ACN002_STATE_SPECS,
+                ACN002_RESOURCE_SPEC_MAP,
+                POLL_PRIORITY_LOCK,
+            ),
+        ),
+        (
+            U200_MODELS,
+            {
+                "family": "u200_locks",
+                "label": U200_DEVICE_LABEL,
+                "coordinator": "u200",
+                "coordinator_label": "u200-lock-state",
+                "poll_groups": (DEVICE_STATE_GROUP,),
+                "poll_priorities": {DEVICE_STATE_GROUP: POLL_PRIORITY_LOCK},
+            },
+        ),
+    ]
+    profiles = {model: profile for models, profile in families for model in models}
+    profiles[A100_MODEL] = {**profiles[A100_MODEL], "label": A100_DEVICE_LABEL}
+    profiles[FP2_MODEL] = {
+        **_presence_profile(FP2_MODEL, FP2_DEVICE_LABEL, FP2_GROUP_SPEC_MAPS),
+        "zone_slots": FP2_ZONE_SLOTS,
+    }
+    profiles[FP300_MODEL] = _presence_profile(FP300_MODEL, FP300_DEVICE_LABEL, FP300_GROUP_SPEC_MAPS)
+    return profiles
+
+
+# Everything the integration needs to know about a supported model, by model id.
+MODEL_PROFILES: dict[str, dict[str, Any]] = _build_model_profiles()
+
+
+class AqaraDeviceIndex:
+    """The devices of one config entry, keyed by did.
+
+    Each device is classified once, when it is added, and its record holds
+    the device dict, the model profile and the coordinators by poll group.
+    Push routing and entity setup look devices up here instead of scanning
+    one list per model family.  Records stay in insertion order.
+    """
+
+    def __init__(self, devices: Iterable[dict[str, Any]] = ()) -> None:
+        self._records: dict[str, dict[str, Any]] = {}
+        self._families: dict[str, dict[str, dict[str, Any]]] = {family: {} for family in DEVICE_FAMILIES}
+        for device in devices:
+            self.add(device)
+
+    def add(self, device: dict[str, Any]) -> dict[str, Any] | None:
+        """Index a device; return its record, or None for unsupported models."""
+        profile = MODEL_PROFILES.get(str(device.get("model") or ""))
+        if profile is None:
+            return None
+        self.remove(device["did"])
+        record = {"did": device["did"], "device": device, "profile": profile, "coordinators": {}}
+        self._records[device["did"]] = record
+        self._families[profile["family"]][device["did"]] = record
+        return record
+
+    def remove(self, did: str) -> dict[str, Any] | None:
+        record = self._records.pop(did, None)
+        if record is not None:
+            self._families[record["profile"]["family"]].pop(did, None)
+        return record
+
+    def subset(self, dids: Iterable[str]) -> AqaraDeviceIndex:
+        """Return an index sharing the records of the given devices."""
+        index = AqaraDeviceIndex()
+        wanted = set(dids)
+        for did, record in self._records.items():
+            if did in wanted:
+                index._records[did] = record
+                index._families[record["profile"]["family"]][did] = record
+        return index
+
+    def __contains__(self, did: object) -> bool:
+        return did in self._records
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self._records.values())
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, did: str) -> dict[str, Any] | None:
+        return self._records.get(did)
+
+    def profile(self, did: str) -> dict[str, Any] | None:
+        record = self._records.get(did)
+        return None if record is None else record["profile"]
+
+    def devices(self, family: str) -> list[dict[str, Any]]:
+        return [record["device"] for record in self._families[family].values()]
+
+    def coordinator(self, did: str, group: str = DEVICE_STATE_GROUP) -> DataUpdateCoordinator | None:
+        record = self._records.get(did)
+        return None if record is None else record["coordinators"].get(group)
+
+    def coordinators(self, did: str) -> dict[str, DataUpdateCoordinator]:
+        """Return the coordinators of a device by poll group."""
+        record = self._records.get(did)
+        return {} if record is None else record["coordinators"]
+
+    def all_coordinators(self) -> list[DataUpdateCoordinator]:
+        return [
+            coordinator
+            for record in self._records.values()
+            for coordinator in record["coordinators"].values()
+        ]
+
+    def counts(self) -> dict[str, int]:
+        return {family: len(records) for family, records in self._families.items()}
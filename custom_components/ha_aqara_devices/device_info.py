@@ -4,12 +4,33 @@ from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN
 
+# One DeviceInfo per (did, model, label), with the device name it was built for.
+# Entries drop their devices on unload and when discovery removes them.
+_DEVICE_INFO_CACHE: dict[tuple[str, str, str], tuple[str, DeviceInfo]] = {}
+
 
 def build_device_info(did: str, device_name: str, model: str, label: str) -> DeviceInfo:
-    return {
+    """Return the shared DeviceInfo of a device; callers must not modify it.
+
+    Every entity of a device gets the same object.  It is rebuilt when the
+    device name changes.
+    """
+    key = (did, model, label)
+    cached = _DEVICE_INFO_CACHE.get(key)
+    if cached is not None and cached[0] == device_name:
+        return cached[1]
+    device_info: DeviceInfo = {
         "identifiers": {(DOMAIN, did)},
         "manufacturer": "Aqara",
         "model": model,
         "name": f"{label} ({device_name})",
         "model_id": did,
     }
+    _DEVICE_INFO_CACHE[key] = (device_name, device_info)
+    return device_info
+
+
+def forget_device_info(dids: set[str]) -> None:
+    """Drop the cached DeviceInfo of devices that were removed or unloaded."""
+    for key in [key for key in _DEVICE_INFO_CACHE if key[0] in dids]:
+        del _DEVICE_INFO_CACHE[key]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_APP_ID,
+    CONF_APP_KEY,
+    CONF_BRIDGE_TOKEN,
+    CONF_KEY_ID,
+    DATA_HOLD_TIMERS,
+    DOMAIN,
+    PUSH_JOURNAL_DIAGNOSTICS_ENTRIES,
+)
+
+TO_REDACT = {
+    "account",
+    "access_token",
+    "refresh_token",
+    "open_id",
+    CONF_APP_ID,
+    CONF_APP_KEY,
+    CONF_KEY_ID,
+    CONF_BRIDGE_TOKEN,
+}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id) or {}
+    bridge_manager = entry_data.get("bridge_manager")
+    sweeper = entry_data.get("fleet_sweeper")
+    journal = entry_data.get("push_journal")
+    state_store = entry_data.get("state_store")
+    setup_profile = entry_data.get("setup_profile")
+    app_client = entry_data.get("app_client")
+    poll_scheduler = entry_data.get("poll_scheduler")
+    device_index = entry_data.get("device_index")
+    occupancy = entry_data.get("occupancy")
+    count_statistics = entry_data.get("count_statistics")
+    hold_timers = hass.data.get(DOMAIN, {}).get(DATA_HOLD_TIMERS)
+
+    journal_info: dict[str, Any] | None = None
+    if journal is not None:
+        entries = await hass.async_add_executor_job(journal.read_entries)
+        journal_info = {
+            "path": journal.path,
+            "size_bytes": journal.size_bytes,
+            "entries": len(entries),
+            "dropped_oversized": journal.dropped,
+            "recent": entries[-PUSH_JOURNAL_DIAGNOSTICS_ENTRIES:],
+        }
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "options": async_redact_data(dict(entry.options), TO_REDACT),
+        "devices": None if device_index is None else device_index.counts(),
+        "occupancy": None if occupancy is None else occupancy.diagnostics(),
+        "count_statistics": None if count_statistics is None else count_statistics.diagnostics(),
+        "app_client": None if app_client is None else app_client.diagnostics(),
+        "bridge": None if bridge_manager is None else bridge_manager.diagnostics(),
+        "polling": None if poll_scheduler is None else poll_scheduler.diagnostics(),
+        "hold_timers": None if hold_timers is None else hold_timers.diagnostics(),
+        "fleet_sweep": None if sweeper is None else sweeper.diagnostics(),
+        "push_journal": journal_info,
+        "state_store": None if state_store is None else state_store.diagnostics(),
+        "setup_profile": None if setup_profile is None else setup_profile.as_dict(),
+    }
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN
+from .device_index import MODEL_PROFILES, AqaraDeviceIndex
+
+
+def signal_devices_added(entry_id: str) -> str:
+    return f"{DOMAIN}_{entry_id}_devices_added"
+
+
+def diff_devices(
+    device_index: AqaraDeviceIndex,
+    discovered: Iterable[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], set[str]]:
+    """Return the supported devices missing from the index and the indexed dids not discovered."""
+    supported = [device for device in discovered if str(device.get("model") or "") in MODEL_PROFILES]
+    discovered_dids = {device["did"] for device in supported}
+    added = [device for device in supported if device["did"] not in device_index]
+    removed = {record["did"] for record in device_index if record["did"] not in discovered_dids}
+    return added, removed
+
+
+def filtered_entry_data(entry_data: dict[str, Any], dids: set[str]) -> dict[str, Any]:
+    """Return entry data whose device index only holds the given devices."""
+    return {**entry_data, "device_index": entry_data["device_index"].subset(dids)}
+
+
+@callback
+def async_listen_devices_added(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    add_entities: Callable[[dict[str, Any]], None],
+) -> None:
+    """Call add_entities with entry data limited to devices found after setup."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def _async_devices_added(dids: set[str]) -> None:
+        add_entities(filtered_entry_data(entry_data, dids))
+
+    entry.async_on_unload(async_dispatcher_connect(hass, signal_devices_added(entry.entry_id), _async_devices_added))
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTR_RESTORED_STATE, DOMAIN
+
+
+class AqaraCoordinatorEntity(CoordinatorEntity):
+    """Coordinator entity that flags state restored from the last run.
+
+    While the coordinator still holds the data the state store seeded it
+    with, the entity reports ``restored_state: true``.  The attribute goes
+    away with the first poll or push after startup.  It is not called
+    ``restored`` because Home Assistant uses that name for entities whose
+    integration no longer provides them.
+    """
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        attributes = super().extra_state_attributes
+        if self.hass is None or self.platform is None or self.platform.config_entry is None:
+            return attributes
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.platform.config_entry.entry_id)
+        state_store = None if entry_data is None else entry_data.get("state_store")
+        if state_store is None or not state_store.is_stale(self.coordinator):
+            return attributes
+        return {**(attributes or {}), ATTR_RESTORED_STATE: True}
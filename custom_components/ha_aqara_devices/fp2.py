@@ -11,6 +11,8 @@ from .const import (
     FP2_SETTING_VALUE_MAPS,
     FP2_ZONE_COUNT,
     FP2_MINUTE_ZONE_COUNT,
+    FP2_ZONE_PRESENCE_ATTRS,
+    FP2_ZONE_STATISTICS_ATTRS,
 )
 
 
@@ -26,6 +28,7 @@ def _zone_presence_binary_sensor(index: int) -> dict:
         "translation_placeholders": {"index": str(index)},
         "key": f"detection_area{index}",
         "api": f"3.{index}.85",
+        "zone": ("presence", index - 1),
         "poll_group": "fast",
         "device_class": BinarySensorDeviceClass.OCCUPANCY,
         "icon": "mdi:floor-plan",
@@ -67,6 +70,7 @@ def _zone_statistics_sensor(index: int) -> dict:
         "translation_placeholders": {"index": str(index)},
         "key": f"zone{index}_statistics",
         "api": f"13.{120 + index}.85",
+        "zone": ("counts", index - 1),
         "poll_group": "medium",
         "icon": "mdi:counter",
         "value_type": "int",
@@ -82,6 +86,7 @@ def _zone_minute_statistics_sensor(index: int) -> dict:
         "translation_placeholders": {"index": str(index)},
         "key": f"zone{index}_people_counting_by_mins",
         "api": f"0.{120 + index}.85",
+        "zone": ("minute_counts", index - 1),
         "poll_group": "medium",
         "icon": "mdi:counter",
         "value_type": "float",
@@ -131,6 +136,55 @@ FP2_COUNT_SENSORS_DEF = [
     ],
 ]
 
+# Derived from the zone arrays of one poll group; "zone_resources" keeps the
+# zone resources polled while the per-zone entities stay disabled.
+FP2_ZONE_AGGREGATE_SENSORS_DEF = [
+    {
+        "name": "Occupied Zones",
+        "translation_key": "occupied_zones",
+        "key": "occupied_zones",
+        "zone_aggregate": "occupied_zones",
+        "zone_resources": FP2_ZONE_PRESENCE_ATTRS,
+        "poll_group": "fast",
+        "icon": "mdi:floor-plan",
+        "value_type": "int",
+        "state_class": SensorStateClass.MEASUREMENT,
+        "enabled_default": False,
+    },
+    {
+        "name": "Total People",
+        "translation_key": "total_people",
+        "key": "total_people",
+        "zone_aggregate": "total_people",
+        "zone_resources": FP2_ZONE_STATISTICS_ATTRS,
+        "poll_group": "medium",
+        "icon": "mdi:account-multiple",
+        "value_type": "int",
+        "state_class": SensorStateClass.MEASUREMENT,
+        "enabled_default": False,
+    },
+]
+
+
+def _zone_occupancy_sensor(index: int) -> dict:
+    return {
+        "name": f"Zone {index} Occupancy",
+        "translation_key": "zone_occupancy",
+        "translation_placeholders": {"index": str(index)},
+        "key": f"zone{index}_occupancy",
+        "occupancy_zone": index - 1,
+        "zone_resources": [f"3.{index}.85"],
+        "icon": "mdi:chart-donut",
+        "enabled_default": False,
+    }
+
+
+# Served by AqaraOccupancyAnalytics rather than an FP2 poll group.
+FP2_OCCUPANCY_SENSORS_DEF = [
+    _zone_occupancy_sensor(index)
+    for index in range(1, FP2_ZONE_COUNT + 1)
+]
+
 FP2_STATUS_SENSORS_DEF = [
     {
         "key": "lux",
@@ -267,6 +321,7 @@ FP2_SETTINGS_SENSORS_DEF = [
 
 FP2_SENSOR_SPECS = [
     *FP2_COUNT_SENSORS_DEF,
+    *FP2_ZONE_AGGREGATE_SENSORS_DEF,
     *FP2_STATUS_SENSORS_DEF,
     *FP2_SETTINGS_SENSORS_DEF,
 ]
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from array import array
+import math
+from typing import Any, Callable, Iterable
+
+from .const import (
+    FP2_MINUTE_ZONE_COUNT,
+    FP2_ZONE_COUNT,
+    FP2_ZONE_MINUTE_COUNT_ATTRS,
+    FP2_ZONE_PRESENCE_ATTRS,
+    FP2_ZONE_STATISTICS_ATTRS,
+    FP2_ZONES_KEY,
+)
+
+# Zone resource id -> (poll group, field, zero-based zone index).
+FP2_ZONE_SLOTS: dict[str, tuple[str, str, int]] = {
+    **{resource_id: ("fast", "presence", index) for index, resource_id in enumerate(FP2_ZONE_PRESENCE_ATTRS)},
+    **{resource_id: ("medium", "counts", index) for index, resource_id in enumerate(FP2_ZONE_STATISTICS_ATTRS)},
+    **{
+        resource_id: ("medium", "minute_counts", index)
+        for index, resource_id in enumerate(FP2_ZONE_MINUTE_COUNT_ATTRS)
+    },
+}
+
+_UNKNOWN = -1
+
+
+def _parse_int(raw: Any, limit: int) -> int:
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        try:
+            value = int(float(raw))
+        except (TypeError, ValueError, OverflowError):
+            return _UNKNOWN
+    return value if 0 <= value <= limit else _UNKNOWN
+
+
+def _parse_float(raw: Any) -> float:
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return math.nan
+    return value if math.isfinite(value) else math.nan
+
+
+_FIELD_PARSERS: dict[str, Callable[[Any], int | float]] = {
+    "presence": lambda raw: _parse_int(raw, 127),
+    "counts": lambda raw: _parse_int(raw, 2**31 - 1),
+    "minute_counts": _parse_float,
+}
+
+
+class AqaraFP2Zones:
+    """Per-zone FP2 state in typed arrays indexed by zone.
+
+    Zone presence (``3.N.85``) is held as signed bytes, the 10 second people
+    counts (``13.(120+N).85``) as ints and the per-minute counts
+    (``0.(120+N).85``) as doubles.  Unknown slots are -1, or NaN for the
+    per-minute counts.  One instance replaces the 67 per-zone keys of an FP2
+    poll group's coordinator data; each group only fills its own fields.
+    """
+
+    __slots__ = ("presence", "counts", "minute_counts")
+
+    def __init__(self) -> None:
+        self.presence = array("b", [_UNKNOWN]) * FP2_ZONE_COUNT
+        self.counts = array("i", [_UNKNOWN]) * FP2_ZONE_COUNT
+        self.minute_counts = array("d", [math.nan]) * FP2_MINUTE_ZONE_COUNT
+
+    def copy(self) -> AqaraFP2Zones:
+        zones = AqaraFP2Zones.__new__(AqaraFP2Zones)
+        zones.presence = array("b", self.presence)
+        zones.counts = array("i", self.counts)
+        zones.minute_counts = array("d", self.minute_counts)
+        return zones
+
+    def set(self, resource_id: str, raw: Any) -> bool:
+        """Decode one zone resource value; return whether the slot changed."""
+        return self.decode(((resource_id, raw),)) > 0
+
+    def decode(self, values: Iterable[tuple[str, Any]]) -> int:
+        """Decode (resource id, raw value) pairs in bulk; return how many slots changed."""
+        changed = 0
+        slots = FP2_ZONE_SLOTS
+        for resource_id, raw in values:
+            slot = slots.get(resource_id)
+            if slot is None:
+                continue
+            _, field, index = slot
+            target = getattr(self, field)
+            value = _FIELD_PARSERS[field](raw)
+            previous = target[index]
+            # NaN never equals itself, so compare unknown floats separately.
+            if previous == value or (previous != previous and value != value):
+                continue
+            target[index] = value
+            changed += 1
+        return changed
+
+    def value(self, field: str, index: int) -> int | float | None:
+        """Return one zone slot, or None while it is unknown."""
+        value = getattr(self, field)[index]
+        if field == "minute_counts":
+            return None if math.isnan(value) else value
+        return None if value == _UNKNOWN else value
+
+    def occupied_zones(self) -> int | None:
+        presence = self.presence
+        if presence.count(_UNKNOWN) == len(presence):
+            return None
+        return presence.count(1)
+
+    def total_people(self) -> int | None:
+        counts = self.counts
+        unknown = counts.count(_UNKNOWN)
+        if unknown == len(counts):
+            return None
+        # Unknown slots hold -1; add them back instead of filtering in Python.
+        return sum(counts) + unknown
+
+    def as_dict(self) -> dict[str, list[int | float | None]]:
+        """Return a JSON-serializable copy; Home Assistant's encoder calls this."""
+        return {
+            field: [self.value(field, index) for index in range(len(getattr(self, field)))]
+            for field in self.__slots__
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AqaraFP2Zones:
+        zones = cls()
+        for field in cls.__slots__:
+            target = getattr(zones, field)
+            for index, raw in enumerate((data.get(field) or [])[: len(target)]):
+                if raw is not None:
+                    target[index] = _FIELD_PARSERS[field](raw)
+        return zones
+
+
+def zone_reader(spec: dict[str, Any]) -> Callable[[dict[str, Any]], int | float | None] | None:
+    """Return a reader of the zone slot or aggregate an FP2 entity spec points at.
+
+    The reader takes coordinator data and returns None while the value is
+    unknown.  Specs without a zone return None.
+    """
+    aggregate = spec.get("zone_aggregate")
+    if aggregate is not None:
+        method = getattr(AqaraFP2Zones, aggregate)
+
+        def _read_aggregate(data: dict[str, Any]) -> int | float | None:
+            zones = data.get(FP2_ZONES_KEY)
+            return None if zones is None else method(zones)
+
+        return _read_aggregate
+    zone = spec.get("zone")
+    if zone is None:
+        return None
+    field, index = zone
+
+    def _read_slot(data: dict[str, Any]) -> int | float | None:
+        zones = data.get(FP2_ZONES_KEY)
+        if zones is None:
+            return None
+        value = getattr(zones, field)[index]
+        # -1 marks unknown ints, NaN (never equal to itself) unknown floats.
+        return None if value == _UNKNOWN or value != value else value
+
+    return _read_slot
+
+
+def restore_zone_state(state: dict[str, Any]) -> dict[str, Any]:
+    """Turn zones saved as plain lists back into AqaraFP2Zones."""
+    zones = state.get(FP2_ZONES_KEY)
+    if isinstance(zones, dict):
+        state[FP2_ZONES_KEY] = AqaraFP2Zones.from_dict(zones)
+    return state
@@ -25,6 +25,20 @@ FP300_BINARY_SENSORS_DEF = [
 ]
 
 
+# Served by AqaraOccupancyAnalytics rather than an FP300 poll group.
+FP300_OCCUPANCY_SENSORS_DEF = [
+    {
+        "name": "Occupancy",
+        "translation_key": "occupancy_ratio",
+        "key": "occupancy_ratio",
+        "occupancy_zone": 0,
+        "zone_resources": ["3.51.85"],
+        "icon": "mdi:chart-donut",
+        "enabled_default": False,
+    },
+]
+
+
 FP300_ACTIVITY_STATUS_MAP = {
     "2": "unoccupied",
     "3": "moving",
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import math
+import time
+from typing import Any, Callable, Hashable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DATA_HOLD_TIMERS, DOMAIN, HOLD_TIMER_TICK_SECONDS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AqaraHoldTimers:
+    """Hold-clear deadlines of all binary sensors, driven by one scheduled callback.
+
+    Deadlines are rounded up to the next tick and kept in a heap, so
+    rescheduling a sensor is a heap push instead of a cancelled and
+    re-created loop timer.  Everything due in the same tick is cleared in
+    one pass.  Replaced or cancelled deadlines stay in the heap until they
+    surface and are then skipped.
+    """
+
+    def __init__(self, hass: HomeAssistant, *, tick: float = HOLD_TIMER_TICK_SECONDS) -> None:
+        self._hass = hass
+        self._tick = tick
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._pending: dict[Hashable, tuple[int, Callable[[], None]]] = {}
+        self._sequence = itertools.count()
+        self._cancel_timer: Callable[[], None] | None = None
+        self._armed_for: float | None = None
+        self._metrics = {"scheduled": 0, "fired": 0, "passes": 0}
+
+    def schedule(self, key: Hashable, deadline: float, action: Callable[[], None]) -> None:
+        """Run action at the first tick at or after deadline (epoch seconds), replacing key's deadline."""
+        due = math.ceil(deadline / self._tick) * self._tick
+        sequence = next(self._sequence)
+        self._pending[key] = (sequence, action)
+        heapq.heappush(self._heap, (due, sequence, key))
+        self._metrics["scheduled"] += 1
+        if self._armed_for is None or due < self._armed_for:
+            self._arm(due)
+
+    def cancel(self, key: Hashable) -> None:
+        self._pending.pop(key, None)
+        if not self._pending:
+            self._heap.clear()
+            self._disarm()
+
+    def is_pending(self, key: Hashable) -> bool:
+        return key in self._pending
+
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "heap_size": len(self._heap),
+            "armed_for": self._armed_for,
+            **self._metrics,
+        }
+
+    def _arm(self, due: float) -> None:
+        self._disarm()
+        self._armed_for = due
+        self._cancel_timer = async_call_later(self._hass, max(due - time.time(), 0), self._async_fire)
+
+    def _disarm(self) -> None:
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        self._armed_for = None
+
+    @callback
+    def _async_fire(self, _now) -> None:
+        self._cancel_timer = None
+        self._armed_for = None
+        now = time.time()
+        due_actions: list[Callable[[], None]] = []
+        while self._heap and self._heap[0][0] <= now + self._tick / 2:
+            _, sequence, key = heapq.heappop(self._heap)
+            pending = self._pending.get(key)
+            if pending is None or pending[0] != sequence:
+                continue
+            del self._pending[key]
+            due_actions.append(pending[1])
+
+        for action in due_actions:
+            try:
+                action()
+            except Exception:
+                _LOGGER.exception("Aqara hold timer action failed")
+        if due_actions:
+            self._metrics["fired"] += len(due_actions)
+            self._metrics["passes"] += 1
+
+        # Drop stale entries on top so the next arm targets a live deadline.
+        while self._heap and self._pending.get(self._heap[0][2], (None,))[0] != self._heap[0][1]:
+            heapq.heappop(self._heap)
+        if self._heap:
+            self._arm(self._heap[0][0])
+
+
+@callback
+def async_get_hold_timers(hass: HomeAssistant) -> AqaraHoldTimers:
+    """Return the hold timers shared by every config entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    timers = domain_data.get(DATA_HOLD_TIMERS)
+    if timers is None:
+        timers = domain_data[DATA_HOLD_TIMERS] = AqaraHoldTimers(hass)
+    return timers
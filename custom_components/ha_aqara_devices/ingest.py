@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from itertools import count
+from typing import Any
+
+from .const import BRIDGE_INGEST_QUEUE_EVENTS
+
+
+class AqaraIngestQueue:
+    """Bounded hand-off between the SSE reader and the event dispatcher.
+
+    The reader only appends batches and never waits.  When more than
+    ``max_events`` events are pending, the queue is compacted: events for the
+    same (subjectId, resourceId) collapse into the latest one, which moves to
+    the position of that latest arrival.  Resources listed in
+    ``event_resource_ids`` carry triggers rather than state, so every one of
+    their events is kept.  After compaction the queue holds at most one event
+    per subscribed state resource plus the pending triggers, so it stays
+    bounded without dropping state or blocking the socket.
+    """
+
+    def __init__(
+        self,
+        event_resource_ids: frozenset[str],
+        *,
+        max_events: int = BRIDGE_INGEST_QUEUE_EVENTS,
+    ) -> None:
+        self._event_resource_ids = event_resource_ids
+        self._max_events = max_events
+        self._batches: deque[tuple[str, list[dict[str, Any]]]] = deque()
+        self._depth = 0
+        self._compact_at = max_events
+        self._ready = asyncio.Event()
+        self._metrics = {
+            "enqueued": 0,
+            "dispatched": 0,
+            "merged": 0,
+            "compactions": 0,
+            "peak_depth": 0,
+        }
+
+    def put(self, payload_type: str, events: list[Any]) -> None:
+        batch = [event for event in events if isinstance(event, dict)]
+        if not batch:
+            return
+        self._batches.append((payload_type, batch))
+        self._depth += len(batch)
+        self._metrics["enqueued"] += len(batch)
+        if self._depth > self._compact_at:
+            self._compact()
+        self._metrics["peak_depth"] = max(self._metrics["peak_depth"], self._depth)
+        self._ready.set()
+
+    async def get_all(self) -> list[tuple[str, list[dict[str, Any]]]]:
+        """Wait for pending batches and take all of them, oldest first."""
+        while not self._batches:
+            self._ready.clear()
+            await self._ready.wait()
+        batches = list(self._batches)
+        self._batches.clear()
+        self._metrics["dispatched"] += self._depth
+        self._depth = 0
+        self._compact_at = self._max_events
+        return batches
+
+    def clear(self) -> None:
+        self._batches.clear()
+        self._depth = 0
+        self._compact_at = self._max_events
+
+    def metrics(self) -> dict[str, int]:
+        return {"depth": self._depth, "max_events": self._max_events, **self._metrics}
+
+    def _compact(self) -> None:
+        trigger_ids = count()
+        merged: dict[tuple[str, ...], tuple[str, dict[str, Any]]] = {}
+        for payload_type, events in self._batches:
+            for event in events:
+                subject_id = str(event.get("subjectId") or "")
+                resource_id = str(event.get("resourceId") or "")
+                if resource_id in self._event_resource_ids:
+                    key: tuple[str, ...] = ("trigger", str(next(trigger_ids)))
+                else:
+                    key = ("state", subject_id, resource_id)
+                    if merged.pop(key, None) is not None:
+                        self._metrics["merged"] += 1
+                merged[key] = (payload_type, event)
+
+        self._batches.clear()
+        for payload_type, event in merged.values():
+            if self._batches and self._batches[-1][0] == payload_type:
+                self._batches[-1][1].append(event)
+            else:
+                self._batches.append((payload_type, [event]))
+        self._depth = len(merged)
+        # If mostly distinct resources are pending, wait for the queue to double
+        # before compacting again instead of rescanning it on every batch.
+        self._compact_at = max(self._max_events, 2 * self._depth)
+        self._metrics["compactions"] += 1
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+from typing import Any
+
+from .const import PUSH_JOURNAL_SLOT_BYTES, PUSH_JOURNAL_SLOTS
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAGIC = b"AQJRNL01"
+_VERSION = 2
+# magic, version, slot size, slot count, next sequence number
+_HEADER = struct.Struct("<8sIIIQ")
+_HEADER_BYTES = 64
+# sequence number (0 marks an empty slot), payload length
+_SLOT_HEADER = struct.Struct("<QH")
+
+
+class AqaraPushJournal:
+    """Fixed-size ring buffer of push events, memory-mapped from disk.
+
+    Every slot holds one JSON-encoded
+    ``[subjectId, resourceId, value, time, received_at]`` record, where
+    ``received_at`` is the local wall-clock time the event was journaled.
+    Appending is a copy into the mapping plus a header update, so it is
+    cheap enough to run on the event loop for every pushed event; the
+    kernel writes the pages back.  Once the ring is full the oldest records
+    are overwritten, which bounds the file to
+    ``slot_count * slot_bytes`` plus a small header.
+
+    ``open``, ``read_entries`` and ``close`` touch the disk and must run in
+    the executor.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        slot_count: int = PUSH_JOURNAL_SLOTS,
+        slot_bytes: int = PUSH_JOURNAL_SLOT_BYTES,
+    ) -> None:
+        self._path = path
+        self._slot_count = slot_count
+        self._slot_bytes = slot_bytes
+        self._file = None
+        self._map: mmap.mmap | None = None
+        self._next_seq = 1
+        self.dropped = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def size_bytes(self) -> int:
+        return _HEADER_BYTES + self._slot_count * self._slot_bytes
+
+    def open(self) -> None:
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        mode = "r+b" if os.path.exists(self._path) else "w+b"
+        self._file = open(self._path, mode)
+        try:
+            reset = os.fstat(self._file.fileno()).st_size != self.size_bytes
+            if reset:
+                self._file.truncate(self.size_bytes)
+            self._map = mmap.mmap(self._file.fileno(), self.size_bytes)
+        except Exception:
+            self._file.close()
+            self._file = None
+            raise
+
+        magic, version, slot_bytes, slot_count, next_seq = _HEADER.unpack_from(self._map, 0)
+        if reset or (magic, version, slot_bytes, slot_count) != (
+            _MAGIC,
+            _VERSION,
+            self._slot_bytes,
+            self._slot_count,
+        ):
+            if not reset:
+                _LOGGER.info("Aqara push journal %s has an incompatible layout; starting a new one", self._path)
+            self._map[:] = bytes(self.size_bytes)
+            next_seq = 1
+        else:
+            # The header is written after the slot, so trust the newest slot if it is ahead.
+            next_seq = max(next_seq, max(self._slot_sequences(), default=0) + 1)
+        self._next_seq = next_seq
+        self._write_header()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def append(self, subject_id: str, resource_id: str, value: Any, event_time: Any) -> None:
+        if self._map is None:
+            return
+        payload = json.dumps(
+            [subject_id, resource_id, value, event_time, round(time.time(), 3)],
+            separators=(",", ":"),
+            default=str,
+        ).encode("utf-8")
+        if len(payload) > self._slot_bytes - _SLOT_HEADER.size:
+            self.dropped += 1
+            return
+
+        seq = self._next_seq
+        offset = self._slot_offset(seq)
+        end = offset + _SLOT_HEADER.size + len(payload)
+        # Invalidate the slot first so a torn write is never replayed as the old record.
+        _SLOT_HEADER.pack_into(self._map, offset, 0, 0)
+        self._map[offset + _SLOT_HEADER.size : end] = payload
+        _SLOT_HEADER.pack_into(self._map, offset, seq, len(payload))
+        self._next_seq = seq + 1
+        self._write_header()
+
+    def read_entries(self) -> list[dict[str, Any]]:
+        """Return the journaled events, oldest first."""
+        if self._map is None:
+            return []
+        records: list[tuple[int, dict[str, Any]]] = []
+        max_payload = self._slot_bytes - _SLOT_HEADER.size
+        for index in range(self._slot_count):
+            offset = _HEADER_BYTES + index * self._slot_bytes
+            seq, length = _SLOT_HEADER.unpack_from(self._map, offset)
+            if not seq or length > max_payload:
+                continue
+            start = offset + _SLOT_HEADER.size
+            try:
+                subject_id, resource_id, value, event_time, received_at = json.loads(
+                    self._map[start : start + length]
+                )
+            except (ValueError, TypeError):
+                continue
+            records.append(
+                (
+                    seq,
+                    {
+                        "subjectId": subject_id,
+                        "resourceId": resource_id,
+                        "value": value,
+                        "time": event_time,
+                        "received_at": received_at,
+                    },
+                )
+            )
+        records.sort(key=lambda record: record[0])
+        return [entry for _, entry in records]
+
+    def _slot_offset(self, seq: int) -> int:
+        return _HEADER_BYTES + ((seq - 1) % self._slot_count) * self._slot_bytes
+
+    def _slot_sequences(self):
+        for index in range(self._slot_count):
+            seq, _ = _SLOT_HEADER.unpack_from(self._map, _HEADER_BYTES + index * self._slot_bytes)
+            if seq:
+                yield seq
+
+    def _write_header(self) -> None:
+        _HEADER.pack_into(
+            self._map,
+            0,
+            _MAGIC,
+            _VERSION,
+            self._slot_bytes,
+            self._slot_count,
+            self._next_seq,
+        )
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from .const import (
+    DEVICE_LIVENESS_EWMA_ALPHA,
+    DEVICE_LIVENESS_FACTOR,
+    DEVICE_LIVENESS_MAX_SILENCE_SECONDS,
+    DEVICE_LIVENESS_MIN_QUIET_SECONDS,
+    DEVICE_LIVENESS_MIN_SAMPLES,
+)
+
+
+class AqaraDeviceLiveness:
+    """Track how long each device has gone without a pushed event.
+
+    The gap between consecutive events of a device feeds an exponentially
+    weighted moving average, so every device learns its own expected event
+    rate.  A device is quiet once its silence exceeds ``factor`` times that
+    average, clamped between ``min_quiet_seconds`` and
+    ``max_silence_seconds``; devices with too few samples use the upper
+    bound.  Silence only counts from the start of the current stream window,
+    because events cannot arrive while the stream is down.
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: float = DEVICE_LIVENESS_EWMA_ALPHA,
+        factor: float = DEVICE_LIVENESS_FACTOR,
+        min_samples: int = DEVICE_LIVENESS_MIN_SAMPLES,
+        min_quiet_seconds: float = DEVICE_LIVENESS_MIN_QUIET_SECONDS,
+        max_silence_seconds: float = DEVICE_LIVENESS_MAX_SILENCE_SECONDS,
+    ) -> None:
+        self._alpha = alpha
+        self._factor = factor
+        self._min_samples = min_samples
+        self._min_quiet_seconds = min_quiet_seconds
+        self._max_silence_seconds = max_silence_seconds
+        self._devices: dict[str, dict[str, Any]] = {}
+        self._window_start: float | None = None
+
+    def start_window(self, now: float) -> None:
+        """Start counting silence from now, e.g. when the stream (re)connects."""
+        self._window_start = now
+
+    def record(self, did: str, now: float) -> bool:
+        """Record a pushed event for did; return True if the device was quiet until now."""
+        device = self._device(did)
+        was_quiet = device["quiet"]
+        last_event = device["last_event"]
+        # Gaps spanning an outage or a lapse say nothing about the device's normal rate.
+        if (
+            not was_quiet
+            and last_event is not None
+            and (self._window_start is None or last_event >= self._window_start)
+        ):
+            gap = max(0.0, now - last_event)
+            interval = device["interval"]
+            device["interval"] = gap if interval is None else interval + self._alpha * (gap - interval)
+            device["samples"] += 1
+        device["last_event"] = now
+        device["quiet"] = False
+        device["last_poll"] = None
+        return was_quiet
+
+    def _device(self, did: str) -> dict[str, Any]:
+        return self._devices.setdefault(
+            did,
+            {"last_event": None, "interval": None, "samples": 0, "quiet": False, "last_poll": None},
+        )
+
+    def threshold(self, did: str) -> float:
+        device = self._devices.get(did)
+        if device is None or device["samples"] < self._min_samples:
+            return self._max_silence_seconds
+        return min(
+            max(self._factor * device["interval"], self._min_quiet_seconds),
+            self._max_silence_seconds,
+        )
+
+    def silence(self, did: str, now: float) -> float:
+        device = self._devices.get(did)
+        since = None if device is None else device["last_event"]
+        if self._window_start is not None and (since is None or since < self._window_start):
+            since = self._window_start
+        return 0.0 if since is None else max(0.0, now - since)
+
+    def update_quiet(self, dids: Iterable[str], now: float) -> tuple[list[str], list[str]]:
+        """Re-evaluate dids; return (newly quiet, all quiet) device ids."""
+        newly_quiet: list[str] = []
+        quiet: list[str] = []
+        for did in dids:
+            if self.silence(did, now) <= self.threshold(did):
+                continue
+            device = self._device(did)
+            if not device["quiet"]:
+                device["quiet"] = True
+                newly_quiet.append(did)
+            quiet.append(did)
+        return newly_quiet, quiet
+
+    def due_for_poll(self, dids: Iterable[str], now: float, interval: float) -> list[str]:
+        """Return the dids not polled within interval and stamp them as polled now."""
+        due: list[str] = []
+        for did in dids:
+            device = self._devices[did]
+            if device["last_poll"] is None or now - device["last_poll"] >= interval:
+                device["last_poll"] = now
+                due.append(did)
+        return due
+
+    def diagnostics(self, now: float) -> dict[str, Any]:
+        return {
+            did: {
+                "silence_seconds": round(self.silence(did, now), 1),
+                "expected_interval_seconds": None if device["interval"] is None else round(device["interval"], 1),
+                "threshold_seconds": round(self.threshold(did), 1),
+                "samples": device["samples"],
+                "quiet": device["quiet"],
+            }
+            for did, device in self._devices.items()
+        }
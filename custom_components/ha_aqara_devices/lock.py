@@ -1,28 +1,36 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
 from homeassistant.components.lock import LockEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .api import AqaraApi
 from .const import DOMAIN, U200_DEVICE_LABEL
 from .device_info import build_device_info
+from .entity import AqaraCoordinatorEntity
 from .u200 import U200_DOOR_STATE_LABELS, U200_LOCK_STATE_LABELS, U200_LOCK_STATE_LOCKED, U200_LOCK_STATE_UNLOCKED
+from .device_index import AqaraDeviceIndex
+from .discovery import async_listen_devices_added
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
-    data = hass.data[DOMAIN][entry.entry_id]
+    _add_entities(hass.data[DOMAIN][entry.entry_id], async_add_entities)
+    async_listen_devices_added(hass, entry, partial(_add_entities, async_add_entities=async_add_entities))
+
+
+def _add_entities(data: dict, async_add_entities) -> None:
     api: AqaraApi = data["api"]
-    u200_locks: list[dict[str, Any]] = data.get("u200_locks", [])
-    u200_coordinators: dict[str, DataUpdateCoordinator] = data.get("u200_coordinators", {})
+    device_index: AqaraDeviceIndex = data["device_index"]
+    u200_locks: list[dict[str, Any]] = device_index.devices("u200_locks")
 
     entities: list[LockEntity] = []
     for lock in u200_locks:
         did = lock["did"]
-        coordinator = u200_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
         entities.append(
@@ -38,7 +46,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities(entities)
 
 
-class AqaraU200Lock(CoordinatorEntity, LockEntity):
+class AqaraU200Lock(AqaraCoordinatorEntity, LockEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "lock"
 
@@ -56,6 +64,8 @@ class AqaraU200Lock(CoordinatorEntity, LockEntity):
         self._device_name = device_name
         self._model = model
         self._attr_unique_id = f"{did}_lock"
+        self._reachable = True
+        self._compute_state()
 
     @property
     def device_info(self):
@@ -63,34 +73,34 @@ class AqaraU200Lock(CoordinatorEntity, LockEntity):
 
     @property
     def available(self) -> bool:
-        data = self.coordinator.data or {}
-        return super().available and data.get("reachable") is not False
+        return super().available and self._reachable
 
-    @property
-    def is_locked(self) -> bool | None:
-        lock_state = self._state_value("lock_state")
+    def _compute_state(self) -> None:
+        data = self.coordinator.data or {}
+        lock_state = self._state_value(data, "lock_state")
+        door_state = self._state_value(data, "door_state")
+        self._reachable = data.get("reachable") is not False
         if lock_state == U200_LOCK_STATE_LOCKED:
-            return True
-        if lock_state in U200_LOCK_STATE_UNLOCKED:
-            return False
-        return None
-
-    @property
-    def is_jammed(self) -> bool:
-        return self._state_value("lock_state") == "0" or self._state_value("door_state") == "2"
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        lock_state = self._state_value("lock_state")
-        door_state = self._state_value("door_state")
-        return {
+            self._attr_is_locked = True
+        elif lock_state in U200_LOCK_STATE_UNLOCKED:
+            self._attr_is_locked = False
+        else:
+            self._attr_is_locked = None
+        self._attr_is_jammed = lock_state == "0" or door_state == "2"
+        self._attr_extra_state_attributes = {
             "lock_state": U200_LOCK_STATE_LABELS.get(lock_state, lock_state),
             "door_state": U200_DOOR_STATE_LABELS.get(door_state, door_state),
-            "rechargeable": (self.coordinator.data or {}).get("rechargeable"),
+            "rechargeable": data.get("rechargeable"),
         }
 
-    def _state_value(self, key: str) -> str | None:
-        value = (self.coordinator.data or {}).get(key)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._compute_state()
+        super()._handle_coordinator_update()
+
+    @staticmethod
+    def _state_value(data: dict[str, Any], key: str) -> str | None:
+        value = data.get(key)
         if value is None:
             return None
         return str(value)
@@ -1,11 +1,11 @@
 from __future__ import annotations
+from functools import partial
 from typing import Dict, Any
 import logging
 
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
     DataUpdateCoordinator,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -15,26 +15,27 @@ from .const import DOMAIN, G2H_PRO_DEVICE_LABEL, G410_DEVICE_LABEL, G4_DEVICE_LA
 from .numbers import ALL_NUMBERS_DEF, G2H_PRO_NUMBERS_DEF, G410_NUMBERS_DEF, G4_NUMBERS_DEF, M100_NUMBERS_DEF, M200_NUMBERS_DEF, M3_NUMBERS_DEF
 from .api import AqaraApi
 from .device_info import build_device_info
+from .entity import AqaraCoordinatorEntity
+from .device_index import AqaraDeviceIndex
+from .discovery import async_listen_devices_added
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
-    data = hass.data[DOMAIN][entry.entry_id]
+    _add_entities(hass.data[DOMAIN][entry.entry_id], async_add_entities)
+    async_listen_devices_added(hass, entry, partial(_add_entities, async_add_entities=async_add_entities))
+
+
+def _add_entities(data: dict, async_add_entities) -> None:
     api: AqaraApi = data["api"]
-    cameras: list[dict] = data["cameras"]
-    g2h_pro_cameras: list[dict] = data.get("g2h_pro_cameras", [])
-    g410_doorbells: list[dict] = data.get("g410_doorbells", [])
-    g4_doorbells: list[dict] = data.get("g4_doorbells", [])
-    hubs_m3: list[dict] = data.get("hubs_m3", [])
-    hubs_m100: list[dict] = data.get("hubs_m100", [])
-    hubs_m200: list[dict] = data.get("hubs_m200", [])
-    camera_coordinators: dict[str, DataUpdateCoordinator] = data.get("camera_coordinators", {})
-    g2h_pro_coordinators: dict[str, DataUpdateCoordinator] = data.get("g2h_pro_coordinators", {})
-    g410_coordinators: dict[str, DataUpdateCoordinator] = data.get("g410_coordinators", {})
-    g4_coordinators: dict[str, DataUpdateCoordinator] = data.get("g4_coordinators", {})
-    m3_coordinators: dict[str, DataUpdateCoordinator] = data.get("m3_coordinators", {})
-    m100_coordinators: dict[str, DataUpdateCoordinator] = data.get("m100_coordinators", {})
-    m200_coordinators: dict[str, DataUpdateCoordinator] = data.get("m200_coordinators", {})
+    device_index: AqaraDeviceIndex = data["device_index"]
+    cameras: list[dict] = device_index.devices("cameras")
+    g2h_pro_cameras: list[dict] = device_index.devices("g2h_pro_cameras")
+    g410_doorbells: list[dict] = device_index.devices("g410_doorbells")
+    g4_doorbells: list[dict] = device_index.devices("g4_doorbells")
+    hubs_m3: list[dict] = device_index.devices("hubs_m3")
+    hubs_m100: list[dict] = device_index.devices("hubs_m100")
+    hubs_m200: list[dict] = device_index.devices("hubs_m200")
 
     entities = []
 
@@ -42,7 +43,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = cam["did"]
         name = cam["deviceName"]
         model = cam.get("model") or G3_MODEL
-        coordinator = camera_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -54,7 +55,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = cam["did"]
         name = cam["deviceName"]
         model = cam["model"]
-        coordinator = g2h_pro_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -66,7 +67,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = doorbell["did"]
         name = doorbell["deviceName"]
         model = doorbell["model"]
-        coordinator = g410_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -78,7 +79,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = doorbell["did"]
         name = doorbell["deviceName"]
         model = doorbell["model"]
-        coordinator = g4_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -90,7 +91,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m3_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -102,7 +103,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m100_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -114,7 +115,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m200_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -124,7 +125,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     async_add_entities(entities)
 
-class AqaraNumber(CoordinatorEntity, NumberEntity):
+class AqaraNumber(AqaraCoordinatorEntity, NumberEntity):
     _attr_has_entity_name = True
 
     def __init__(
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from datetime import timedelta
+from functools import partial
+import logging
+import time
+from typing import Any, Callable, Iterable, Sequence
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    DOMAIN,
+    FP2_MODEL,
+    FP2_ZONE_COUNT,
+    FP2_ZONES_KEY,
+    FP300_MODEL,
+    OCCUPANCY_BUCKET_SECONDS,
+    OCCUPANCY_DWELL_BIN_EDGES,
+    OCCUPANCY_UPDATE_SECONDS,
+    OCCUPANCY_WINDOW_BUCKETS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DWELL_BIN_LABELS = ("under_1m", "1_5m", "5_15m", "15_60m", "1_4h", "over_4h")
+_UNKNOWN = -1
+_COUNT_MAX = 65535
+
+
+def _fp2_zone_states(data: dict[str, Any]) -> Sequence[int] | None:
+    zones = data.get(FP2_ZONES_KEY)
+    return None if zones is None else zones.presence
+
+
+def _fp300_presence_state(data: dict[str, Any]) -> Sequence[int] | None:
+    value = data.get("report_status01")
+    if value is None:
+        return None
+    return (1 if str(value) == "1" else 0,)
+
+
+# Model -> (poll group, zone count, reader of zone states from coordinator data).
+# Readers return 1 for occupied, 0 for clear and -1 for unknown, one per zone.
+OCCUPANCY_SOURCES: dict[str, tuple[str, int, Callable[[dict[str, Any]], Sequence[int] | None]]] = {
+    FP2_MODEL: ("fast", FP2_ZONE_COUNT, _fp2_zone_states),
+    FP300_MODEL: ("fast", 1, _fp300_presence_state),
+}
+
+
+class AqaraZoneOccupancy:
+    """Rolling occupancy statistics of the zones of one device.
+
+    Time is cut into buckets of ``bucket_seconds`` and the last ``buckets``
+    of them are kept in ring buffers: occupied seconds, entries and
+    completed dwell times by bin, per zone.  The buffers are flat arrays
+    laid out bucket by bucket, so a bucket is reset with one slice
+    assignment and a zone's window is one strided slice.  Occupied time is
+    credited when a zone clears and when a bucket closes, so nothing runs
+    between observations.
+    """
+
+    def __init__(
+        self,
+        zone_count: int,
+        now: float,
+        *,
+        bucket_seconds: int = OCCUPANCY_BUCKET_SECONDS,
+        buckets: int = OCCUPANCY_WINDOW_BUCKETS,
+    ) -> None:
+        self._zone_count = zone_count
+        self._bucket_seconds = bucket_seconds
+        self._buckets = buckets
+        self._bins = len(DWELL_BIN_LABELS)
+        self._occupied = array("f", [0.0]) * (zone_count * buckets)
+        self._entries = array("H", [0]) * (zone_count * buckets)
+        self._dwell = array("H", [0]) * (zone_count * buckets * self._bins)
+        self._zero_occupied = array("f", [0.0]) * zone_count
+        self._zero_entries = array("H", [0]) * zone_count
+        self._zero_dwell = array("H", [0]) * (zone_count * self._bins)
+        self._states = array("b", [_UNKNOWN]) * zone_count
+        self._last = array("b", [_UNKNOWN]) * zone_count
+        self._seen = array("b", [0]) * zone_count
+        self._since = array("d", [now]) * zone_count
+        self._credited = array("d", [now]) * zone_count
+        self._started = now
+        self._bucket = int(now // bucket_seconds)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(
+            buffer.itemsize * len(buffer)
+            for buffer in (self._occupied, self._entries, self._dwell, self._since, self._credited)
+        )
+
+    def observe(self, states: Sequence[int], now: float) -> None:
+        """Record the zone states reported at now; unknown (-1) states keep the previous one."""
+        self._advance(now)
+        # Readers return arrays or tuples; compare as the same type.
+        current = array("b", states)
+        if current == self._last:
+            return
+        self._last = current
+        base = (self._bucket % self._buckets) * self._zone_count
+        for zone, state in enumerate(states):
+            if state == _UNKNOWN or state == self._states[zone]:
+                continue
+            self._seen[zone] = 1
+            if state == 1:
+                if self._states[zone] == 0:
+                    self._entries[base + zone] = min(self._entries[base + zone] + 1, _COUNT_MAX)
+                self._since[zone] = now
+                self._credited[zone] = now
+            elif self._states[zone] == 1:
+                self._credit(zone, now)
+                dwell_bin = bisect_left(OCCUPANCY_DWELL_BIN_EDGES, now - self._since[zone])
+                index = (base + zone) * self._bins + dwell_bin
+                self._dwell[index] = min(self._dwell[index] + 1, _COUNT_MAX)
+            self._states[zone] = 1 if state == 1 else 0
+
+    def summary(self, now: float) -> list[dict[str, Any] | None]:
+        """Return the window statistics of each zone; None for zones never reported."""
+        self._advance(now)
+        zones = self._zone_count
+        bins = self._bins
+        window = min(
+            now - self._started,
+            (self._buckets - 1) * self._bucket_seconds + now - self._bucket * self._bucket_seconds,
+        )
+        result: list[dict[str, Any] | None] = []
+        for zone in range(zones):
+            if not self._seen[zone]:
+                result.append(None)
+                continue
+            occupied = sum(self._occupied[zone::zones])
+            if self._states[zone] == 1:
+                occupied += now - self._credited[zone]
+            result.append(
+                {
+                    "occupancy": round(100 * occupied / window, 1) if window > 0 else None,
+                    "occupied_seconds": round(occupied),
+                    "entries": sum(self._entries[zone::zones]),
+                    "dwell_distribution": {
+                        label: sum(self._dwell[zone * bins + dwell_bin :: zones * bins])
+                        for dwell_bin, label in enumerate(DWELL_BIN_LABELS)
+                    },
+                }
+            )
+        return result
+
+    def _credit(self, zone: int, until: float) -> None:
+        start = self._credited[zone]
+        if until > start:
+            self._occupied[(self._bucket % self._buckets) * self._zone_count + zone] += until - start
+            self._credited[zone] = until
+
+    def _advance(self, now: float) -> None:
+        """Close buckets up to now, crediting zones that stayed occupied across them."""
+        bucket = int(now // self._bucket_seconds)
+        if bucket <= self._bucket:
+            return
+        occupied = [zone for zone, state in enumerate(self._states) if state == 1]
+        for zone in occupied:
+            self._credit(zone, (self._bucket + 1) * self._bucket_seconds)
+        zones = self._zone_count
+        # Buckets older than the window would be overwritten anyway.
+        for skipped in range(max(self._bucket + 1, bucket - self._buckets + 1), bucket + 1):
+            slot = skipped % self._buckets
+            self._occupied[slot * zones : (slot + 1) * zones] = self._zero_occupied
+            self._entries[slot * zones : (slot + 1) * zones] = self._zero_entries
+            self._dwell[slot * zones * self._bins : (slot + 1) * zones * self._bins] = self._zero_dwell
+            if skipped < bucket:
+                for zone in occupied:
+                    self._occupied[slot * zones + zone] = self._bucket_seconds
+        self._bucket = bucket
+        for zone in occupied:
+            self._credited[zone] = bucket * self._bucket_seconds
+
+
+class AqaraOccupancyAnalytics:
+    """Zone occupancy analytics of the presence devices of one config entry.
+
+    Every update of a device's fast coordinator, pushed or polled, feeds its
+    AqaraZoneOccupancy.  Sensors read the summaries from ``coordinator``,
+    which recomputes them every OCCUPANCY_UPDATE_SECONDS, and only while
+    one of them is enabled.  Statistics live in memory and start over after
+    a restart.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._trackers: dict[str, AqaraZoneOccupancy] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+        self.coordinator: DataUpdateCoordinator = DataUpdateCoordinator(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}-occupancy-{entry_id}",
+            update_method=self._async_summarize,
+            update_interval=timedelta(seconds=OCCUPANCY_UPDATE_SECONDS),
+        )
+
+    @callback
+    def add_devices(self, records: Iterable[dict[str, Any]]) -> None:
+        """Start tracking the supported devices of these device index records."""
+        now = time.time()
+        for record in records:
+            source = OCCUPANCY_SOURCES.get(str(record["device"].get("model") or ""))
+            if source is None:
+                continue
+            group, zone_count, read_states = source
+            coordinator = record["coordinators"].get(group)
+            if coordinator is None:
+                continue
+            did = record["did"]
+            self.remove_devices((did,))
+            self._trackers[did] = AqaraZoneOccupancy(zone_count, now)
+            self._unsubs[did] = coordinator.async_add_listener(
+                partial(self._async_observe, did, coordinator, read_states)
+            )
+
+    @callback
+    def remove_devices(self, dids: Iterable[str]) -> None:
+        for did in dids:
+            self._trackers.pop(did, None)
+            unsub = self._unsubs.pop(did, None)
+            if unsub is not None:
+                unsub()
+
+    @callback
+    def _async_observe(
+        self,
+        did: str,
+        coordinator: DataUpdateCoordinator,
+        read_states: Callable[[dict[str, Any]], Sequence[int] | None],
+    ) -> None:
+        tracker = self._trackers.get(did)
+        if tracker is None or not isinstance(coordinator.data, dict):
+            return
+        states = read_states(coordinator.data)
+        if states is not None:
+            tracker.observe(states, time.time())
+
+    async def _async_summarize(self) -> dict[str, list[dict[str, Any] | None]]:
+        now = time.time()
+        return {did: tracker.summary(now) for did, tracker in self._trackers.items()}
+
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "devices": len(self._trackers),
+            "memory_bytes": sum(tracker.memory_bytes for tracker in self._trackers.values()),
+        }
+
+    async def async_unload(self) -> None:
+        self.remove_devices(list(self._trackers))
+        await self.coordinator.async_shutdown()
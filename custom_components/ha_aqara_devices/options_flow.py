@@ -11,8 +11,10 @@ from .const import (
     AREA_OPTIONS,
     CONF_APP_ID,
     CONF_APP_KEY,
+    CONF_BRIDGE_ACTIVE_ACTIVE,
     CONF_BRIDGE_TOKEN,
     CONF_BRIDGE_URL,
+    CONF_COUNT_STATISTICS,
     CONF_KEY_ID,
     DEFAULT_BRIDGE_URL,
 )
@@ -29,6 +31,14 @@ def _options_schema(defaults: dict[str, Any]) -> vol.Schema:
             vol.Required("area", default=defaults.get("area", "EU")): vol.In(AREA_OPTIONS),
             vol.Required(CONF_BRIDGE_URL, default=defaults.get(CONF_BRIDGE_URL, DEFAULT_BRIDGE_URL)): NON_EMPTY_STRING,
             vol.Required(CONF_BRIDGE_TOKEN, default=defaults.get(CONF_BRIDGE_TOKEN, "")): SECRET_TEXT,
+            vol.Required(
+                CONF_BRIDGE_ACTIVE_ACTIVE,
+                default=defaults.get(CONF_BRIDGE_ACTIVE_ACTIVE, False),
+            ): bool,
+            vol.Required(
+                CONF_COUNT_STATISTICS,
+                default=defaults.get(CONF_COUNT_STATISTICS, False),
+            ): bool,
             vol.Required(CONF_APP_ID, default=defaults.get(CONF_APP_ID, "")): NON_EMPTY_STRING,
             vol.Required(CONF_APP_KEY, default=defaults.get(CONF_APP_KEY, "")): SECRET_TEXT,
             vol.Required(CONF_KEY_ID, default=defaults.get(CONF_KEY_ID, "")): SECRET_TEXT,
@@ -48,6 +58,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 **self.config_entry.data,
                 CONF_BRIDGE_URL: user_input[CONF_BRIDGE_URL].strip(),
                 CONF_BRIDGE_TOKEN: user_input[CONF_BRIDGE_TOKEN].strip(),
+                CONF_BRIDGE_ACTIVE_ACTIVE: user_input[CONF_BRIDGE_ACTIVE_ACTIVE],
+                CONF_COUNT_STATISTICS: user_input[CONF_COUNT_STATISTICS],
                 CONF_APP_ID: user_input[CONF_APP_ID].strip(),
                 CONF_KEY_ID: user_input[CONF_KEY_ID].strip(),
                 CONF_APP_KEY: user_input[CONF_APP_KEY].strip(),
@@ -86,6 +98,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             "area": self.config_entry.data.get("area", "EU"),
             CONF_BRIDGE_URL: self.config_entry.data.get(CONF_BRIDGE_URL, DEFAULT_BRIDGE_URL),
             CONF_BRIDGE_TOKEN: self.config_entry.data.get(CONF_BRIDGE_TOKEN, ""),
+            CONF_BRIDGE_ACTIVE_ACTIVE: self.config_entry.data.get(CONF_BRIDGE_ACTIVE_ACTIVE, False),
+            CONF_COUNT_STATISTICS: self.config_entry.data.get(CONF_COUNT_STATISTICS, False),
             CONF_APP_ID: self.config_entry.data.get(CONF_APP_ID, ""),
             CONF_KEY_ID: self.config_entry.data.get(CONF_KEY_ID, ""),
             CONF_APP_KEY: self.config_entry.data.get(CONF_APP_KEY, ""),
@@ -120,6 +134,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         "area": pending["area"],
                         CONF_BRIDGE_URL: pending[CONF_BRIDGE_URL].strip(),
                         CONF_BRIDGE_TOKEN: pending[CONF_BRIDGE_TOKEN].strip(),
+                        CONF_BRIDGE_ACTIVE_ACTIVE: pending[CONF_BRIDGE_ACTIVE_ACTIVE],
+                        CONF_COUNT_STATISTICS: pending[CONF_COUNT_STATISTICS],
                         CONF_APP_ID: pending[CONF_APP_ID].strip(),
                         CONF_KEY_ID: pending[CONF_KEY_ID].strip(),
                         CONF_APP_KEY: pending[CONF_APP_KEY].strip(),
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import importlib
+import logging
+import sys
+import time
+from typing import Any, Iterable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modules imported lazily by async_setup_entry, in the order they are needed.
+SETUP_MODULES = (
+    "api",
+    "bridge_specs",
+    "client",
+    "count_statistics",
+    "device_index",
+    "discovery",
+    "fp2_zones",
+    "journal",
+    "occupancy",
+    "push",
+    "scheduler",
+    "state_store",
+    "sweep",
+)
+
+
+def time_module_imports(package: str, modules: Iterable[str]) -> dict[str, float | None]:
+    """Import package submodules one by one and return the seconds each took.
+
+    Modules that were already loaded report None.  A module's time includes
+    the submodules it pulls in first, so earlier entries absorb shared
+    dependencies.  Imports block, so call this from the executor.
+    """
+    timings: dict[str, float | None] = {}
+    for module in modules:
+        name = f"{package}.{module}"
+        if name in sys.modules:
+            timings[module] = None
+            continue
+        started = time.perf_counter()
+        importlib.import_module(name)
+        timings[module] = time.perf_counter() - started
+    return timings
+
+
+class AqaraSetupProfiler:
+    """Record how long each phase of a config entry setup takes.
+
+    ``lap`` closes the phase that ran since the previous lap, so setup code
+    only needs one call after each step.  Phases that finish later in the
+    background, such as the bridge startup, are added with ``record``.
+    """
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self._last_lap = self._started
+        self._phases: dict[str, float] = {}
+        self._imports: dict[str, float | None] = {}
+
+    def lap(self, name: str) -> None:
+        now = time.perf_counter()
+        self.record(name, now - self._last_lap)
+        self._last_lap = now
+
+    def record(self, name: str, seconds: float) -> None:
+        self._phases[name] = self._phases.get(name, 0.0) + seconds
+
+    def record_imports(self, timings: dict[str, float | None]) -> None:
+        self._imports.update(timings)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "imports_ms": {
+                module: None if seconds is None else round(seconds * 1000, 1)
+                for module, seconds in self._imports.items()
+            },
+            "phases_ms": {name: round(seconds * 1000, 1) for name, seconds in self._phases.items()},
+        }
+
+    def log_summary(self, title: str) -> None:
+        _LOGGER.info(
+            "Aqara setup of %s took %.0f ms: %s",
+            title,
+            self.elapsed() * 1000,
+            ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self._phases.items()),
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from contextlib import suppress
 from datetime import timedelta
 import json
@@ -8,113 +9,170 @@ import logging
 import time
 from typing import Any
 
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientError, ClientResponse, ClientSession, ClientTimeout
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import BRIDGE_SANITY_INTERVAL_SECONDS
+from .const import (
+    BRIDGE_CATCH_UP_ATTEMPTS,
+    BRIDGE_EVENT_DEDUP_WINDOW,
+    BRIDGE_HEALTH_RECHECK_FAILURES,
+    BRIDGE_HEALTH_RECHECK_SECONDS,
+    BRIDGE_HEALTH_TIMEOUT_SECONDS,
+    BRIDGE_POLLING_FALLBACK_DELAY_SECONDS,
+    BRIDGE_READ_IDLE_TIMEOUT_SECONDS,
+    BRIDGE_SANITY_INTERVAL_SECONDS,
+    BRIDGE_STABLE_STREAM_SECONDS,
+    BRIDGE_SUBSCRIBE_ATTEMPTS,
+    BRIDGE_SUBSCRIBE_CHUNK_RESOURCES,
+    BRIDGE_SUBSCRIBE_CONCURRENCY,
+    BRIDGE_SUBSCRIBE_RETRY_SECONDS,
+    BRIDGE_WATCHDOG_TICK_SECONDS,
+    DEVICE_LIVENESS_TICK_SECONDS,
+    DEVICE_STATE_GROUP,
+    FP2_ZONES_KEY,
+    SSE_EXECUTOR_DECODE_BYTES,
+)
 
-from .api import AqaraApi, AqaraAuthError
+from .api import AqaraApi, AqaraAuthError, chunk_subject_resources
 from .bridge_specs import (
-    A100_PRO_RESOURCE_SPEC_MAP,
-    ACN002_RESOURCE_SPEC_MAP,
-    FP2_GROUP_SPEC_MAPS,
-    FP300_GROUP_SPEC_MAPS,
-    G2H_PRO_RESOURCE_SPEC_MAP,
-    G410_RESOURCE_SPEC_MAP,
-    G4_RESOURCE_SPEC_MAP,
+    EVENT_RESOURCE_IDS,
     GESTURE_RESOURCE_ID,
     G3_GESTURE_VALUE_MAP,
     G3_RESOURCE_SPEC_MAP,
-    M100_RESOURCE_SPEC_MAP,
-    M200_RESOURCE_SPEC_MAP,
-    M3_RESOURCE_SPEC_MAP,
+    RESYNC_SKIPPED_RESOURCE_IDS,
     coerce_spec_value,
     spec_state_key,
 )
-from .const import FP2_MODEL, FP300_MODEL
+from .device_index import AqaraDeviceIndex
+from .fp2_zones import AqaraFP2Zones
+from .ingest import AqaraIngestQueue
+from .journal import AqaraPushJournal
+from .liveness import AqaraDeviceLiveness
+from .scheduler import AqaraPollScheduler
+from .sweep import AqaraFleetSweeper
 
 _LOGGER = logging.getLogger(__name__)
 
 
+SSE_EVENT_GAP_STATUSES = {409, 410, 412}
+SSE_EVENT_GAP_TYPES = {"gap", "reset"}
+
+
+def _decode_sse_payload(
+    event_name: str | None,
+    text: str,
+    known_subjects: frozenset[str],
+) -> tuple[str, Any] | None:
+    """Decode one SSE payload and keep only the events this entry can apply.
+
+    Returns (payload_type, events) for snapshots and batches, or
+    (payload_type, reason) for gap notices.  Touches no shared state, so it
+    can run in the executor for large payloads.
+    """
+    payload = json.loads(text)
+    if not isinstance(payload, dict):
+        return None
+
+    payload_type = str(payload.get("type") or event_name or "").strip().lower()
+    if payload_type in SSE_EVENT_GAP_TYPES:
+        return payload_type, payload.get("reason") or payload_type
+    if payload_type not in {"snapshot", "batch"}:
+        return None
+
+    events = payload.get("events") or []
+    if not isinstance(events, list):
+        return None
+    return payload_type, [
+        event
+        for event in events
+        if isinstance(event, dict)
+        and str(event.get("subjectId") or "") in known_subjects
+        and event.get("resourceId")
+        and int(event.get("statusCode", 0) or 0) == 0
+    ]
+
+
 class AqaraBridgeNotReady(RuntimeError):
     """Raised when the bridge HTTP API is reachable but not ready for push updates."""
 
 
+class AqaraBridgeEventGap(RuntimeError):
+    """Raised when the bridge cannot replay events since the last seen event ID."""
+
+
+class AqaraBridgeStalled(RuntimeError):
+    """Raised when the stream watchdog drops a connection that stopped delivering."""
+
+
 class AqaraBridgePushManager:
     def __init__(
         self,
         hass,
         session: ClientSession,
         api: AqaraApi,
-        bridge_url: str,
+        bridge_urls: list[str],
         bridge_token: str,
-        cameras: list[dict[str, Any]],
-        g2h_pro_cameras: list[dict[str, Any]],
-        g410_doorbells: list[dict[str, Any]],
-        g4_doorbells: list[dict[str, Any]],
-        hubs_m3: list[dict[str, Any]],
-        hubs_m100: list[dict[str, Any]],
-        hubs_m200: list[dict[str, Any]],
-        a100_pro_locks: list[dict[str, Any]],
-        acn002_locks: list[dict[str, Any]],
-        presence_devices: list[dict[str, Any]],
-        camera_coordinators: dict[str, DataUpdateCoordinator],
-        g2h_pro_coordinators: dict[str, DataUpdateCoordinator],
-        g410_coordinators: dict[str, DataUpdateCoordinator],
-        g4_coordinators: dict[str, DataUpdateCoordinator],
-        m3_coordinators: dict[str, DataUpdateCoordinator],
-        m100_coordinators: dict[str, DataUpdateCoordinator],
-        m200_coordinators: dict[str, DataUpdateCoordinator],
-        a100_pro_coordinators: dict[str, DataUpdateCoordinator],
-        acn002_coordinators: dict[str, DataUpdateCoordinator],
-        presence_coordinators: dict[str, dict[str, DataUpdateCoordinator]],
+        device_index: AqaraDeviceIndex,
         subscriptions: list[dict[str, Any]],
+        *,
+        poll_scheduler: AqaraPollScheduler,
+        active_active: bool = False,
+        journal: AqaraPushJournal | None = None,
+        sweeper: AqaraFleetSweeper | None = None,
     ) -> None:
         self._hass = hass
         self._session = session
         self._api = api
-        self._bridge_url = bridge_url.rstrip("/")
+        self._bridges = [
+            self._new_bridge_state(url)
+            for url in dict.fromkeys(url.strip().rstrip("/") for url in bridge_urls if url.strip())
+        ]
+        self._active_active = active_active and len(self._bridges) > 1
         self._bridge_token = bridge_token
-        self._camera_coordinators = camera_coordinators
-        self._g2h_pro_coordinators = g2h_pro_coordinators
-        self._g410_coordinators = g410_coordinators
-        self._g4_coordinators = g4_coordinators
-        self._m3_coordinators = m3_coordinators
-        self._m100_coordinators = m100_coordinators
-        self._m200_coordinators = m200_coordinators
-        self._a100_pro_coordinators = a100_pro_coordinators
-        self._acn002_coordinators = acn002_coordinators
-        self._presence_coordinators = presence_coordinators
-        self._cameras = {device["did"]: device for device in cameras}
-        self._g2h_pro_cameras = {device["did"]: device for device in g2h_pro_cameras}
-        self._g410_doorbells = {device["did"]: device for device in g410_doorbells}
-        self._g4_doorbells = {device["did"]: device for device in g4_doorbells}
-        self._hubs_m3 = {device["did"]: device for device in hubs_m3}
-        self._hubs_m100 = {device["did"]: device for device in hubs_m100}
-        self._hubs_m200 = {device["did"]: device for device in hubs_m200}
-        self._a100_pro_locks = {device["did"]: device for device in a100_pro_locks}
-        self._acn002_locks = {device["did"]: device for device in acn002_locks}
-        self._presence_devices = {device["did"]: device for device in presence_devices}
-        self._camera_state: dict[str, dict[str, Any]] = {did: {} for did in self._cameras}
-        self._g2h_pro_state: dict[str, dict[str, Any]] = {did: {} for did in self._g2h_pro_cameras}
-        self._g410_state: dict[str, dict[str, Any]] = {did: {} for did in self._g410_doorbells}
-        self._g4_state: dict[str, dict[str, Any]] = {did: {} for did in self._g4_doorbells}
-        self._m3_state: dict[str, dict[str, Any]] = {did: {} for did in self._hubs_m3}
-        self._m100_state: dict[str, dict[str, Any]] = {did: {} for did in self._hubs_m100}
-        self._m200_state: dict[str, dict[str, Any]] = {did: {} for did in self._hubs_m200}
-        self._a100_pro_state: dict[str, dict[str, Any]] = {did: {} for did in self._a100_pro_locks}
-        self._acn002_state: dict[str, dict[str, Any]] = {did: {} for did in self._acn002_locks}
-        self._presence_state: dict[str, dict[str, dict[str, Any]]] = {
-            did: {group: {} for group in coordinators}
-            for did, coordinators in presence_coordinators.items()
-        }
+        self._device_index = device_index
+        # Push-built state per did; presence devices keep one state per poll group.
+        self._device_state: dict[str, dict[str, Any]] = {}
+        self._presence_state: dict[str, dict[str, dict[str, Any]]] = {}
+        self._known_subjects = frozenset(record["did"] for record in device_index)
         self._subscriptions = self._normalize_subscriptions(subscriptions)
-        self._listen_task: asyncio.Task[None] | None = None
+        # Wanted resources Aqara did not accept; retried on a timer and on reconnect.
+        self._pending_subscriptions: list[dict[str, Any]] = []
+        self._subscription_retry_task: asyncio.Task[None] | None = None
+        self._cancel_subscription_retry = None
+        self._listen_tasks: list[asyncio.Task[None]] = []
         self._stop_event = asyncio.Event()
-        self._connected_event = asyncio.Event()
+        self._connected_bridges: set[str] = set()
+        self._claimed_bridges: set[str] = set()
+        self._recent_events: OrderedDict[tuple[str, ...], None] = OrderedDict()
+        self._journal = journal
+        self._sweeper = sweeper
+        self._liveness = AqaraDeviceLiveness()
+        self._cancel_liveness_tick = None
+        self._quiet_poll_task: asyncio.Task[None] | None = None
+        self._ingest = AqaraIngestQueue(EVENT_RESOURCE_IDS)
+        self._dispatch_task: asyncio.Task[None] | None = None
         self._subscribed = False
         self._started = False
+        self._poll_scheduler = poll_scheduler
         self._polling_enabled: bool | None = None
+        self._catch_up_task: asyncio.Task[None] | None = None
+        self._disconnected_at: float | None = None
+        self._restored_state_at: float | None = None
+        self._cancel_polling_fallback = None
+
+    @staticmethod
+    def _new_bridge_state(url: str) -> dict[str, Any]:
+        return {
+            "url": url,
+            "last_event_id": None,
+            "healthy": False,
+            "latency": None,
+            "last_error": None,
+            "failures": 0,
+            "last_activity": None,
+        }
 
     @staticmethod
     def _normalize_subscriptions(subscriptions: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -134,36 +192,63 @@ class AqaraBridgePushManager:
             if resource_map
         ]
 
+    @staticmethod
+    def _diff_subscriptions(
+        current: list[dict[str, Any]],
+        desired: list[dict[str, Any]],
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Return the (added, removed) resources needed to move from current to desired."""
+        current_map = {item["subjectId"]: item["resourceIds"] for item in current}
+        desired_map = {item["subjectId"]: item["resourceIds"] for item in desired}
+        added: list[dict[str, Any]] = []
+        removed: list[dict[str, Any]] = []
+        for subject_id in dict.fromkeys([*current_map, *desired_map]):
+            current_resources = current_map.get(subject_id, [])
+            desired_resources = desired_map.get(subject_id, [])
+            current_set = set(current_resources)
+            desired_set = set(desired_resources)
+            to_add = [resource_id for resource_id in desired_resources if resource_id not in current_set]
+            to_remove = [resource_id for resource_id in current_resources if resource_id not in desired_set]
+            if to_add:
+                added.append({"subjectId": subject_id, "resourceIds": to_add})
+            if to_remove:
+                removed.append({"subjectId": subject_id, "resourceIds": to_remove})
+        return added, removed
+
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "mode": "active-active" if self._active_active else "failover",
+            "started": self._started,
+            "subscribed": self._subscribed,
+            "polling_enabled": self._polling_enabled,
+            "subscribed_devices": len(self._subscriptions),
+            "subscribed_resources": self._subscription_resource_count(),
+            "pending_resources": sum(len(item["resourceIds"]) for item in self._pending_subscriptions),
+            "connected_bridges": sorted(self._connected_bridges),
+            "ingest_queue": self._ingest.metrics(),
+            "device_liveness": self._liveness.diagnostics(time.time()),
+            "bridges": [
+                {key: value for key, value in bridge.items() if key != "last_activity"}
+                for bridge in self._bridges
+            ],
+        }
+
     def _subscription_resource_count(self) -> int:
         return sum(len(subscription["resourceIds"]) for subscription in self._subscriptions)
 
-    def _all_coordinators(self):
-        """Yield every coordinator managed by this push manager."""
-        yield from self._camera_coordinators.values()
-        yield from self._g2h_pro_coordinators.values()
-        yield from self._g410_coordinators.values()
-        yield from self._g4_coordinators.values()
-        yield from self._m3_coordinators.values()
-        yield from self._m100_coordinators.values()
-        yield from self._m200_coordinators.values()
-        yield from self._a100_pro_coordinators.values()
-        yield from self._acn002_coordinators.values()
-        for groups in self._presence_coordinators.values():
-            yield from groups.values()
-
     def _set_polling_enabled(self, enabled: bool) -> None:
         """Toggle coordinator polling based on bridge SSE health.
 
         When the bridge SSE stream is connected, polling is disabled because
-        push delivers all resource updates in real time.  When SSE drops,
-        polling is re-enabled as an automatic fallback.
+        push delivers all resource updates in real time.  When SSE stays down
+        longer than BRIDGE_POLLING_FALLBACK_DELAY_SECONDS, polling is
+        re-enabled as an automatic fallback; shorter outages are covered by
+        a catch-up query once the stream is back.
         """
         if self._polling_enabled == enabled:
             return
 
-        interval = timedelta(seconds=BRIDGE_SANITY_INTERVAL_SECONDS) if enabled else None
-        for coordinator in self._all_coordinators():
-            coordinator.update_interval = interval
+        self._poll_scheduler.set_polling_enabled(enabled)
         self._polling_enabled = enabled
         _LOGGER.info(
             "Aqara bridge polling fallback %s",
@@ -180,25 +265,53 @@ class AqaraBridgePushManager:
             return
 
         self._set_polling_enabled(True)
+        if self._restored_state_at is not None and self._disconnected_at is None:
+            self._disconnected_at = self._restored_state_at
         await self._api.ensure_valid_access_token()
         await self._check_health()
         await self._subscribe_all_resources()
 
         self._stop_event.clear()
-        self._connected_event.clear()
-        if self._listen_task is None or self._listen_task.done():
-            self._listen_task = self._hass.async_create_background_task(
-                self._listen_loop(),
-                "Aqara bridge SSE listener",
+        self._connected_bridges.clear()
+        self._claimed_bridges.clear()
+        if self._dispatch_task is None or self._dispatch_task.done():
+            self._ingest.clear()
+            self._dispatch_task = self._hass.async_create_background_task(
+                self._dispatch_loop(),
+                "Aqara bridge event dispatcher",
+            )
+        if self._sweeper is not None and self._cancel_liveness_tick is None:
+            self._cancel_liveness_tick = async_track_time_interval(
+                self._hass,
+                self._async_liveness_tick,
+                timedelta(seconds=DEVICE_LIVENESS_TICK_SECONDS),
+            )
+        if self._cancel_subscription_retry is None:
+            self._cancel_subscription_retry = async_track_time_interval(
+                self._hass,
+                self._async_subscription_retry_tick,
+                timedelta(seconds=BRIDGE_SUBSCRIBE_RETRY_SECONDS),
             )
+        if not any(not task.done() for task in self._listen_tasks):
+            lane_count = 2 if self._active_active else 1
+            self._listen_tasks = [
+                self._hass.async_create_background_task(
+                    self._listen_loop(lane),
+                    f"Aqara bridge SSE listener {lane + 1}",
+                )
+                for lane in range(lane_count)
+            ]
         _LOGGER.info(
-            "Aqara bridge SSE listener started; polling fallback remains active until connected"
+            "Aqara bridge SSE listener started on %s of %s bridge(s) (%s); "
+            "polling fallback remains active until connected",
+            len(self._listen_tasks),
+            len(self._bridges),
+            "active-active" if self._active_active else "failover",
         )
         self._started = True
 
     async def async_stop(self) -> None:
         self._stop_event.set()
-        self._connected_event.clear()
 
         if self._subscribed:
             try:
@@ -210,48 +323,177 @@ class AqaraBridgePushManager:
             finally:
                 self._subscribed = False
 
-        task = self._listen_task
-        self._listen_task = None
+        tasks = self._listen_tasks
+        self._listen_tasks = []
+        dispatch_task = self._dispatch_task
+        self._dispatch_task = None
+        catch_up_task = self._catch_up_task
+        self._catch_up_task = None
+        quiet_poll_task = self._quiet_poll_task
+        self._quiet_poll_task = None
+        retry_task = self._subscription_retry_task
+        self._subscription_retry_task = None
+        if self._cancel_liveness_tick is not None:
+            self._cancel_liveness_tick()
+            self._cancel_liveness_tick = None
+        if self._cancel_subscription_retry is not None:
+            self._cancel_subscription_retry()
+            self._cancel_subscription_retry = None
         self._started = False
+        self._cancel_pending_polling_fallback()
+        self._disconnected_at = None
         self._set_polling_enabled(True)
-        if task is not None:
-            task.cancel()
+        self._connected_bridges.clear()
+        self._claimed_bridges.clear()
+        for pending_task in (*tasks, catch_up_task, quiet_poll_task, retry_task, dispatch_task):
+            if pending_task is None:
+                continue
+            pending_task.cancel()
             with suppress(asyncio.CancelledError):
-                await task
+                await pending_task
 
     async def _check_health(self) -> None:
-        url = f"{self._bridge_url}/health"
-        timeout = ClientTimeout(total=10)
-        async with self._session.get(url, timeout=timeout) as response:
-            if response.status != 200:
-                body = await response.text()
-                raise RuntimeError(f"Aqara bridge health check failed ({response.status}): {body}")
-
-            payload = await response.json()
-            status = str(payload.get("status") or "").strip().lower()
-            rocketmq_started_value = payload.get("rocketmqStarted")
-            rocketmq_started = rocketmq_started_value is True or str(rocketmq_started_value).lower() == "true"
-            if status != "up" or not rocketmq_started:
-                raise AqaraBridgeNotReady(
-                    "Aqara bridge RocketMQ consumer is not ready "
-                    f"(status={payload.get('status')}, rocketmqStarted={payload.get('rocketmqStarted')}, "
-                    f"lastError={payload.get('lastError')})"
-                )
-            _LOGGER.info(
-                "Aqara bridge health OK: status=%s rocketmq_started=%s nameserver=%s last_error=%s",
-                payload.get("status"),
-                rocketmq_started,
-                payload.get("nameserver"),
-                payload.get("lastError"),
+        if not self._bridges:
+            raise RuntimeError("No Aqara bridge URL configured")
+        ranked = await self._rank_bridges()
+        if not ranked:
+            raise AqaraBridgeNotReady(
+                "No Aqara bridge is ready for push updates: "
+                + "; ".join(f"{bridge['url']}: {bridge['last_error']}" for bridge in self._bridges)
+            )
+
+    async def _probe_bridge(self, bridge: dict[str, Any]) -> None:
+        """Refresh the health snapshot of one bridge from its /health endpoint."""
+        url = f"{bridge['url']}/health"
+        timeout = ClientTimeout(total=BRIDGE_HEALTH_TIMEOUT_SECONDS)
+        started = time.monotonic()
+        try:
+            async with self._session.get(url, timeout=timeout) as response:
+                if response.status != 200:
+                    body = await response.text()
+                    raise RuntimeError(f"health check failed ({response.status}): {body}")
+                payload = await response.json()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            bridge["healthy"] = False
+            bridge["latency"] = None
+            bridge["last_error"] = str(err) or type(err).__name__
+            return
+
+        status = str(payload.get("status") or "").strip().lower()
+        rocketmq_started_value = payload.get("rocketmqStarted")
+        rocketmq_started = rocketmq_started_value is True or str(rocketmq_started_value).lower() == "true"
+        bridge["latency"] = time.monotonic() - started
+        bridge["healthy"] = status == "up" and rocketmq_started
+        bridge["last_error"] = payload.get("lastError") or None
+        if not bridge["healthy"]:
+            bridge["last_error"] = (
+                f"RocketMQ consumer is not ready (status={payload.get('status')}, "
+                f"rocketmqStarted={rocketmq_started_value}, lastError={payload.get('lastError')})"
             )
+        _LOGGER.debug(
+            "Aqara bridge health %s: status=%s rocketmq_started=%s nameserver=%s last_error=%s latency=%.3fs",
+            bridge["url"],
+            payload.get("status"),
+            rocketmq_started,
+            payload.get("nameserver"),
+            payload.get("lastError"),
+            bridge["latency"],
+        )
+
+    async def _rank_bridges(self, skip: frozenset[str] = frozenset()) -> list[dict[str, Any]]:
+        """Probe every bridge not in skip and return the healthy ones, best first.
+
+        Bridges reporting a lastError rank behind clean ones, then bridges
+        whose stream kept failing, then slower health responses.
+        """
+        bridges = [bridge for bridge in self._bridges if bridge["url"] not in skip]
+        await asyncio.gather(*(self._probe_bridge(bridge) for bridge in bridges))
+        return sorted(
+            (bridge for bridge in bridges if bridge["healthy"]),
+            key=lambda bridge: (
+                bridge["last_error"] is not None,
+                bridge["failures"],
+                bridge["latency"],
+            ),
+        )
+
+    async def _send_subscription_request(self, request, chunk: list[dict[str, Any]]) -> str | None:
+        """Send one chunk, retrying on its own; return an error message or None."""
+        error: str | None = None
+        for attempt in range(1, BRIDGE_SUBSCRIBE_ATTEMPTS + 1):
+            try:
+                response = await request(chunk)
+            except AqaraAuthError:
+                raise
+            except Exception as err:
+                error = str(err)
+            else:
+                if str(response.get("code")) == "0":
+                    return None
+                error = str(response)
+            if attempt < BRIDGE_SUBSCRIBE_ATTEMPTS:
+                await asyncio.sleep(attempt)
+        return error
+
+    async def _send_subscription_chunks(
+        self,
+        request,
+        subscriptions: list[dict[str, Any]],
+    ) -> tuple[list[dict[str, Any]], dict[str, str]]:
+        """Send subscriptions in bounded, concurrent chunks.
+
+        Returns the resources that were accepted and the last error per
+        subject with resources that were not.  Subjects split across chunks
+        can be partly accepted.  A chunk that keeps failing is split per
+        subject so one bad device cannot sink the others.
+        """
+        semaphore = asyncio.Semaphore(BRIDGE_SUBSCRIBE_CONCURRENCY)
+        accepted: list[dict[str, Any]] = []
+        errors: dict[str, str] = {}
+
+        async def _send(chunk: list[dict[str, Any]]) -> None:
+            async with semaphore:
+                error = await self._send_subscription_request(request, chunk)
+            if error is None:
+                accepted.extend(chunk)
+                return
+            subjects = list(dict.fromkeys(item["subjectId"] for item in chunk))
+            if len(subjects) > 1:
+                await asyncio.gather(
+                    *(
+                        _send([item for item in chunk if item["subjectId"] == subject_id])
+                        for subject_id in subjects
+                    )
+                )
+                return
+            errors[subjects[0]] = error
+
+        await asyncio.gather(
+            *(_send(chunk) for chunk in chunk_subject_resources(subscriptions, BRIDGE_SUBSCRIBE_CHUNK_RESOURCES))
+        )
+        return self._normalize_subscriptions(accepted), errors
+
+    @staticmethod
+    def _log_subscription_failures(action: str, errors: dict[str, str]) -> None:
+        for subject_id, error in errors.items():
+            _LOGGER.warning("Aqara bridge %s failed for %s: %s", action, subject_id, error)
 
     async def _subscribe_all_resources(self) -> None:
-        if not self._subscriptions:
+        wanted = self._normalize_subscriptions([*self._subscriptions, *self._pending_subscriptions])
+        if not wanted:
             return
 
-        response = await self._api.subscribe_resources(self._subscriptions)
-        if str(response.get("code")) != "0":
-            raise RuntimeError(f"Failed to subscribe bridge resources: {response}")
+        accepted, errors = await self._send_subscription_chunks(self._api.subscribe_resources, wanted)
+        self._log_subscription_failures("subscribe", errors)
+        if not accepted:
+            self._subscriptions = wanted
+            self._pending_subscriptions = []
+            raise RuntimeError(f"Failed to subscribe bridge resources: {errors}")
+        # Keep the partial success; the rest is retried by _async_retry_pending_subscriptions.
+        self._subscriptions = accepted
+        self._pending_subscriptions = self._diff_subscriptions(accepted, wanted)[0]
         self._subscribed = True
         _LOGGER.info(
             "Subscribed Aqara bridge resources for %s device(s), %s resource(s)",
@@ -263,270 +505,689 @@ class AqaraBridgePushManager:
         if not self._subscriptions:
             return
 
-        response = await self._api.unsubscribe_resources(self._subscriptions)
-        if str(response.get("code")) != "0":
-            raise RuntimeError(f"Failed to unsubscribe bridge resources: {response}")
+        accepted, errors = await self._send_subscription_chunks(self._api.unsubscribe_resources, self._subscriptions)
+        self._log_subscription_failures("unsubscribe", errors)
         _LOGGER.info(
             "Unsubscribed Aqara bridge resources for %s device(s), %s resource(s)",
-            len(self._subscriptions),
-            self._subscription_resource_count(),
+            len(accepted),
+            sum(len(item["resourceIds"]) for item in accepted),
+        )
+
+    async def async_update_subscriptions(self, subscriptions: list[dict[str, Any]]) -> None:
+        """Apply a new set of active subscriptions by only sending the delta.
+
+        Pending resources that are still wanted are part of the delta again.
+        """
+        desired = self._normalize_subscriptions(subscriptions)
+        self._pending_subscriptions = []
+        added, removed = self._diff_subscriptions(self._subscriptions, desired)
+        if not added and not removed:
+            return
+
+        if not self._subscribed:
+            # Nothing is registered with Aqara yet; the next startup subscribes everything.
+            self._subscriptions = desired
+            if self._started and not self._listen_tasks and desired:
+                self._started = False
+                await self.async_start()
+            return
+
+        if removed:
+            try:
+                await self.remove_resources(removed)
+            except Exception:
+                # Failed removals stay tracked; the additions wait with the pending retries.
+                self._pending_subscriptions = added
+                raise
+        if added:
+            await self.add_resources(added)
+
+    async def add_resources(self, subscriptions: list[dict[str, Any]]) -> None:
+        """Subscribe more resources; the ones Aqara rejects are kept pending and retried."""
+        additions = self._normalize_subscriptions(subscriptions)
+        if not additions:
+            return
+
+        accepted, errors = await self._send_subscription_chunks(self._api.subscribe_resources, additions)
+        self._log_subscription_failures("subscribe", errors)
+        self._subscriptions = self._normalize_subscriptions([*self._subscriptions, *accepted])
+        failed = self._diff_subscriptions(accepted, additions)[0]
+        self._pending_subscriptions = self._normalize_subscriptions([*self._pending_subscriptions, *failed])
+        _LOGGER.info(
+            "Subscribed %s additional Aqara bridge resource(s) for %s device(s); %s pending retry",
+            sum(len(item["resourceIds"]) for item in accepted),
+            len(accepted),
+            sum(len(item["resourceIds"]) for item in failed),
+        )
+
+    async def remove_resources(self, subscriptions: list[dict[str, Any]]) -> None:
+        """Unsubscribe resources; the ones Aqara rejects stay tracked as subscribed."""
+        removals = self._normalize_subscriptions(subscriptions)
+        if not removals:
+            return
+
+        accepted, errors = await self._send_subscription_chunks(self._api.unsubscribe_resources, removals)
+        self._log_subscription_failures("unsubscribe", errors)
+        removed_map = {item["subjectId"]: set(item["resourceIds"]) for item in accepted}
+        self._subscriptions = self._normalize_subscriptions(
+            [
+                {
+                    "subjectId": item["subjectId"],
+                    "resourceIds": [
+                        resource_id
+                        for resource_id in item["resourceIds"]
+                        if resource_id not in removed_map.get(item["subjectId"], set())
+                    ],
+                }
+                for item in self._subscriptions
+            ]
+        )
+        _LOGGER.info(
+            "Unsubscribed %s Aqara bridge resource(s) for %s device(s)",
+            sum(len(resources) for resources in removed_map.values()),
+            len(removed_map),
         )
+        if errors:
+            raise RuntimeError(f"Failed to unsubscribe some bridge resources: {errors}")
 
-    async def _listen_loop(self) -> None:
+    @callback
+    def _async_subscription_retry_tick(self, _now=None) -> None:
+        if not self._subscribed or not self._pending_subscriptions:
+            return
+        if self._subscription_retry_task is not None and not self._subscription_retry_task.done():
+            return
+        self._subscription_retry_task = self._hass.async_create_background_task(
+            self._async_retry_pending_subscriptions(),
+            "Aqara bridge subscription retry",
+        )
+
+    async def _async_retry_pending_subscriptions(self) -> None:
+        pending = self._pending_subscriptions
+        self._pending_subscriptions = []
+        _LOGGER.debug(
+            "Retrying Aqara bridge subscriptions for %s device(s)",
+            len(pending),
+        )
+        try:
+            await self.add_resources(pending)
+        except AqaraAuthError as err:
+            self._pending_subscriptions = self._normalize_subscriptions([*self._pending_subscriptions, *pending])
+            _LOGGER.warning("Aqara bridge subscription retry skipped because authentication failed: %s", err)
+
+    async def _listen_loop(self, lane: int) -> None:
+        """Keep one SSE stream open, failing over between bridges.
+
+        Each pass ranks the bridges by health and streams from the best one
+        not already used by another lane.  When that stream drops, the next
+        bridge is tried straight away; the loop only backs off once every
+        candidate has failed.  A stream that drops before it was stable counts
+        as a failure, so a flapping bridge cannot keep the loop spinning.
+
+        In active-active mode a lane never probes the bridge the other lane
+        streams from, and a missing second bridge is only reported once.
+        """
         reconnect_delay = 1.0
+        reported_no_spare = False
         while not self._stop_event.is_set():
-            self._connected_event.clear()
-            try:
-                await self._stream_events()
-                was_connected = self._connected_event.is_set()
+            was_connected = False
+            # A bridge another lane streams from is known good; leave it alone.
+            for bridge in await self._rank_bridges(frozenset(self._claimed_bridges)):
+                if self._stop_event.is_set():
+                    break
+                if bridge["url"] in self._claimed_bridges:
+                    continue
+                self._claimed_bridges.add(bridge["url"])
+                try:
+                    was_connected = await self._stream_bridge(bridge)
+                finally:
+                    self._claimed_bridges.discard(bridge["url"])
                 if was_connected:
+                    # The stream was stable; rerank now instead of walking a stale list.
                     reconnect_delay = 1.0
-                if not self._stop_event.is_set():
-                    _LOGGER.warning(
-                        "Aqara bridge SSE stream closed; retrying in %.0f seconds",
-                        reconnect_delay,
-                    )
-            except asyncio.CancelledError:
-                raise
-            except Exception as err:
-                if self._stop_event.is_set():
+                    reported_no_spare = False
                     break
-                _LOGGER.warning(
-                    "Aqara bridge SSE connection failed; retrying in %.0f seconds: %s",
-                    reconnect_delay,
-                    err,
-                )
-
-            # SSE disconnected - re-enable polling as fallback
-            self._connected_event.clear()
-            self._set_polling_enabled(True)
 
             if self._stop_event.is_set():
                 break
+            if was_connected:
+                continue
+            if not self._claimed_bridges:
+                _LOGGER.warning(
+                    "No Aqara bridge SSE stream available for listener %s; retrying in %.0f seconds",
+                    lane + 1,
+                    reconnect_delay,
+                )
+            else:
+                # The other lane is streaming; a missing second bridge is expected while one is down.
+                _LOGGER.log(
+                    logging.DEBUG if reported_no_spare else logging.WARNING,
+                    "No second Aqara bridge available for listener %s; retrying in %.0f seconds",
+                    lane + 1,
+                    reconnect_delay,
+                )
+                reported_no_spare = True
             await asyncio.sleep(reconnect_delay)
             reconnect_delay = min(reconnect_delay * 2, 30.0)
 
-    async def _stream_events(self) -> None:
-        url = f"{self._bridge_url}/events"
+    async def _stream_bridge(self, bridge: dict[str, Any]) -> bool:
+        """Stream from one bridge until it drops; return whether it was stable."""
+        url = bridge["url"]
+        started = time.monotonic()
+        silent_for = 0.0
+        try:
+            await self._stream_events(bridge)
+        except asyncio.CancelledError:
+            raise
+        except AqaraBridgeEventGap as err:
+            _LOGGER.info("Aqara bridge %s cannot resume the SSE stream; reconnecting from scratch: %s", url, err)
+            self._handle_event_gap(bridge)
+            return True
+        except AqaraBridgeStalled as err:
+            _LOGGER.warning("Aqara bridge SSE stream from %s stalled; reconnecting: %s", url, err)
+            silent_for = time.monotonic() - bridge["last_activity"]
+        except Exception as err:
+            if not self._stop_event.is_set():
+                _LOGGER.warning("Aqara bridge SSE connection to %s failed: %s", url, err)
+        else:
+            if not self._stop_event.is_set():
+                _LOGGER.warning("Aqara bridge SSE stream from %s closed", url)
+        finally:
+            connected = url in self._connected_bridges
+            self._connected_bridges.discard(url)
+            if not self._connected_bridges:
+                self._handle_stream_lost(silent_for)
+
+        stable = connected and time.monotonic() - started >= BRIDGE_STABLE_STREAM_SECONDS
+        if stable:
+            bridge["failures"] = 0
+        else:
+            bridge["failures"] += 1
+        return stable
+
+    async def _stream_events(self, bridge: dict[str, Any]) -> None:
+        url = f"{bridge['url']}/events"
         headers = {
             "Accept": "text/event-stream",
             "Authorization": f"Bearer {self._bridge_token}",
         }
+        if bridge["last_event_id"]:
+            headers["Last-Event-ID"] = bridge["last_event_id"]
         timeout = ClientTimeout(total=None, sock_connect=10, sock_read=None)
         async with self._session.get(url, headers=headers, timeout=timeout) as response:
+            if response.status in SSE_EVENT_GAP_STATUSES and bridge["last_event_id"]:
+                body = await response.text()
+                raise AqaraBridgeEventGap(f"bridge answered {response.status}: {body}")
             if response.status != 200:
                 body = await response.text()
                 raise RuntimeError(f"Aqara bridge events connection failed ({response.status}): {body}")
 
-            self._connected_event.set()
-            self._set_polling_enabled(False)
-            _LOGGER.info("Connected to Aqara bridge SSE stream at %s", url)
+            self._connected_bridges.add(bridge["url"])
+            bridge["last_activity"] = time.monotonic()
+            self._handle_stream_connected()
+            _LOGGER.info(
+                "Connected to Aqara bridge SSE stream at %s (resuming after event %s)",
+                url,
+                bridge["last_event_id"] or "none",
+            )
 
-            event_name: str | None = None
-            data_lines: list[str] = []
-            async for raw_line in response.content:
-                if self._stop_event.is_set():
-                    break
+            watchdog_state: dict[str, Any] = {"reason": None}
+            watchdog = self._hass.async_create_background_task(
+                self._watch_stream(bridge, response, watchdog_state),
+                f"Aqara bridge SSE watchdog {bridge['url']}",
+            )
+            try:
+                await self._read_stream(bridge, response)
+            except (ClientError, asyncio.TimeoutError):
+                if watchdog_state["reason"] is None:
+                    raise
+            finally:
+                watchdog.cancel()
+                with suppress(asyncio.CancelledError):
+                    await watchdog
+            if watchdog_state["reason"] is not None:
+                raise AqaraBridgeStalled(watchdog_state["reason"])
+
+    async def _read_stream(self, bridge: dict[str, Any], response: ClientResponse) -> None:
+        event_name: str | None = None
+        event_id: str | None = None
+        data_lines: list[str] = []
+        async for raw_line in response.content:
+            bridge["last_activity"] = time.monotonic()
+            if self._stop_event.is_set():
+                return
 
-                line = raw_line.decode("utf-8").rstrip("\r\n")
-                if not line:
-                    await self._dispatch_sse_event(event_name, data_lines)
-                    event_name = None
-                    data_lines = []
-                    continue
+            line = raw_line.decode("utf-8").rstrip("\r\n")
+            if not line:
+                await self._dispatch_sse_event(bridge, event_name, data_lines)
+                self._remember_event_id(bridge, event_id)
+                event_name = None
+                event_id = None
+                data_lines = []
+                continue
 
-                if line.startswith(":"):
-                    continue
+            if line.startswith(":"):
+                continue
 
-                field, _, value = line.partition(":")
-                value = value.lstrip(" ")
-                if field == "event":
-                    event_name = value
-                elif field == "data":
-                    data_lines.append(value)
+            field, _, value = line.partition(":")
+            value = value.lstrip(" ")
+            if field == "event":
+                event_name = value
+            elif field == "data":
+                data_lines.append(value)
+            elif field == "id" and "\0" not in value:
+                event_id = value
 
-            if event_name or data_lines:
-                await self._dispatch_sse_event(event_name, data_lines)
+        if (event_name or data_lines) and not response.closed:
+            await self._dispatch_sse_event(bridge, event_name, data_lines)
+            self._remember_event_id(bridge, event_id)
 
-    async def _dispatch_sse_event(self, event_name: str | None, data_lines: list[str]) -> None:
-        if event_name in (None, "", "heartbeat") or not data_lines:
-            return
+    async def _watch_stream(
+        self,
+        bridge: dict[str, Any],
+        response: ClientResponse,
+        state: dict[str, Any],
+    ) -> None:
+        """Close a connected stream that went quiet or whose bridge stopped consuming.
 
-        payload = json.loads("\n".join(data_lines))
-        if not isinstance(payload, dict):
-            return
+        Any byte, including heartbeats and SSE comments, counts as activity.  A
+        half-open socket never errors on its own, so silence past the deadline
+        forces a reconnect.  The bridge health is rechecked periodically too,
+        because a stalled RocketMQ consumer keeps the stream open but empty.
+        """
+        next_health_check = time.monotonic() + BRIDGE_HEALTH_RECHECK_SECONDS
+        unhealthy_checks = 0
+        while True:
+            await asyncio.sleep(BRIDGE_WATCHDOG_TICK_SECONDS)
+            now = time.monotonic()
+            idle = now - bridge["last_activity"]
+            if idle >= BRIDGE_READ_IDLE_TIMEOUT_SECONDS:
+                state["reason"] = f"no data or heartbeat for {idle:.0f} seconds"
+                break
+            if now < next_health_check:
+                continue
 
-        payload_type = str(payload.get("type") or event_name or "").strip().lower()
-        if payload_type not in {"snapshot", "batch"}:
-            return
+            next_health_check = now + BRIDGE_HEALTH_RECHECK_SECONDS
+            await self._probe_bridge(bridge)
+            if bridge["healthy"]:
+                unhealthy_checks = 0
+                continue
+            unhealthy_checks += 1
+            _LOGGER.debug(
+                "Aqara bridge %s failed health recheck %s/%s: %s",
+                bridge["url"],
+                unhealthy_checks,
+                BRIDGE_HEALTH_RECHECK_FAILURES,
+                bridge["last_error"],
+            )
+            if unhealthy_checks >= BRIDGE_HEALTH_RECHECK_FAILURES:
+                state["reason"] = f"health check failing: {bridge['last_error']}"
+                break
+        response.close()
+
+    @staticmethod
+    def _remember_event_id(bridge: dict[str, Any], event_id: str | None) -> None:
+        """Track the last SSE event ID so reconnects only replay missed events.
 
-        events = payload.get("events") or []
-        if not isinstance(events, list):
+        Event IDs are local to one bridge, so each bridge keeps its own.
+        """
+        if event_id is None:
             return
+        bridge["last_event_id"] = event_id or None
 
-        self._apply_events(payload_type, events)
+    def _handle_event_gap(self, bridge: dict[str, Any]) -> None:
+        """Forget the stream position and catch up on the events that were lost."""
+        bridge["last_event_id"] = None
+        self._schedule_catch_up("event gap")
 
-    def _apply_events(self, payload_type: str, events: list[Any]) -> None:
-        pending_updates: dict[tuple[str, ...], tuple[DataUpdateCoordinator, dict[str, Any]]] = {}
-        for raw_event in events:
-            if isinstance(raw_event, dict):
-                self._handle_message(payload_type, raw_event, pending_updates)
+    def _cancel_pending_polling_fallback(self) -> None:
+        if self._cancel_polling_fallback is not None:
+            self._cancel_polling_fallback()
+            self._cancel_polling_fallback = None
 
-        for coordinator, state in pending_updates.values():
-            coordinator.async_set_updated_data(dict(state))
+    def _handle_stream_lost(self, silent_for: float = 0.0) -> None:
+        """Record the disconnect and only fall back to polling if it lasts.
 
-    def _handle_message(
-        self,
-        payload_type: str,
-        payload: dict[str, Any],
-        pending_updates: dict[tuple[str, ...], tuple[DataUpdateCoordinator, dict[str, Any]]],
-    ) -> None:
-        did = str(payload.get("subjectId") or "")
-        if not did:
+        silent_for is how long the stream had already been delivering
+        nothing before it was dropped; that time counts towards the delay.
+        """
+        if self._polling_enabled:
             return
-        if int(payload.get("statusCode", 0) or 0) != 0:
+        if self._disconnected_at is None:
+            self._disconnected_at = time.time() - silent_for
+        if self._cancel_polling_fallback is not None:
+            return
+        remaining = BRIDGE_POLLING_FALLBACK_DELAY_SECONDS - (time.time() - self._disconnected_at)
+        if remaining <= 0:
+            _LOGGER.warning(
+                "Aqara bridge SSE stream delivered nothing for %.0f seconds; enabling polling fallback",
+                time.time() - self._disconnected_at,
+            )
+            self._set_polling_enabled(True)
             return
 
-        resource_id = str(payload.get("resourceId") or "")
-        if not resource_id:
+        @callback
+        def _enable_polling_fallback(_now) -> None:
+            self._cancel_polling_fallback = None
+            _LOGGER.warning(
+                "Aqara bridge SSE stream has been down for %s seconds; enabling polling fallback",
+                BRIDGE_POLLING_FALLBACK_DELAY_SECONDS,
+            )
+            self._set_polling_enabled(True)
+
+        self._cancel_polling_fallback = async_call_later(
+            self._hass,
+            remaining,
+            _enable_polling_fallback,
+        )
+
+    def add_devices(self, dids: set[str]) -> None:
+        """Route events of devices added to the device index after setup.
+
+        Subscriptions follow through async_update_subscriptions.
+        """
+        self._known_subjects = frozenset(record["did"] for record in self._device_index)
+
+    def remove_devices(self, dids: set[str]) -> None:
+        for did in dids:
+            self._device_state.pop(did, None)
+            self._presence_state.pop(did, None)
+        self._known_subjects = frozenset(record["did"] for record in self._device_index)
+
+    def note_restored_state(self, saved_at: float) -> None:
+        """Record that coordinators start from state saved at saved_at.
+
+        The first stream connection then counts as the end of an outage that
+        began at saved_at and runs the usual catch-up query.
+        """
+        self._restored_state_at = saved_at
+
+    def _handle_stream_connected(self) -> None:
+        self._cancel_pending_polling_fallback()
+        self._set_polling_enabled(False)
+        self._async_subscription_retry_tick()
+        self._liveness.start_window(time.time())
+        disconnected_at = self._disconnected_at
+        self._disconnected_at = None
+        self._restored_state_at = None
+        if disconnected_at is not None:
+            self._schedule_catch_up(f"{time.time() - disconnected_at:.0f}s outage")
+
+    def _catch_up_resources(self) -> list[dict[str, Any]]:
+        resources: list[dict[str, Any]] = []
+        for subscription in self._subscriptions:
+            resource_ids = [
+                resource_id
+                for resource_id in subscription["resourceIds"]
+                if resource_id not in RESYNC_SKIPPED_RESOURCE_IDS
+            ]
+            if resource_ids:
+                resources.append({"subjectId": subscription["subjectId"], "resourceIds": resource_ids})
+        return resources
+
+    def _schedule_catch_up(self, reason: str) -> None:
+        if self._catch_up_task is not None and not self._catch_up_task.done():
             return
+        self._catch_up_task = self._hass.async_create_background_task(
+            self._async_catch_up(reason),
+            "Aqara bridge SSE catch-up",
+        )
 
-        if did in self._cameras:
-            self._handle_g3_message(payload_type, did, resource_id, payload.get("value"), pending_updates)
+    async def _async_catch_up(self, reason: str) -> None:
+        """Query the current value of every subscribed resource in one batched pass."""
+        resources = self._catch_up_resources()
+        if not resources:
             return
 
-        if did in self._g2h_pro_cameras:
-            self._handle_shared_device_message(
-                payload_type,
-                did,
-                resource_id,
-                payload.get("value"),
-                self._g2h_pro_coordinators,
-                self._g2h_pro_state,
-                G2H_PRO_RESOURCE_SPEC_MAP,
-                pending_updates,
-                apply_scale=True,
+        _LOGGER.info(
+            "Aqara bridge catching up after %s: %s device(s), %s resource(s)",
+            reason,
+            len(resources),
+            sum(len(item["resourceIds"]) for item in resources),
+        )
+        subject_count = len({item["subjectId"] for item in resources})
+        for attempt in range(1, BRIDGE_CATCH_UP_ATTEMPTS + 1):
+            try:
+                items, failures = await self._api.query_resource_values(resources)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                error: Any = err
+            else:
+                # Retry only when no device answered; the others catch up with their next push or poll.
+                if len(failures) < subject_count:
+                    break
+                error = next(iter(failures.values()))
+            if attempt == BRIDGE_CATCH_UP_ATTEMPTS:
+                _LOGGER.warning("Aqara bridge catch-up query failed; enabling polling fallback: %s", error)
+                self._set_polling_enabled(True)
+                return
+            _LOGGER.debug("Aqara bridge catch-up attempt %s failed: %s", attempt, error)
+            await asyncio.sleep(attempt * 5)
+        if failures:
+            _LOGGER.warning(
+                "Aqara bridge catch-up could not query %s device(s): %s",
+                len(failures),
+                ", ".join(sorted(failures)),
             )
+        # Queue behind stream events that are still pending so they cannot overwrite the snapshot.
+        self._ingest.put("snapshot", items)
+
+    def _record_events(self, events: list[Any]) -> None:
+        """Append state-carrying events to the journal so a restart can replay them."""
+        if self._journal is None:
             return
+        for event in events:
+            if not isinstance(event, dict) or int(event.get("statusCode", 0) or 0) != 0:
+                continue
+            subject_id = str(event.get("subjectId") or "")
+            resource_id = str(event.get("resourceId") or "")
+            if not subject_id or not resource_id or resource_id in RESYNC_SKIPPED_RESOURCE_IDS:
+                continue
+            self._journal.append(subject_id, resource_id, event.get("value"), event.get("time"))
 
-        if did in self._g410_doorbells:
-            self._handle_shared_device_message(
-                payload_type,
+    def _note_device_activity(self, events: list[Any]) -> None:
+        now = time.time()
+        for event in events:
+            if not isinstance(event, dict) or int(event.get("statusCode", 0) or 0) != 0:
+                continue
+            subject_id = str(event.get("subjectId") or "")
+            if not subject_id:
+                continue
+            self._poll_scheduler.note_push(subject_id)
+            if self._sweeper is not None:
+                self._sweeper.note_push(subject_id)
+            if self._liveness.record(subject_id, now):
+                _LOGGER.info("Aqara push resumed for %s; stopping its individual polling", subject_id)
+
+    @callback
+    def _async_liveness_tick(self, _now) -> None:
+        """Poll devices whose push went quiet while the stream itself stays up.
+
+        Global polling covers everything while the stream is down, so only
+        connected periods are checked here.
+        """
+        if self._polling_enabled or not self._connected_bridges or self._sweeper is None:
+            return
+        now = time.time()
+        newly_quiet, quiet = self._liveness.update_quiet(
+            (subscription["subjectId"] for subscription in self._subscriptions),
+            now,
+        )
+        for did in newly_quiet:
+            _LOGGER.info(
+                "Aqara push quiet for %s (%.0f seconds, expected within %.0f); polling it individually",
                 did,
-                resource_id,
-                payload.get("value"),
-                self._g410_coordinators,
-                self._g410_state,
-                G410_RESOURCE_SPEC_MAP,
-                pending_updates,
-                apply_scale=True,
+                self._liveness.silence(did, now),
+                self._liveness.threshold(did),
             )
+        if not quiet or (self._quiet_poll_task is not None and not self._quiet_poll_task.done()):
             return
-
-        if did in self._g4_doorbells:
-            self._handle_shared_device_message(
-                payload_type,
-                did,
-                resource_id,
-                payload.get("value"),
-                self._g4_coordinators,
-                self._g4_state,
-                G4_RESOURCE_SPEC_MAP,
-                pending_updates,
-                apply_scale=True,
+        due = self._liveness.due_for_poll(quiet, now, BRIDGE_SANITY_INTERVAL_SECONDS)
+        if due:
+            self._quiet_poll_task = self._hass.async_create_background_task(
+                self._async_poll_quiet_devices(due),
+                "Aqara quiet device poll",
             )
+
+    async def _async_poll_quiet_devices(self, dids: list[str]) -> None:
+        try:
+            await self._sweeper.async_sweep_devices(dids)
+        except AqaraAuthError as err:
+            _LOGGER.warning("Aqara quiet device poll skipped because authentication failed: %s", err)
+
+    async def async_replay_journal(self, newer_than: float | None = None) -> None:
+        """Seed coordinator state from the journal before the first poll completes.
+
+        Only events journaled after newer_than are replayed; older ones are
+        already part of state restored from a save made at that time.
+        """
+        if self._journal is None:
             return
+        entries = await self._hass.async_add_executor_job(self._journal.read_entries)
+        if newer_than is not None:
+            entries = [entry for entry in entries if entry["received_at"] > newer_than]
+        if not entries:
+            return
+        self._apply_events("snapshot", entries)
+        _LOGGER.info("Replayed %s journaled Aqara push event(s)", len(entries))
 
-        if did in self._hubs_m3:
-            self._handle_shared_device_message(
-                payload_type,
-                did,
-                resource_id,
-                payload.get("value"),
-                self._m3_coordinators,
-                self._m3_state,
-                M3_RESOURCE_SPEC_MAP,
-                pending_updates,
-                apply_scale=True,
-            )
+    async def _dispatch_sse_event(
+        self,
+        bridge: dict[str, Any],
+        event_name: str | None,
+        data_lines: list[str],
+    ) -> None:
+        if event_name in (None, "", "heartbeat") or not data_lines:
             return
 
-        if did in self._hubs_m100:
-            self._handle_shared_device_message(
-                payload_type,
-                did,
-                resource_id,
-                payload.get("value"),
-                self._m100_coordinators,
-                self._m100_state,
-                M100_RESOURCE_SPEC_MAP,
-                pending_updates,
-                apply_scale=True,
+        text = "\n".join(data_lines)
+        # The threshold is in UTF-8 bytes; isascii() is constant time and spares
+        # encoding the usual all-ASCII payload just to measure it.
+        size = len(text) if text.isascii() else len(text.encode())
+        if size >= SSE_EXECUTOR_DECODE_BYTES:
+            # Large fleet snapshots would block the loop; the reader waits for the
+            # result before reading the next frame, so event order is unchanged.
+            decoded = await self._hass.async_add_executor_job(
+                _decode_sse_payload,
+                event_name,
+                text,
+                self._known_subjects,
             )
+        else:
+            decoded = _decode_sse_payload(event_name, text, self._known_subjects)
+        if decoded is None:
             return
 
-        if did in self._hubs_m200:
-            self._handle_shared_device_message(
-                payload_type,
-                did,
-                resource_id,
-                payload.get("value"),
-                self._m200_coordinators,
-                self._m200_state,
-                M200_RESOURCE_SPEC_MAP,
-                pending_updates,
-                apply_scale=True,
-            )
+        payload_type, events = decoded
+        if payload_type in SSE_EVENT_GAP_TYPES:
+            _LOGGER.info("Aqara bridge reported an SSE event gap: %s", events)
+            self._handle_event_gap(bridge)
             return
 
-        if did in self._a100_pro_locks:
-            self._handle_shared_device_message(
-                payload_type,
-                did,
-                resource_id,
-                payload.get("value"),
-                self._a100_pro_coordinators,
-                self._a100_pro_state,
-                A100_PRO_RESOURCE_SPEC_MAP,
-                pending_updates,
-                apply_scale=True,
-            )
+        if len(self._bridges) > 1:
+            events = [event for event in events if not self._is_duplicate_event(event)]
+        self._ingest.put(payload_type, events)
+
+    def _is_duplicate_event(self, event: Any) -> bool:
+        """Drop events already delivered by another bridge.
+
+        During a switchover (and all the time in active-active mode) two
+        bridges can deliver the same RocketMQ message.  Events are matched on
+        subject, resource, value and the device timestamp; events without a
+        timestamp cannot be told apart from a genuine repeat and always pass.
+        """
+        if not isinstance(event, dict) or event.get("time") in (None, ""):
+            return False
+        fingerprint = (
+            str(event.get("subjectId") or ""),
+            str(event.get("resourceId") or ""),
+            json.dumps(event.get("value"), sort_keys=True, default=str),
+            str(event.get("time")),
+        )
+        if fingerprint in self._recent_events:
+            self._recent_events.move_to_end(fingerprint)
+            return True
+        self._recent_events[fingerprint] = None
+        if len(self._recent_events) > BRIDGE_EVENT_DEDUP_WINDOW:
+            self._recent_events.popitem(last=False)
+        return False
+
+    async def _dispatch_loop(self) -> None:
+        """Apply queued events so slow coordinator updates never hold up socket reads."""
+        while True:
+            batches = await self._ingest.get_all()
+            try:
+                for payload_type, events in batches:
+                    self._record_events(events)
+                    if payload_type != "snapshot":
+                        self._note_device_activity(events)
+                self._apply_batches(batches)
+            except Exception:
+                _LOGGER.exception("Failed to apply Aqara bridge events")
+
+    def _apply_events(self, payload_type: str, events: list[Any]) -> None:
+        self._apply_batches([(payload_type, events)])
+
+    def _apply_batches(self, batches: list[tuple[str, list[Any]]]) -> None:
+        """Apply batches in order, flushing each touched coordinator once."""
+        pending_updates: dict[tuple[str, ...], tuple[DataUpdateCoordinator, dict[str, Any]]] = {}
+        for payload_type, events in batches:
+            for raw_event in events:
+                if isinstance(raw_event, dict):
+                    self._handle_message(payload_type, raw_event, pending_updates)
+
+        for coordinator, state in pending_updates.values():
+            coordinator.async_set_updated_data(dict(state))
+
+    def _handle_message(
+        self,
+        payload_type: str,
+        payload: dict[str, Any],
+        pending_updates: dict[tuple[str, ...], tuple[DataUpdateCoordinator, dict[str, Any]]],
+    ) -> None:
+        did = str(payload.get("subjectId") or "")
+        if not did:
+            return
+        if int(payload.get("statusCode", 0) or 0) != 0:
+            return
+
+        resource_id = str(payload.get("resourceId") or "")
+        if not resource_id:
             return
 
-        if did in self._acn002_locks:
+        record = self._device_index.get(did)
+        if record is None:
+            return
+        profile = record["profile"]
+        if profile["family"] == "cameras":
+            self._handle_g3_message(payload_type, did, resource_id, payload.get("value"), pending_updates)
+        elif "resource_spec_map" in profile:
             self._handle_shared_device_message(
                 payload_type,
                 did,
                 resource_id,
                 payload.get("value"),
-                self._acn002_coordinators,
-                self._acn002_state,
-                ACN002_RESOURCE_SPEC_MAP,
+                record["coordinators"].get(DEVICE_STATE_GROUP),
+                profile["resource_spec_map"],
                 pending_updates,
                 apply_scale=True,
             )
-            return
-
-        device = self._presence_devices.get(did)
-        if device is None:
-            return
-        model = str(device.get("model") or "")
-        if model == FP2_MODEL:
-            self._handle_grouped_presence_message(
+        elif resource_id in profile.get("zone_slots", ()):
+            self._handle_fp2_zone_message(
                 payload_type,
                 did,
                 resource_id,
                 payload.get("value"),
-                FP2_GROUP_SPEC_MAPS,
+                profile["zone_slots"][resource_id][0],
                 pending_updates,
             )
-        elif model == FP300_MODEL:
+        elif "group_spec_maps" in profile:
             self._handle_grouped_presence_message(
                 payload_type,
                 did,
                 resource_id,
                 payload.get("value"),
-                FP300_GROUP_SPEC_MAPS,
+                profile["group_spec_maps"],
                 pending_updates,
             )
 
@@ -570,19 +1231,19 @@ class AqaraBridgePushManager:
             gesture_key = G3_GESTURE_VALUE_MAP.get(str(value))
             if gesture_key is None:
                 return
-            coordinator = self._camera_coordinators.get(did)
+            coordinator = self._device_index.coordinator(did)
             if coordinator is None:
                 return
             flush_key = ("device", did, coordinator.name)
             state = self._base_state(
                 payload_type,
                 flush_key,
-                self._camera_state.get(did),
+                self._device_state.get(did),
                 coordinator,
                 pending_updates,
             )
             state[gesture_key] = time.time()
-            self._camera_state[did] = state
+            self._device_state[did] = state
             self._queue_state_update(flush_key, coordinator, state, pending_updates)
             return
 
@@ -591,8 +1252,7 @@ class AqaraBridgePushManager:
             did,
             resource_id,
             value,
-            self._camera_coordinators,
-            self._camera_state,
+            self._device_index.coordinator(did),
             G3_RESOURCE_SPEC_MAP,
             pending_updates,
             apply_scale=True,
@@ -604,8 +1264,7 @@ class AqaraBridgePushManager:
         did: str,
         resource_id: str,
         value: Any,
-        coordinators: dict[str, DataUpdateCoordinator],
-        cache: dict[str, dict[str, Any]],
+        coordinator: DataUpdateCoordinator | None,
         resource_specs: dict[str, dict[str, Any]],
         pending_updates: dict[tuple[str, ...], tuple[DataUpdateCoordinator, dict[str, Any]]],
         *,
@@ -619,7 +1278,6 @@ class AqaraBridgePushManager:
         if not key:
             return
 
-        coordinator = coordinators.get(did)
         if coordinator is None:
             return
 
@@ -627,7 +1285,7 @@ class AqaraBridgePushManager:
         state = self._base_state(
             payload_type,
             flush_key,
-            cache.get(did),
+            self._device_state.get(did),
             coordinator,
             pending_updates,
         )
@@ -635,7 +1293,43 @@ class AqaraBridgePushManager:
         if spec.get("value_type") != "event" and key in state and state[key] == new_value:
             return
         state[key] = new_value
-        cache[did] = state
+        self._device_state[did] = state
+        self._queue_state_update(flush_key, coordinator, state, pending_updates)
+
+    def _handle_fp2_zone_message(
+        self,
+        payload_type: str,
+        did: str,
+        resource_id: str,
+        value: Any,
+        group: str,
+        pending_updates: dict[tuple[str, ...], tuple[DataUpdateCoordinator, dict[str, Any]]],
+    ) -> None:
+        coordinator = self._device_index.coordinator(did, group)
+        if coordinator is None:
+            return
+
+        flush_key = ("presence", did, group)
+        group_state_cache = self._presence_state.setdefault(did, {}).setdefault(group, {})
+        coordinator_state = coordinator.data if isinstance(coordinator.data, dict) and coordinator.data else None
+        state = self._base_state(
+            payload_type,
+            flush_key,
+            group_state_cache or coordinator_state,
+            coordinator,
+            pending_updates,
+        )
+        zones = state.get(FP2_ZONES_KEY)
+        # Zones already published to the coordinator are copied once; later
+        # events of the same batch decode into that copy in place.
+        if not isinstance(zones, AqaraFP2Zones):
+            zones = AqaraFP2Zones()
+        elif zones is (coordinator_state or {}).get(FP2_ZONES_KEY):
+            zones = zones.copy()
+        if not zones.set(resource_id, value):
+            return
+        state[FP2_ZONES_KEY] = zones
+        self._presence_state[did][group] = state
         self._queue_state_update(flush_key, coordinator, state, pending_updates)
 
     def _handle_grouped_presence_message(
@@ -656,7 +1350,7 @@ class AqaraBridgePushManager:
             if not key:
                 return
 
-            coordinator = self._presence_coordinators.get(did, {}).get(group)
+            coordinator = self._device_index.coordinator(did, group)
             if coordinator is None:
                 return
 
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable
+import zlib
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import POLL_BACKOFF_JITTER, POLL_BACKOFF_MAX_SECONDS, POLL_MAX_CONCURRENCY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _did_jitter(did: str, label: str) -> float:
+    """Return a deterministic fraction in [0, 1) for a coordinator."""
+    return zlib.crc32(f"{did}:{label}".encode()) / 0x100000000
+
+
+def backoff_seconds(interval_seconds: float, failures: int) -> float:
+    """Return the poll interval after failures failed polls in a row.
+
+    The interval doubles per failure up to POLL_BACKOFF_MAX_SECONDS and is
+    then shortened by up to POLL_BACKOFF_JITTER, so devices that reached the
+    cap do not all retry in lockstep.
+    """
+    backoff = min(interval_seconds * 2 ** min(failures, 32), POLL_BACKOFF_MAX_SECONDS)
+    return backoff * random.uniform(1 - POLL_BACKOFF_JITTER, 1)
+
+
+class AqaraPollScheduler:
+    """Spread coordinator polling across the interval instead of firing in lockstep.
+
+    Coordinators managed by the bridge push manager only poll while polling is
+    enabled.  Each one gets its own phase inside the interval: coordinators are
+    ordered by a hash of their did and spaced evenly, then nudged by a
+    deterministic per-did jitter inside their slot.  All fetches share one
+    concurrency cap, and startup refreshes run in priority order.
+
+    Consecutive failed polls stretch a coordinator's interval exponentially,
+    with jitter, up to POLL_BACKOFF_MAX_SECONDS.  A successful poll or a
+    pushed event for the device restores the normal interval.  Devices
+    polled by the fleet sweep back off inside AqaraFleetSweeper instead,
+    since the sweep coordinator itself is shared by the whole entry.
+    """
+
+    def __init__(self, hass: HomeAssistant, *, max_concurrency: int = POLL_MAX_CONCURRENCY) -> None:
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._entries: list[dict[str, Any]] = []
+        self._entries_by_did: dict[str, list[dict[str, Any]]] = {}
+        self._pending: dict[int, Callable[[], None]] = {}
+        self._polling_enabled = True
+        self._started = False
+
+    def register(
+        self,
+        coordinator: DataUpdateCoordinator,
+        did: str,
+        label: str,
+        interval_seconds: int,
+        priority: int,
+        *,
+        push_managed: bool = True,
+    ) -> None:
+        entry = {
+            "coordinator": coordinator,
+            "did": did,
+            "label": label,
+            "interval": interval_seconds,
+            "priority": priority,
+            "push_managed": push_managed,
+            "jitter": _did_jitter(did, label),
+            "startup_refresh": True,
+            "failures": 0,
+            "backoff": None,
+        }
+        self._entries.append(entry)
+        self._entries_by_did.setdefault(did, []).append(entry)
+        if push_managed:
+            # Polling is armed per coordinator once its phase comes up.
+            coordinator.update_interval = None
+
+    def unregister_devices(self, dids: set[str]) -> None:
+        for did in dids:
+            for entry in self._entries_by_did.pop(did, ()):
+                cancel = self._pending.pop(id(entry["coordinator"]), None)
+                if cancel is not None:
+                    cancel()
+        self._entries = [entry for entry in self._entries if entry["did"] not in dids]
+
+    def defer_startup_refresh(self, coordinator: DataUpdateCoordinator) -> None:
+        """Leave a coordinator out of the startup refresh; it waits for its polling phase."""
+        for entry in self._entries:
+            if entry["coordinator"] is coordinator:
+                entry["startup_refresh"] = False
+
+    def record_poll_result(self, did: str, label: str, success: bool) -> None:
+        """Update the failure streak of a coordinator and stretch or restore its interval."""
+        for entry in self._entries_by_did.get(did, ()):
+            if entry["label"] != label:
+                continue
+            if success:
+                self._reset_backoff(entry)
+                continue
+            entry["failures"] += 1
+            entry["backoff"] = backoff_seconds(entry["interval"], entry["failures"])
+            coordinator = entry["coordinator"]
+            # A disarmed coordinator stays disarmed; the backoff applies once it is armed again.
+            if coordinator.update_interval is not None:
+                coordinator.update_interval = timedelta(seconds=entry["backoff"])
+            _LOGGER.debug(
+                "Aqara %s poll for %s failed %s time(s) in a row; next poll in %.0f seconds",
+                label,
+                did,
+                entry["failures"],
+                entry["backoff"],
+            )
+
+    @callback
+    def note_push(self, did: str) -> None:
+        """A pushed event proves the device is reachable; end any backoff for it."""
+        for entry in self._entries_by_did.get(did, ()):
+            if entry["failures"]:
+                self._reset_backoff(entry)
+
+    def diagnostics(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "did": entry["did"],
+                "label": entry["label"],
+                "interval_seconds": entry["interval"],
+                "failures": entry["failures"],
+                "backoff_seconds": None if entry["backoff"] is None else round(entry["backoff"], 1),
+            }
+            for entry in self._entries
+        ]
+
+    def _reset_backoff(self, entry: dict[str, Any]) -> None:
+        entry["failures"] = 0
+        if entry["backoff"] is None:
+            return
+        entry["backoff"] = None
+        coordinator = entry["coordinator"]
+        if coordinator.update_interval is not None:
+            coordinator.update_interval = timedelta(seconds=entry["interval"])
+
+    def limited(
+        self,
+        fetch_method: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> Callable[[], Awaitable[dict[str, Any]]]:
+        """Wrap a fetch method so it runs under the shared concurrency cap."""
+
+        async def _limited_fetch() -> dict[str, Any]:
+            async with self._semaphore:
+                return await fetch_method()
+
+        return _limited_fetch
+
+    async def async_start(self) -> None:
+        """Refresh every coordinator once, highest priority first, then arm polling."""
+        ordered = sorted(
+            (entry for entry in self._entries if entry["startup_refresh"]),
+            key=lambda entry: (entry["priority"], entry["jitter"]),
+        )
+        # Tasks queue on the shared semaphore in creation order, so priority holds.
+        tasks = [
+            self._hass.async_create_task(entry["coordinator"].async_refresh())
+            for entry in ordered
+        ]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._started = True
+        if self._polling_enabled:
+            self._arm_polling()
+
+    def set_polling_enabled(self, enabled: bool) -> None:
+        self._polling_enabled = enabled
+        if not self._started:
+            return
+        if enabled:
+            self._arm_polling()
+        else:
+            self._disarm_polling()
+
+    @callback
+    def async_shutdown(self) -> None:
+        self._disarm_polling()
+        self._started = False
+
+    def _phases(self) -> dict[int, float]:
+        """Return the polling phase (seconds into the interval) per managed coordinator."""
+        managed = sorted(
+            (entry for entry in self._entries if entry["push_managed"]),
+            key=lambda entry: entry["jitter"],
+        )
+        slot_count = len(managed)
+        phases: dict[int, float] = {}
+        for index, entry in enumerate(managed):
+            slot = entry["interval"] / slot_count
+            # Use the low bits of the hash for the offset inside the slot.
+            offset = (entry["jitter"] * slot_count) % 1.0
+            phases[id(entry["coordinator"])] = (index + offset) * slot
+        return phases
+
+    def _arm_polling(self) -> None:
+        self._disarm_polling()
+        now = time.time()
+        phases = self._phases()
+        for entry in self._entries:
+            if not entry["push_managed"]:
+                continue
+            coordinator = entry["coordinator"]
+            interval = entry["interval"]
+            delay = (phases[id(coordinator)] - now % interval) % interval
+            self._pending[id(coordinator)] = async_call_later(
+                self._hass,
+                delay,
+                self._activation(entry),
+            )
+        _LOGGER.debug("Aqara polling armed for %s coordinator(s)", len(self._pending))
+
+    def _activation(self, entry: dict[str, Any]):
+        coordinator = entry["coordinator"]
+
+        @callback
+        def _activate(_now) -> None:
+            self._pending.pop(id(coordinator), None)
+            if not self._polling_enabled:
+                return
+            coordinator.update_interval = timedelta(seconds=entry["backoff"] or entry["interval"])
+            self._hass.async_create_task(coordinator.async_refresh())
+
+        return _activate
+
+    def _disarm_polling(self) -> None:
+        for cancel in self._pending.values():
+            cancel()
+        self._pending.clear()
+        for entry in self._entries:
+            if entry["push_managed"]:
+                entry["coordinator"].update_interval = None
@@ -1,12 +1,12 @@
 from __future__ import annotations
+from functools import partial
 from typing import Any, Dict
 import logging
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.select import SelectEntity
 from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
     DataUpdateCoordinator,
 )
 
@@ -22,6 +22,9 @@ from .const import (
     M3_DEVICE_LABEL,
 )
 from .device_info import build_device_info
+from .entity import AqaraCoordinatorEntity
+from .device_index import AqaraDeviceIndex
+from .discovery import async_listen_devices_added
 from .selects import (
     FP300_SELECTS_DEF,
     G410_SELECTS_DEF,
@@ -35,20 +38,19 @@ _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
-    data = hass.data[DOMAIN][entry.entry_id]
+    _add_entities(hass.data[DOMAIN][entry.entry_id], async_add_entities)
+    async_listen_devices_added(hass, entry, partial(_add_entities, async_add_entities=async_add_entities))
+
+
+def _add_entities(data: dict, async_add_entities) -> None:
     api: AqaraApi = data["api"]
-    g410_doorbells: list[dict] = data.get("g410_doorbells", [])
-    g4_doorbells: list[dict] = data.get("g4_doorbells", [])
-    hubs_m3: list[dict] = data.get("hubs_m3", [])
-    hubs_m100: list[dict] = data.get("hubs_m100", [])
-    hubs_m200: list[dict] = data.get("hubs_m200", [])
-    presence_devices: list[dict] = data.get("presence_devices", [])
-    g410_coordinators: dict[str, DataUpdateCoordinator] = data.get("g410_coordinators", {})
-    g4_coordinators: dict[str, DataUpdateCoordinator] = data.get("g4_coordinators", {})
-    m3_coordinators: dict[str, DataUpdateCoordinator] = data.get("m3_coordinators", {})
-    m100_coordinators: dict[str, DataUpdateCoordinator] = data.get("m100_coordinators", {})
-    m200_coordinators: dict[str, DataUpdateCoordinator] = data.get("m200_coordinators", {})
-    presence_coordinators: dict[str, dict[str, DataUpdateCoordinator]] = data.get("presence_coordinators", {})
+    device_index: AqaraDeviceIndex = data["device_index"]
+    g410_doorbells: list[dict] = device_index.devices("g410_doorbells")
+    g4_doorbells: list[dict] = device_index.devices("g4_doorbells")
+    hubs_m3: list[dict] = device_index.devices("hubs_m3")
+    hubs_m100: list[dict] = device_index.devices("hubs_m100")
+    hubs_m200: list[dict] = device_index.devices("hubs_m200")
+    presence_devices: list[dict] = device_index.devices("presence_devices")
 
     entities: list[SelectEntity] = []
 
@@ -56,7 +58,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = doorbell["did"]
         name = doorbell["deviceName"]
         model = doorbell["model"]
-        coordinator = g410_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -76,7 +78,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = doorbell["did"]
         name = doorbell["deviceName"]
         model = doorbell["model"]
-        coordinator = g4_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -96,7 +98,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m3_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -116,7 +118,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m100_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -136,7 +138,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m200_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -159,7 +161,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         if model != FP300_MODEL:
             continue
 
-        device_coordinators = presence_coordinators.get(did)
+        device_coordinators = device_index.coordinators(did)
         if not device_coordinators:
             continue
         coordinator = device_coordinators.get("slow")
@@ -181,7 +183,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities(entities)
 
 
-class AqaraSelect(CoordinatorEntity, SelectEntity):
+class AqaraSelect(AqaraCoordinatorEntity, SelectEntity):
     _attr_has_entity_name = True
 
     def __init__(
@@ -214,15 +216,13 @@ class AqaraSelect(CoordinatorEntity, SelectEntity):
         self._option_by_value = {value: slug for value, slug in option_pairs}
         self._value_by_option = {slug: value for value, slug in option_pairs}
         self._attr_options = [slug for _, slug in option_pairs]
+        self._compute_state()
 
     @property
     def device_info(self):
         return build_device_info(self._did, self._device_name, self._model, self._device_label)
 
-    @property
-    def current_option(self) -> str | None:
-        data = self.coordinator.data or {}
-        raw = data.get(self._spec["inApp"])
+    def _option_for(self, raw: Any) -> str | None:
         if raw is None:
             return None
         option = self._option_by_value.get(raw)
@@ -233,6 +233,15 @@ class AqaraSelect(CoordinatorEntity, SelectEntity):
         except Exception:
             return None
 
+    def _compute_state(self) -> None:
+        data = self.coordinator.data or {}
+        self._attr_current_option = self._option_for(data.get(self._spec["inApp"]))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._compute_state()
+        super()._handle_coordinator_update()
+
     async def async_select_option(self, option: str) -> None:
         value = self._value_by_option.get(option)
         if value is None:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import Any, Dict
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import PERCENTAGE
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -28,8 +30,11 @@ from .const import (
     U200_DEVICE_LABEL,
 )
 from .device_info import build_device_info
-from .fp300 import FP300_SENSOR_SPECS
-from .fp2 import FP2_SENSOR_SPECS
+from .entity import AqaraCoordinatorEntity
+from .fp300 import FP300_OCCUPANCY_SENSORS_DEF, FP300_SENSOR_SPECS
+from .fp2 import FP2_OCCUPANCY_SENSORS_DEF, FP2_SENSOR_SPECS
+from .fp2_zones import zone_reader
+from .occupancy import AqaraOccupancyAnalytics
 from .sensors import (
     A100_PRO_SENSORS_DEF,
     ACN002_SENSORS_DEF,
@@ -39,28 +44,28 @@ from .sensors import (
     M3_SENSORS_DEF,
 )
 from .u200 import U200_SENSORS_DEF
+from .device_index import AqaraDeviceIndex
+from .discovery import async_listen_devices_added
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
-    data = hass.data[DOMAIN][entry.entry_id]
-    g410_doorbells: list[dict] = data.get("g410_doorbells", [])
-    g4_doorbells: list[dict] = data.get("g4_doorbells", [])
-    hubs_m3: list[dict] = data.get("hubs_m3", [])
-    hubs_m100: list[dict] = data.get("hubs_m100", [])
-    a100_pro_locks: list[dict] = data.get("a100_pro_locks", [])
-    acn002_locks: list[dict] = data.get("acn002_locks", [])
-    presence_devices: list[dict] = data.get("presence_devices", [])
-    u200_locks: list[dict] = data.get("u200_locks", [])
-    g410_coordinators: dict[str, DataUpdateCoordinator] = data.get("g410_coordinators", {})
-    g4_coordinators: dict[str, DataUpdateCoordinator] = data.get("g4_coordinators", {})
-    m3_coordinators: dict[str, DataUpdateCoordinator] = data.get("m3_coordinators", {})
-    m100_coordinators: dict[str, DataUpdateCoordinator] = data.get("m100_coordinators", {})
-    a100_pro_coordinators: dict[str, DataUpdateCoordinator] = data.get("a100_pro_coordinators", {})
-    acn002_coordinators: dict[str, DataUpdateCoordinator] = data.get("acn002_coordinators", {})
-    presence_coordinators: dict[str, dict[str, DataUpdateCoordinator]] = data.get("presence_coordinators", {})
-    u200_coordinators: dict[str, DataUpdateCoordinator] = data.get("u200_coordinators", {})
+    _add_entities(hass.data[DOMAIN][entry.entry_id], async_add_entities)
+    async_listen_devices_added(hass, entry, partial(_add_entities, async_add_entities=async_add_entities))
+
+
+def _add_entities(data: dict, async_add_entities) -> None:
+    device_index: AqaraDeviceIndex = data["device_index"]
+    occupancy: AqaraOccupancyAnalytics | None = data.get("occupancy")
+    g410_doorbells: list[dict] = device_index.devices("g410_doorbells")
+    g4_doorbells: list[dict] = device_index.devices("g4_doorbells")
+    hubs_m3: list[dict] = device_index.devices("hubs_m3")
+    hubs_m100: list[dict] = device_index.devices("hubs_m100")
+    a100_pro_locks: list[dict] = device_index.devices("a100_pro_locks")
+    acn002_locks: list[dict] = device_index.devices("acn002_locks")
+    presence_devices: list[dict] = device_index.devices("presence_devices")
+    u200_locks: list[dict] = device_index.devices("u200_locks")
 
     entities: list[SensorEntity] = []
 
@@ -68,7 +73,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = doorbell["did"]
         name = doorbell["deviceName"]
         model = doorbell["model"]
-        coordinator = g410_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -88,7 +93,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = doorbell["did"]
         name = doorbell["deviceName"]
         model = doorbell["model"]
-        coordinator = g4_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -108,7 +113,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m3_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -128,7 +133,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m100_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -148,7 +153,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = lock["did"]
         name = lock["deviceName"]
         model = lock["model"]
-        coordinator = a100_pro_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -170,7 +175,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = lock["did"]
         name = lock["deviceName"]
         model = lock["model"]
-        coordinator = acn002_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -192,14 +197,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         model = presence.get("model") or ""
         if model == FP2_MODEL:
             specs = FP2_SENSOR_SPECS
+            occupancy_specs = FP2_OCCUPANCY_SENSORS_DEF
             device_label = FP2_DEVICE_LABEL
         elif model == FP300_MODEL:
             specs = FP300_SENSOR_SPECS
+            occupancy_specs = FP300_OCCUPANCY_SENSORS_DEF
             device_label = FP300_DEVICE_LABEL
         else:
             continue
 
-        device_coordinators = presence_coordinators.get(did)
+        device_coordinators = device_index.coordinators(did)
         if not device_coordinators:
             continue
 
@@ -218,11 +225,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 )
             )
 
+        if occupancy is not None:
+            for spec in occupancy_specs:
+                entities.append(
+                    AqaraOccupancySensor(
+                        occupancy.coordinator,
+                        did,
+                        name,
+                        spec,
+                        model,
+                        device_label,
+                    )
+                )
+
     for lock in u200_locks:
         did = lock["did"]
         name = lock["deviceName"]
         model = lock["model"]
-        coordinator = u200_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -241,7 +261,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities(entities)
 
 
-class AqaraSensor(CoordinatorEntity, SensorEntity):
+class AqaraSensor(AqaraCoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
 
     def __init__(
@@ -310,7 +330,7 @@ class AqaraSensor(CoordinatorEntity, SensorEntity):
         self.async_write_ha_state()
 
 
-class AqaraFP2Sensor(CoordinatorEntity, SensorEntity):
+class AqaraFP2Sensor(AqaraCoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
 
     def __init__(
@@ -329,6 +349,7 @@ class AqaraFP2Sensor(CoordinatorEntity, SensorEntity):
         self._model = model
         self._device_label = device_label
         self._key = spec["key"]
+        self._zone_reader = zone_reader(spec)
 
         translation_key = spec.get("translation_key")
         if translation_key:
@@ -351,15 +372,26 @@ class AqaraFP2Sensor(CoordinatorEntity, SensorEntity):
         if options is not None:
             self._attr_options = options
         self._attr_entity_registry_enabled_default = spec.get("enabled_default", True)
+        self._compute_state()
 
     @property
     def device_info(self):
         return build_device_info(self._did, self._device_name, self._model, self._device_label)
 
-    @property
-    def native_value(self):
+    def _compute_state(self) -> None:
         data = self.coordinator.data or {}
-        raw = data.get(self._key)
+        if self._zone_reader is not None:
+            # Zone arrays already hold typed values.
+            self._attr_native_value = self._zone_reader(data)
+        else:
+            self._attr_native_value = self._parse_value(data.get(self._key))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._compute_state()
+        super()._handle_coordinator_update()
+
+    def _parse_value(self, raw: Any):
         if raw is None:
             return None
         if self._value_map:
@@ -396,3 +428,64 @@ class AqaraFP2Sensor(CoordinatorEntity, SensorEntity):
                 return raw
 
         return raw
+
+
+class AqaraOccupancySensor(CoordinatorEntity, SensorEntity):
+    """Share of the analytics window one presence zone was occupied."""
+
+    _attr_has_entity_name = True
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"dwell_distribution"})
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        did: str,
+        device_name: str,
+        spec: Dict[str, Any],
+        model: str,
+        device_label: str,
+    ):
+        super().__init__(coordinator)
+        self._did = did
+        self._device_name = device_name
+        self._model = model
+        self._device_label = device_label
+        self._zone = spec["occupancy_zone"]
+
+        translation_key = spec.get("translation_key")
+        if translation_key:
+            self._attr_translation_key = translation_key
+            placeholders = spec.get("translation_placeholders")
+            if placeholders:
+                self._attr_translation_placeholders = placeholders
+        elif "name" in spec:
+            self._attr_name = spec["name"]
+        self._attr_icon = spec.get("icon")
+        self._attr_unique_id = f"{did}_fp2_sensor_{spec['key']}"
+        self._attr_entity_registry_enabled_default = spec.get("enabled_default", True)
+        self._compute_state()
+
+    @property
+    def device_info(self):
+        return build_device_info(self._did, self._device_name, self._model, self._device_label)
+
+    def _compute_state(self) -> None:
+        zones = (self.coordinator.data or {}).get(self._did) or []
+        stats = zones[self._zone] if self._zone < len(zones) else None
+        if stats is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return
+        self._attr_native_value = stats["occupancy"]
+        self._attr_extra_state_attributes = {
+            "occupied_minutes": round(stats["occupied_seconds"] / 60),
+            "entries": stats["entries"],
+            "dwell_distribution": stats["dwell_distribution"],
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._compute_state()
+        super()._handle_coordinator_update()
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from functools import partial
+import logging
+import time
+from typing import Any, Iterable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN, STATE_STORE_SAVE_DELAY_SECONDS, STATE_STORE_VERSION
+from .fp2_zones import restore_zone_state
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AqaraStateStore:
+    """Persist the last good data of each coordinator across restarts.
+
+    Coordinators are keyed by name, which already encodes the family and the
+    did.  Saved data seeds the coordinators on setup, before any network
+    call, and stays marked stale until the coordinator receives fresh data
+    from a poll or a push; entities report it as ``restored_state`` (see
+    ``entity.AqaraCoordinatorEntity``).  Writes go through
+    ``Store.async_delay_save`` so bursts of updates collapse into one write
+    done by the storage helper.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STATE_STORE_VERSION,
+            f"{DOMAIN}.{entry_id}.state",
+        )
+        self._saved: dict[str, Any] = {}
+        self._saved_at: float | None = None
+        self._coordinators: dict[str, DataUpdateCoordinator] = {}
+        self._stale: set[str] = set()
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._watching = False
+
+    @property
+    def saved_at(self) -> float | None:
+        return self._saved_at
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load()
+        if not isinstance(stored, dict):
+            return
+        coordinators = stored.get("coordinators")
+        if isinstance(coordinators, dict):
+            self._saved = coordinators
+        self._saved_at = stored.get("saved_at")
+        _LOGGER.debug("Loaded last known Aqara state for %s coordinator(s)", len(self._saved))
+
+    def seed(self, coordinators: Iterable[DataUpdateCoordinator]) -> int:
+        """Load saved data into coordinators that have none yet; return how many were seeded."""
+        seeded = 0
+        for coordinator in coordinators:
+            name = coordinator.name
+            self._coordinators[name] = coordinator
+            saved = self._saved.get(name)
+            if isinstance(saved, dict) and coordinator.data is None:
+                coordinator.data = restore_zone_state(dict(saved))
+                self._stale.add(name)
+                seeded += 1
+            # Listen before the entities do, so an update clears the stale
+            # mark before they write their state.
+            self._async_listen(coordinator)
+        return seeded
+
+    @callback
+    def async_watch(self) -> None:
+        """Start persisting coordinator updates.
+
+        Called once setup has replayed anything else that predates the
+        restart, so only fresh data clears the stale mark.
+        """
+        self._watching = True
+
+    @callback
+    def async_track(self, coordinators: Iterable[DataUpdateCoordinator]) -> None:
+        """Seed and persist coordinators created after setup."""
+        self.seed(coordinators)
+
+    @callback
+    def async_forget(self, coordinators: Iterable[DataUpdateCoordinator]) -> None:
+        """Stop persisting coordinators of removed devices and drop their saved data."""
+        for coordinator in coordinators:
+            name = coordinator.name
+            self._coordinators.pop(name, None)
+            self._saved.pop(name, None)
+            self._stale.discard(name)
+            unsub = self._unsubs.pop(name, None)
+            if unsub is not None:
+                unsub()
+        self._store.async_delay_save(self._data_to_save, STATE_STORE_SAVE_DELAY_SECONDS)
+
+    @callback
+    def _async_listen(self, coordinator: DataUpdateCoordinator) -> None:
+        if coordinator.name not in self._unsubs:
+            self._unsubs[coordinator.name] = coordinator.async_add_listener(
+                partial(self._async_coordinator_updated, coordinator)
+            )
+
+    def age_seconds(self) -> float | None:
+        if self._saved_at is None:
+            return None
+        return max(0.0, time.time() - self._saved_at)
+
+    def is_stale(self, coordinator: DataUpdateCoordinator) -> bool:
+        return coordinator.name in self._stale
+
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "saved_at": self._saved_at,
+            "age_seconds": self.age_seconds(),
+            "tracked": len(self._coordinators),
+            "stale": sorted(self._stale),
+        }
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening to the coordinators without saving."""
+        self._watching = False
+        while self._unsubs:
+            self._unsubs.popitem()[1]()
+
+    async def async_unload(self) -> None:
+        self.async_stop()
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_coordinator_updated(self, coordinator: DataUpdateCoordinator) -> None:
+        if not self._watching or not coordinator.last_update_success or not isinstance(coordinator.data, dict):
+            return
+        self._stale.discard(coordinator.name)
+        self._store.async_delay_save(self._data_to_save, STATE_STORE_SAVE_DELAY_SECONDS)
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        coordinators = dict(self._saved)
+        for name, coordinator in self._coordinators.items():
+            # Stale data is the saved copy already; only refresh what came in since startup.
+            if name not in self._stale and isinstance(coordinator.data, dict):
+                coordinators[name] = coordinator.data
+        return {"saved_at": time.time(), "coordinators": coordinators}
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Iterable
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import AqaraApi, AqaraAuthError, chunk_subject_resources
+from .const import (
+    BRIDGE_SANITY_INTERVAL_SECONDS,
+    BRIDGE_UNAVAILABLE_AFTER_FAILURES,
+    POLL_PRIORITY_SETTINGS,
+    RESOURCE_QUERY_CHUNK_RESOURCES,
+)
+from .scheduler import backoff_seconds
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AqaraFleetSweeper:
+    """Poll every device of a config entry with a few multi-subject queries.
+
+    Coordinators are added with the poll that backs their own update method
+    (see ``AqaraApi.device_state_poll`` and ``AqaraApi.presence_poll``).  The
+    resources of all polls are compiled into one plan per did, queried with
+    chunked ``query.resource.value`` requests, and each coordinator gets the
+    items of its own poll through ``async_set_updated_data``.  Per-device
+    extras such as G3 gesture history still run per device.
+
+    The plan is ordered by poll priority (locks, then presence, then
+    cameras, then hub and presence settings).  Each priority tier is
+    queried and published before the next one starts, so a startup sweep
+    brings up locks and presence sensors first for at most one extra
+    request per tier.
+
+    Failures are tracked per did: a device whose resources could not be
+    queried keeps its last state, and its coordinators only go unavailable
+    after ``unavailable_after_failures`` failed sweeps in a row.  A failing
+    device is also left out of the sweeps until its backoff (see
+    ``scheduler.backoff_seconds``) has passed; a successful query or a
+    pushed event for it ends the backoff.
+    """
+
+    def __init__(
+        self,
+        api: AqaraApi,
+        *,
+        unavailable_after_failures: int = BRIDGE_UNAVAILABLE_AFTER_FAILURES,
+        max_resources: int = RESOURCE_QUERY_CHUNK_RESOURCES,
+        interval_seconds: int = BRIDGE_SANITY_INTERVAL_SECONDS,
+    ) -> None:
+        self._api = api
+        self._interval_seconds = interval_seconds
+        self._unavailable_after_failures = unavailable_after_failures
+        self._max_resources = max_resources
+        self._entries: list[dict[str, Any]] = []
+        self._plan: list[dict[str, Any]] | None = None
+        self._priorities: dict[str, int] = {}
+        self._disabled_resources: dict[str, frozenset[str]] = {}
+        self._backoff: dict[str, dict[str, Any]] = {}
+        self._last_sweep: dict[str, Any] | None = None
+
+    def add(
+        self,
+        coordinator: DataUpdateCoordinator,
+        did: str,
+        poll: dict[str, Any],
+        priority: int = POLL_PRIORITY_SETTINGS,
+    ) -> None:
+        self._entries.append(
+            {
+                "coordinator": coordinator,
+                "did": did,
+                "poll": poll,
+                "priority": priority,
+                "resource_ids": frozenset(poll["resource_ids"]),
+            }
+        )
+        self._plan = None
+
+    def remove_devices(self, dids: set[str]) -> None:
+        self._entries = [entry for entry in self._entries if entry["did"] not in dids]
+        for did in dids:
+            self._backoff.pop(did, None)
+        self._plan = None
+
+    def set_disabled_resources(self, disabled_resources: dict[str, frozenset[str]]) -> None:
+        """Leave out resources that only back disabled entities and re-plan.
+
+        See ``bridge_specs.build_disabled_poll_resources``.
+        """
+        if disabled_resources != self._disabled_resources:
+            self._disabled_resources = disabled_resources
+            self._plan = None
+
+    def filtered_poll(self, did: str, poll: dict[str, Any]) -> dict[str, Any]:
+        """Return poll without the resources and extras that back only disabled entities."""
+        disabled = self._disabled_resources.get(did)
+        if not disabled:
+            return poll
+        filtered = {
+            **poll,
+            "resource_ids": [resource_id for resource_id in poll["resource_ids"] if resource_id not in disabled],
+        }
+        extra_resource_ids = poll.get("extra_resource_ids")
+        if extra_resource_ids and all(resource_id in disabled for resource_id in extra_resource_ids):
+            filtered["extra"] = None
+        return filtered
+
+    def plan(self) -> list[dict[str, Any]]:
+        """Return the compiled poll plan: one resource list per did, by priority."""
+        if self._plan is None:
+            merged: dict[str, dict[str, None]] = {}
+            priorities: dict[str, int] = {}
+            for entry in self._entries:
+                did = entry["did"]
+                resources = merged.setdefault(did, {})
+                poll = self.filtered_poll(did, entry["poll"])
+                resources.update(dict.fromkeys(poll["resource_ids"]))
+                priorities[did] = min(priorities.get(did, entry["priority"]), entry["priority"])
+            self._priorities = priorities
+            self._plan = sorted(
+                (
+                    {"subjectId": did, "resourceIds": list(resource_ids)}
+                    for did, resource_ids in merged.items()
+                    if resource_ids
+                ),
+                key=lambda item: priorities[item["subjectId"]],
+            )
+        return self._plan
+
+    def _tiers(self, plan: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """Split an ordered plan into runs of equal priority."""
+        tiers: list[list[dict[str, Any]]] = []
+        tier_priority = None
+        for item in plan:
+            priority = self._priorities[item["subjectId"]]
+            if not tiers or priority != tier_priority:
+                tiers.append([])
+                tier_priority = priority
+            tiers[-1].append(item)
+        return tiers
+
+    def _request_count(self, plan: list[dict[str, Any]]) -> int:
+        return sum(len(chunk_subject_resources(tier, self._max_resources)) for tier in self._tiers(plan))
+
+    def diagnostics(self) -> dict[str, Any]:
+        plan = self.plan()
+        return {
+            "coordinators": len(self._entries),
+            "devices": len(plan),
+            "resources": sum(len(item["resourceIds"]) for item in plan),
+            "disabled_resources": sum(len(resource_ids) for resource_ids in self._disabled_resources.values()),
+            "requests_per_sweep": self._request_count(plan),
+            "backoff": self._backoff_diagnostics(),
+            "last_sweep": self._last_sweep,
+        }
+
+    def note_push(self, did: str) -> None:
+        """A pushed event proves the device is reachable; sweep it again right away."""
+        if self._backoff.pop(did, None) is not None:
+            _LOGGER.debug("Aqara push received from %s; ending its sweep backoff", did)
+
+    async def async_sweep(self) -> dict[str, Any]:
+        started = time.monotonic()
+        plan = [
+            item
+            for item in self.plan()
+            if item["subjectId"] not in self._backoff or self._backoff[item["subjectId"]]["retry_at"] <= started
+        ]
+        item_count = 0
+        failures: dict[str, str] = {}
+        for tier in self._tiers(plan):
+            items, tier_failures = await self._api.query_resource_values(tier, self._max_resources)
+            item_count += len(items)
+            failures.update(tier_failures)
+            swept = {item["subjectId"] for item in tier}
+            for did in swept:
+                if did in tier_failures:
+                    self._record_failure(did, tier_failures[did])
+                else:
+                    self._backoff.pop(did, None)
+
+            await self._async_apply_items(
+                [entry for entry in self._entries if entry["did"] in swept and entry["did"] not in tier_failures],
+                items,
+            )
+        self._last_sweep = {
+            "devices": len(plan),
+            "deferred_devices": len(self.plan()) - len(plan),
+            "failed_devices": len(failures),
+            "items": item_count,
+            "requests": self._request_count(plan),
+            "duration_seconds": round(time.monotonic() - started, 3),
+        }
+        _LOGGER.debug("Aqara fleet sweep finished: %s", self._last_sweep)
+        return self._last_sweep
+
+    def _record_failure(self, did: str, error: str) -> None:
+        state = self._backoff.setdefault(did, {"failures": 0})
+        state["failures"] += 1
+        failures = state["failures"]
+        state["backoff"] = backoff_seconds(self._interval_seconds, failures)
+        state["retry_at"] = time.monotonic() + state["backoff"]
+        _LOGGER.debug(
+            "Aqara sweep failed for %s %s time(s) in a row; retrying in %.0f seconds: %s",
+            did,
+            failures,
+            state["backoff"],
+            error,
+        )
+        if failures < self._unavailable_after_failures:
+            return
+        for entry in self._entries:
+            if entry["did"] == did:
+                entry["coordinator"].async_set_update_error(UpdateFailed(error))
+
+    def _backoff_diagnostics(self) -> list[dict[str, Any]]:
+        now = time.monotonic()
+        return [
+            {
+                "did": did,
+                "failures": state["failures"],
+                "backoff_seconds": round(state["backoff"], 1),
+                "retry_in_seconds": max(0.0, round(state["retry_at"] - now, 1)),
+            }
+            for did, state in self._backoff.items()
+        ]
+
+    async def async_sweep_devices(self, dids: Iterable[str]) -> None:
+        """Poll only the given devices, e.g. the ones whose push went quiet.
+
+        Failures are logged and left to the next attempt; they do not count
+        towards the fleet's unavailable threshold.
+        """
+        wanted = set(dids)
+        plan = [item for item in self.plan() if item["subjectId"] in wanted]
+        if not plan:
+            return
+        items, failures = await self._api.query_resource_values(plan, self._max_resources)
+        for did, error in failures.items():
+            _LOGGER.debug("Aqara sweep of %s failed: %s", did, error)
+        for item in plan:
+            if item["subjectId"] not in failures:
+                self._backoff.pop(item["subjectId"], None)
+        await self._async_apply_items(
+            [entry for entry in self._entries if entry["did"] in wanted and entry["did"] not in failures],
+            items,
+        )
+
+    async def _async_apply_items(self, entries: list[dict[str, Any]], items: list[dict[str, Any]]) -> None:
+        items_by_did: dict[str, list[dict[str, Any]]] = {}
+        for item in items:
+            items_by_did.setdefault(str(item.get("subjectId") or ""), []).append(item)
+
+        extra_entries = [
+            entry
+            for entry in entries
+            if self.filtered_poll(entry["did"], entry["poll"])["extra"] is not None
+        ]
+        extra_results = await asyncio.gather(
+            *(entry["poll"]["extra"]() for entry in extra_entries),
+            return_exceptions=True,
+        )
+        for result in extra_results:
+            if isinstance(result, AqaraAuthError):
+                raise result
+        extras = {id(entry): result for entry, result in zip(extra_entries, extra_results)}
+
+        for entry in entries:
+            coordinator = entry["coordinator"]
+            resource_ids = entry["resource_ids"]
+            state = entry["poll"]["map_items"](
+                item
+                for item in items_by_did.get(entry["did"], [])
+                if str(item.get("resourceId") or item.get("attr") or "") in resource_ids
+            )
+            extra = extras.get(id(entry))
+            if isinstance(extra, Exception):
+                _LOGGER.debug("Aqara sweep extra query failed for %s: %s", entry["did"], extra)
+                previous = coordinator.data or {}
+                for key in entry["poll"]["extra_keys"]:
+                    if key in previous:
+                        state[key] = previous[key]
+            elif extra is not None:
+                state.update(extra)
+            coordinator.async_set_updated_data(state)
@@ -1,12 +1,12 @@
 from __future__ import annotations
+from functools import partial
 from copy import deepcopy
 from typing import Dict, Any
 import logging
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
     DataUpdateCoordinator,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -15,22 +15,25 @@ from .const import DOMAIN, G2H_PRO_DEVICE_LABEL, G410_DEVICE_LABEL, G4_DEVICE_LA
 from .switches import ALL_SWITCHES_DEF, G2H_PRO_SWITCHES_DEF, G410_SWITCHES_DEF, G4_SWITCHES_DEF, M100_SWITCHES_DEF
 from .api import AqaraApi
 from .device_info import build_device_info
+from .entity import AqaraCoordinatorEntity
+from .device_index import AqaraDeviceIndex
+from .discovery import async_listen_devices_added
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
-    data = hass.data[DOMAIN][entry.entry_id]
+    _add_entities(hass.data[DOMAIN][entry.entry_id], async_add_entities)
+    async_listen_devices_added(hass, entry, partial(_add_entities, async_add_entities=async_add_entities))
+
+
+def _add_entities(data: dict, async_add_entities) -> None:
     api: AqaraApi = data["api"]
-    cameras: list[dict] = data["cameras"]
-    g2h_pro_cameras: list[dict] = data.get("g2h_pro_cameras", [])
-    g410_doorbells: list[dict] = data.get("g410_doorbells", [])
-    g4_doorbells: list[dict] = data.get("g4_doorbells", [])
-    hubs_m100: list[dict] = data.get("hubs_m100", [])
-    camera_coordinators: dict[str, DataUpdateCoordinator] = data.get("camera_coordinators", {})
-    g2h_pro_coordinators: dict[str, DataUpdateCoordinator] = data.get("g2h_pro_coordinators", {})
-    g410_coordinators: dict[str, DataUpdateCoordinator] = data.get("g410_coordinators", {})
-    g4_coordinators: dict[str, DataUpdateCoordinator] = data.get("g4_coordinators", {})
-    m100_coordinators: dict[str, DataUpdateCoordinator] = data.get("m100_coordinators", {})
+    device_index: AqaraDeviceIndex = data["device_index"]
+    cameras: list[dict] = device_index.devices("cameras")
+    g2h_pro_cameras: list[dict] = device_index.devices("g2h_pro_cameras")
+    g410_doorbells: list[dict] = device_index.devices("g410_doorbells")
+    g4_doorbells: list[dict] = device_index.devices("g4_doorbells")
+    hubs_m100: list[dict] = device_index.devices("hubs_m100")
 
     entities = []
 
@@ -38,7 +41,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = cam["did"]
         name = cam["deviceName"]
         model = cam.get("model") or G3_MODEL
-        coordinator = camera_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -59,7 +62,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = cam["did"]
         name = cam["deviceName"]
         model = cam["model"]
-        coordinator = g2h_pro_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -79,7 +82,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = doorbell["did"]
         name = doorbell["deviceName"]
         model = doorbell["model"]
-        coordinator = g410_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -99,7 +102,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = doorbell["did"]
         name = doorbell["deviceName"]
         model = doorbell["model"]
-        coordinator = g4_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -119,7 +122,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         did = hub["did"]
         name = hub["deviceName"]
         model = hub["model"]
-        coordinator = m100_coordinators.get(did)
+        coordinator = device_index.coordinator(did)
         if coordinator is None:
             continue
 
@@ -137,7 +140,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     async_add_entities(entities)
 
-class AqaraResourceSwitch(CoordinatorEntity, SwitchEntity):
+class AqaraResourceSwitch(AqaraCoordinatorEntity, SwitchEntity):
     _attr_has_entity_name = True
 
     def __init__(
@@ -165,6 +168,7 @@ class AqaraResourceSwitch(CoordinatorEntity, SwitchEntity):
             self._attr_name = spec["name"]
         self._attr_icon = spec["icon"]
         self._attr_unique_id = f"{did}_{spec['inApp']}"
+        self._compute_state()
 
     @property
     def device_info(self):
@@ -184,11 +188,14 @@ class AqaraResourceSwitch(CoordinatorEntity, SwitchEntity):
         except Exception:
             return False
 
-    @property
-    def is_on(self) -> bool:
+    def _compute_state(self) -> None:
         data = self.coordinator.data or {}
-        raw = data.get(self._spec["inApp"])
-        return self._truthy(raw)
+        self._attr_is_on = self._truthy(data.get(self._spec["inApp"]))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._compute_state()
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs):
         payload = {
@@ -0,0 +1,116 @@
+"""Measure the entity cost of one coordinator update for an FP2.
+
+Every FP2 binary sensor and sensor is created, zones included, on fake
+coordinators, one per poll group.  One update maps a raw poll response of
+every group the way the API client does, then recomputes the state of every
+entity and reads its state property as often as Home Assistant does when it
+writes the state.  The median per-update time is printed; ``--json`` and
+``--compare`` work as in benchmark_startup.py:
+
+    python scripts/benchmark_fp2_updates.py --json before.json
+    git checkout <other version>
+    python scripts/benchmark_fp2_updates.py --compare before.json
+
+Run it from the repository root with Home Assistant installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.ha_aqara_devices.api import AqaraApi  # noqa: E402
+from custom_components.ha_aqara_devices.binary_sensor import AqaraFP2BinarySensor  # noqa: E402
+from custom_components.ha_aqara_devices.const import FP2_DEVICE_LABEL, FP2_MODEL  # noqa: E402
+from custom_components.ha_aqara_devices.fp2 import FP2_BINARY_SENSORS_DEF, FP2_SENSOR_SPECS  # noqa: E402
+from custom_components.ha_aqara_devices.sensor import AqaraFP2Sensor  # noqa: E402
+
+
+_SPECS_BY_RESOURCE = {spec["api"]: spec for spec in (*FP2_BINARY_SENSORS_DEF, *FP2_SENSOR_SPECS) if spec.get("api")}
+
+
+def _raw_value(resource_id: str, step: int) -> str:
+    """Return a raw value the way the Open API reports it: a string."""
+    value_map = _SPECS_BY_RESOURCE.get(resource_id, {}).get("value_map")
+    if value_map:
+        keys = list(value_map)
+        return str(keys[step % len(keys)])
+    return str(step % 7)
+
+
+def _poll_items(resource_ids: list[str], step: int) -> list[dict]:
+    return [{"resourceId": resource_id, "value": _raw_value(resource_id, step)} for resource_id in resource_ids]
+
+
+def _build_entities() -> tuple[dict[str, SimpleNamespace], list[tuple[object, str]]]:
+    coordinators: dict[str, SimpleNamespace] = {}
+    entities: list[tuple[object, str]] = []
+    for spec in FP2_BINARY_SENSORS_DEF:
+        coordinator = coordinators.setdefault(spec.get("poll_group", "fast"), SimpleNamespace(data={}))
+        entities.append(
+            (AqaraFP2BinarySensor(coordinator, "fp2", "Bench", spec, FP2_MODEL, FP2_DEVICE_LABEL), "is_on")
+        )
+    for spec in FP2_SENSOR_SPECS:
+        coordinator = coordinators.setdefault(spec.get("poll_group", "medium"), SimpleNamespace(data={}))
+        entities.append((AqaraFP2Sensor(coordinator, "fp2", "Bench", spec, FP2_MODEL, FP2_DEVICE_LABEL), "native_value"))
+    return coordinators, entities
+
+
+def _run_updates(updates: int, reads: int) -> float:
+    """Return the mean seconds one update of every coordinator takes."""
+    coordinators, entities = _build_entities()
+    api = AqaraApi("OTHER", None, app_id="bench", app_key="bench", key_id="bench")
+    polls = {group: api.presence_poll("fp2", FP2_MODEL, group) for group in coordinators}
+    # Entities recompute their state in _handle_coordinator_update when they have one.
+    compute = [getattr(entity, "_compute_state", None) for entity, _ in entities]
+    responses = [
+        {group: _poll_items(poll["resource_ids"], step) for group, poll in polls.items()}
+        for step in range(updates)
+    ]
+    started = time.perf_counter()
+    for response in responses:
+        for group, coordinator in coordinators.items():
+            coordinator.data = polls[group]["map_items"](response[group])
+        for (entity, attribute), compute_state in zip(entities, compute):
+            if compute_state is not None:
+                compute_state()
+            for _ in range(reads):
+                getattr(entity, attribute)
+    return (time.perf_counter() - started) / updates
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--reads", type=int, default=3, help="state property reads per state write")
+    parser.add_argument("--json", type=Path, help="write the medians to this file")
+    parser.add_argument("--compare", type=Path, help="compare against medians written by --json")
+    args = parser.parse_args()
+
+    entity_count = len(_build_entities()[1])
+    per_update = statistics.median(_run_updates(args.updates, args.reads) for _ in range(args.runs))
+    medians = {"per_update": per_update, "per_entity": per_update / entity_count}
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+
+    print(f"{entity_count} FP2 entities, {args.reads} state reads per write")
+    for name, seconds in medians.items():
+        line = f"{name:<14} {seconds * 1_000_000:8.1f} us"
+        if name in baseline:
+            line += f"  ({(seconds - baseline[name]) * 1_000_000:+.1f} us)"
+        print(line)
+
+    if args.json:
+        args.json.write_text(json.dumps(medians, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Measure the cold import time of the integration.
+
+Every run starts a fresh interpreter, imports the integration package and
+then the modules async_setup_entry loads lazily, timing each one.  The
+median of all runs is printed; ``--json`` writes it to a file so results
+can be compared across versions:
+
+    python scripts/benchmark_startup.py --runs 20 --json before.json
+    git checkout <other version>
+    python scripts/benchmark_startup.py --runs 20 --compare before.json
+
+Run it from the repository root with Home Assistant installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.ha_aqara_devices"
+
+_CHILD = f"""
+import json, time
+started = time.perf_counter()
+import {PACKAGE} as integration
+package_seconds = time.perf_counter() - started
+from {PACKAGE}.profiling import SETUP_MODULES, time_module_imports
+timings = time_module_imports("{PACKAGE}", SETUP_MODULES)
+timings = {{"package": package_seconds, **{{k: v or 0.0 for k, v in timings.items()}}}}
+timings["total"] = time.perf_counter() - started
+print(json.dumps(timings))
+"""
+
+
+def _run_once() -> dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--json", type=Path, help="write the medians to this file")
+    parser.add_argument("--compare", type=Path, help="compare against medians written by --json")
+    args = parser.parse_args()
+
+    runs = [_run_once() for _ in range(args.runs)]
+    medians = {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+
+    for name, seconds in medians.items():
+        line = f"{name:<14} {seconds * 1000:8.1f} ms"
+        if name in baseline:
+            line += f"  ({(seconds - baseline[name]) * 1000:+.1f} ms)"
+        print(line)
+
+    if args.json:
+        args.json.write_text(json.dumps(medians, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
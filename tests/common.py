@@ -0,0 +1,74 @@
+"""Helpers for running the push manager against local bridge stand-ins."""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable
+
+from aiohttp import web
+
+from custom_components.ha_aqara_devices.device_index import AqaraDeviceIndex
+from custom_components.ha_aqara_devices.push import AqaraBridgePushManager
+from custom_components.ha_aqara_devices.scheduler import AqaraPollScheduler
+
+DID = "lumi.test1"
+RESOURCE_ID = "0.1.85"
+
+HEARTBEAT = b"event: heartbeat\ndata: {}\n\n"
+
+
+def sse_batch(event_id: str, value: str) -> bytes:
+    payload = {
+        "type": "batch",
+        "events": [{"subjectId": DID, "resourceId": RESOURCE_ID, "value": value, "time": 1000 + int(event_id)}],
+    }
+    return f"id: {event_id}\nevent: batch\ndata: {json.dumps(payload)}\n\n".encode()
+
+
+def bridge_app(
+    stream: Callable[[web.Request, int], Awaitable[web.StreamResponse]],
+    health: Callable[[], dict[str, Any]] | None = None,
+) -> tuple[web.Application, list[str | None]]:
+    """Return a bridge stand-in and the Last-Event-ID sent with each /events request.
+
+    stream gets the request and its 1-based attempt number.
+    """
+    seen: list[str | None] = []
+
+    async def _health(request: web.Request) -> web.Response:
+        return web.json_response(health() if health else {"status": "UP", "rocketmqStarted": True})
+
+    async def _events(request: web.Request) -> web.StreamResponse:
+        seen.append(request.headers.get("Last-Event-ID"))
+        return await stream(request, len(seen))
+
+    app = web.Application()
+    app.router.add_get("/health", _health)
+    app.router.add_get("/events", _events)
+    return app, seen
+
+
+async def open_stream(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+    await response.prepare(request)
+    return response
+
+
+async def wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.02)
+
+
+def make_manager(hass, session, api, urls: list[str], **kwargs: Any) -> AqaraBridgePushManager:
+    return AqaraBridgePushManager(
+        hass,
+        session,
+        api,
+        urls,
+        "token",
+        AqaraDeviceIndex([{"did": DID, "model": "lumi.camera.gwpgl1"}]),
+        [{"subjectId": DID, "resourceIds": [RESOURCE_ID]}],
+        poll_scheduler=AqaraPollScheduler(hass),
+        **kwargs,
+    )
@@ -0,0 +1,67 @@
+"""Shared fixtures for the Aqara integration tests."""
+from __future__ import annotations
+
+from typing import Any
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+import pytest
+import pytest_asyncio
+
+from homeassistant.core import HomeAssistant
+
+
+class FakeAqaraApi:
+    """Stand-in for AqaraApi that accepts every subscription and records queries."""
+
+    def __init__(self) -> None:
+        self.queries: list[list[dict[str, Any]]] = []
+
+    async def ensure_valid_access_token(self) -> None:
+        return None
+
+    async def subscribe_resources(self, chunk: list[dict[str, Any]]) -> dict[str, Any]:
+        return {"code": 0}
+
+    async def unsubscribe_resources(self, chunk: list[dict[str, Any]]) -> dict[str, Any]:
+        return {"code": 0}
+
+    async def query_resource_values(
+        self, resources: list[dict[str, Any]], max_resources: int | None = None
+    ) -> tuple[list[dict[str, Any]], dict[str, str]]:
+        self.queries.append(resources)
+        return [], {}
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest_asyncio.fixture
+async def session():
+    async with ClientSession() as session:
+        yield session
+
+
+@pytest.fixture
+def api() -> FakeAqaraApi:
+    return FakeAqaraApi()
+
+
+@pytest_asyncio.fixture
+async def bridge_server():
+    """Start local bridge stand-ins; each call takes an aiohttp app and returns its base URL."""
+    servers: list[TestServer] = []
+
+    async def _start(app: web.Application) -> str:
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+        return str(server.make_url("")).rstrip("/")
+
+    yield _start
+    for server in servers:
+        await server.close()
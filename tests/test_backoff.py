@@ -0,0 +1,134 @@
+"""Tests for the exponential poll backoff of coordinators and the fleet sweep."""
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from typing import Any
+
+import pytest
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.ha_aqara_devices import _create_resilient_coordinator, scheduler as scheduler_module
+from custom_components.ha_aqara_devices.const import POLL_BACKOFF_JITTER, POLL_BACKOFF_MAX_SECONDS
+from custom_components.ha_aqara_devices.scheduler import AqaraPollScheduler, backoff_seconds
+from custom_components.ha_aqara_devices.sweep import AqaraFleetSweeper
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(scheduler_module.random, "uniform", lambda low, high: 1.0)
+
+
+def test_backoff_doubles_up_to_the_cap(monkeypatch) -> None:
+    monkeypatch.setattr(scheduler_module.random, "uniform", lambda low, high: high)
+    assert backoff_seconds(60, 1) == 120
+    assert backoff_seconds(60, 2) == 240
+    assert backoff_seconds(60, 100) == POLL_BACKOFF_MAX_SECONDS
+
+
+def test_capped_backoff_is_still_jittered() -> None:
+    delays = {backoff_seconds(60, 100) for _ in range(50)}
+
+    # Devices at the cap must not all retry at the same moment.
+    assert len(delays) > 1
+    assert max(delays) <= POLL_BACKOFF_MAX_SECONDS
+    assert min(delays) >= POLL_BACKOFF_MAX_SECONDS * (1 - POLL_BACKOFF_JITTER)
+
+
+@pytest.mark.asyncio
+async def test_failing_coordinator_backs_off_until_push(hass, no_jitter) -> None:
+    scheduler = AqaraPollScheduler(hass)
+    failing = {"on": True}
+
+    async def fetch() -> dict[str, Any]:
+        if failing["on"]:
+            raise RuntimeError("offline")
+        return {"ok": True}
+
+    coordinator = _create_resilient_coordinator(
+        hass, scheduler, "lumi.1", "lock-state", fetch, 60, 3, 0, push_managed=False
+    )
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=120)
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=240)
+    assert scheduler.diagnostics()[0]["failures"] == 2
+
+    scheduler.note_push("lumi.1")
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=120)
+    failing["on"] = False
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=60)
+    assert scheduler.diagnostics()[0]["backoff_seconds"] is None
+
+
+class _SweepApi:
+    def __init__(self) -> None:
+        self.failing: set[str] = set()
+        self.queried: list[list[str]] = []
+
+    async def query_resource_values(self, resources, max_resources=None):
+        self.queried.append([item["subjectId"] for item in resources])
+        items = [
+            {"subjectId": item["subjectId"], "resourceId": resource_id, "value": "1"}
+            for item in resources
+            if item["subjectId"] not in self.failing
+            for resource_id in item["resourceIds"]
+        ]
+        return items, {did: "device offline" for did in self.failing}
+
+
+def _add_device(hass, sweeper, did) -> DataUpdateCoordinator:
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, name=f"test-{did}")
+    poll = {
+        "resource_ids": ["4.1.85"],
+        "extra": None,
+        "map_items": lambda items: {item["resourceId"]: item["value"] for item in items},
+    }
+    sweeper.add(coordinator, did, poll)
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_sweep_backs_off_per_device(hass, no_jitter) -> None:
+    api = _SweepApi()
+    sweeper = AqaraFleetSweeper(api, unavailable_after_failures=2, interval_seconds=300)
+    good = _add_device(hass, sweeper, "lumi.good")
+    bad = _add_device(hass, sweeper, "lumi.bad")
+    api.failing.add("lumi.bad")
+
+    result = await sweeper.async_sweep()
+    assert result["failed_devices"] == 1
+    assert good.data == {"4.1.85": "1"}
+    assert bad.data is None
+    assert bad.last_update_success
+
+    # The failing device waits out its backoff; the others are still swept.
+    result = await sweeper.async_sweep()
+    assert api.queried[-1] == ["lumi.good"]
+    assert result["deferred_devices"] == 1
+    (row,) = sweeper.diagnostics()["backoff"]
+    assert row["did"] == "lumi.bad"
+    assert row["failures"] == 1
+    assert row["backoff_seconds"] == 600
+
+    sweeper._backoff["lumi.bad"]["retry_at"] = 0
+    await sweeper.async_sweep()
+    assert not bad.last_update_success
+    assert good.last_update_success
+    assert sweeper.diagnostics()["backoff"][0]["backoff_seconds"] == 1200
+
+    # A pushed event ends the backoff, so the next sweep includes the device again.
+    sweeper.note_push("lumi.bad")
+    api.failing.clear()
+    await sweeper.async_sweep()
+    assert api.queried[-1] == ["lumi.good", "lumi.bad"]
+    assert sweeper.diagnostics()["backoff"] == []
+    assert bad.last_update_success
+    assert bad.data == {"4.1.85": "1"}
@@ -0,0 +1,103 @@
+"""Tests for the Open API client shared by the config entries of one app."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from aiohttp import web
+import pytest
+import pytest_asyncio
+
+from custom_components.ha_aqara_devices.client import (
+    AqaraAppClient,
+    async_get_app_client,
+    async_release_app_client,
+)
+
+
+@pytest_asyncio.fixture
+async def open_api(bridge_server):
+    """A stand-in Open API endpoint that counts requests and answers slowly."""
+    state = {"requests": 0}
+
+    async def handler(request: web.Request) -> web.Response:
+        state["requests"] += 1
+        await asyncio.sleep(0.05)
+        return web.json_response({"code": 0, "result": await request.text()})
+
+    app = web.Application()
+    app.router.add_post("/v3.0/open/api", handler)
+    state["url"] = f"{await bridge_server(app)}/v3.0/open/api"
+    return state
+
+
+async def _decode(response):
+    return await response.json()
+
+
+def _request(client: AqaraAppClient, url: str, body: str = "{}", **kwargs):
+    return client.async_request(url, body, dict, _decode, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_throttles_past_the_burst(session, open_api) -> None:
+    client = AqaraAppClient(session, requests_per_second=20, burst=2)
+    started = time.monotonic()
+
+    results = await asyncio.gather(*(_request(client, open_api["url"], str(index)) for index in range(4)))
+
+    # Two requests fit the burst; the other two wait 50 ms each for a token.
+    assert time.monotonic() - started >= 0.09
+    assert [body["result"] for _, body in results] == ["0", "1", "2", "3"]
+    metrics = client.diagnostics()
+    assert metrics["requests"] == 4
+    assert metrics["throttled"] == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_call(session, open_api) -> None:
+    client = AqaraAppClient(session)
+
+    results = await asyncio.gather(
+        *(_request(client, open_api["url"], dedup_key="query") for _ in range(3)),
+        _request(client, open_api["url"], dedup_key="other"),
+    )
+
+    assert open_api["requests"] == 2
+    assert results[0] is results[1] is results[2]
+    assert client.diagnostics()["deduplicated"] == 2
+    assert client.diagnostics()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requester_does_not_cancel_shared_call(session, open_api) -> None:
+    client = AqaraAppClient(session)
+    first = asyncio.ensure_future(_request(client, open_api["url"], dedup_key="query"))
+    second = asyncio.ensure_future(_request(client, open_api["url"], dedup_key="query"))
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+    status, body = await second
+
+    assert first.cancelled()
+    assert status == 200
+    assert body["code"] == 0
+    assert open_api["requests"] == 1
+    assert client.diagnostics()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_entries_of_one_app_share_a_client(hass, session) -> None:
+    first = async_get_app_client(hass, session, "EU", "app", "entry1")
+    second = async_get_app_client(hass, session, "EU", "app", "entry2")
+    other = async_get_app_client(hass, session, "CN", "app", "entry3")
+
+    assert first is second
+    assert other is not first
+    assert first.entry_count == 2
+
+    async_release_app_client(hass, "EU", "app", "entry1")
+    assert async_get_app_client(hass, session, "EU", "app", "entry1") is first
+    async_release_app_client(hass, "EU", "app", "entry1")
+    async_release_app_client(hass, "EU", "app", "entry2")
+    assert async_get_app_client(hass, session, "EU", "app", "entry4") is not first
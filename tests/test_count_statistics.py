@@ -0,0 +1,112 @@
+"""Tests for the people count aggregation into long-term statistics."""
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from custom_components.ha_aqara_devices import count_statistics
+from custom_components.ha_aqara_devices.const import DOMAIN, FP2_MODEL
+from custom_components.ha_aqara_devices.count_statistics import AqaraCountAggregator, AqaraCountStatistics
+
+_LOGGER = logging.getLogger(__name__)
+
+# Aligned to an hour.
+T0 = 3600 * 480000.0
+SPECS = [{"key": "people_counting"}, {"key": "people_counting_by_mins"}]
+
+
+def test_period_statistics_are_time_weighted() -> None:
+    aggregator = AqaraCountAggregator(SPECS, T0)
+    aggregator.observe({"people_counting": "1"}, T0)
+    aggregator.observe({"people_counting": 3}, T0 + 1800)
+    # An unknown value does not count towards the mean.
+    aggregator.observe({"people_counting": None}, T0 + 2700)
+    aggregator.advance(T0 + 3600)
+
+    ((index, (period,)),) = aggregator.take_pending()
+
+    assert index == 0
+    assert period["start"] == dt_util.utc_from_timestamp(T0)
+    assert period["mean"] == pytest.approx((1 * 1800 + 3 * 900) / 2700)
+    assert (period["min"], period["max"]) == (1.0, 3.0)
+    assert aggregator.take_pending() == []
+
+
+def test_held_value_carries_into_later_periods() -> None:
+    aggregator = AqaraCountAggregator(SPECS, T0)
+    aggregator.observe({"people_counting": 2, "people_counting_by_mins": 5}, T0 + 1800)
+    aggregator.observe({"people_counting": 4, "people_counting_by_mins": 5}, T0 + 2 * 3600 + 900)
+    aggregator.advance(T0 + 3 * 3600)
+
+    pending = dict(aggregator.take_pending())
+
+    assert [(period["mean"], period["min"], period["max"]) for period in pending[0]] == [
+        (2.0, 2.0, 2.0),
+        (2.0, 2.0, 2.0),
+        (pytest.approx(3.5), 2.0, 4.0),
+    ]
+    assert [period["start"] for period in pending[1]] == [
+        dt_util.utc_from_timestamp(T0 + hour * 3600) for hour in range(3)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_flush_imports_closed_hours(hass, monkeypatch) -> None:
+    clock = [T0]
+    monkeypatch.setattr(count_statistics, "time", SimpleNamespace(time=lambda: clock[0]))
+    imported: list[tuple[dict, list[dict]]] = []
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, name="test-medium")
+    statistics = AqaraCountStatistics(hass, lambda hass, metadata, stats: imported.append((metadata, stats)))
+    statistics.add_devices(
+        [
+            {
+                "did": "lumi1.54ef44abc",
+                "device": {"model": FP2_MODEL, "deviceName": "Office FP2"},
+                "coordinators": {"medium": coordinator},
+            },
+            {"did": "lumi.other", "device": {"model": "lumi.switch"}, "coordinators": {}},
+        ]
+    )
+    assert "lumi1.54ef44abc_fp2_sensor_people_counting" in statistics.unique_ids()
+
+    coordinator.async_set_updated_data({"people_counting": 4})
+    clock[0] = T0 + 2 * 3600 + 10
+    statistics.async_flush()
+
+    ((metadata, stats),) = imported
+    assert metadata["statistic_id"] == f"{DOMAIN}:lumi1_54ef44abc_people_counting"
+    assert metadata["name"] == "Office FP2 People Counting"
+    assert [period["mean"] for period in stats] == [4.0, 4.0]
+    assert statistics.diagnostics()["imported"] == 2
+
+    statistics.async_unload()
+    assert statistics.diagnostics()["devices"] == 0
+    assert not coordinator._listeners
+
+
+@pytest.mark.asyncio
+async def test_rejected_import_is_counted(hass, monkeypatch) -> None:
+    clock = [T0]
+    monkeypatch.setattr(count_statistics, "time", SimpleNamespace(time=lambda: clock[0]))
+
+    def _reject(hass, metadata, stats) -> None:
+        raise HomeAssistantError("invalid statistic_id")
+
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, name="test-medium")
+    statistics = AqaraCountStatistics(hass, _reject)
+    statistics.add_devices(
+        [{"did": "lumi.fp2", "device": {"model": FP2_MODEL}, "coordinators": {"medium": coordinator}}]
+    )
+    coordinator.async_set_updated_data({"people_counting": 1})
+    clock[0] = T0 + 3600
+    statistics.async_flush()
+
+    assert statistics.diagnostics()["failed"] == 1
+    assert statistics.diagnostics()["imported"] == 0
+    statistics.async_unload()
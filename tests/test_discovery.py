@@ -0,0 +1,137 @@
+"""Tests for periodic device discovery."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.ha_aqara_devices import _async_discover_device_changes
+from custom_components.ha_aqara_devices.const import DEVICE_DISCOVERY_REMOVE_AFTER_MISSES, FP2_MODEL
+from custom_components.ha_aqara_devices.device_index import AqaraDeviceIndex
+from custom_components.ha_aqara_devices.discovery import diff_devices
+
+CAMERA = {"did": "lumi.camera", "model": "lumi.camera.gwpgl1"}
+FP2 = {"did": "lumi.fp2", "model": FP2_MODEL}
+UNSUPPORTED = {"did": "lumi.plug", "model": "lumi.plug.unknown"}
+
+
+class _Calls:
+    """Records every method call made on it."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str):
+        def _record(*args: Any) -> None:
+            self.calls.append((name, args))
+
+        return _record
+
+
+class _Debouncer:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def async_call(self) -> None:
+        self.calls += 1
+
+
+class _Discovery:
+    """Runs discovery against a scripted device listing."""
+
+    def __init__(self, hass, devices: list[dict[str, Any]]) -> None:
+        self.hass = hass
+        self.listing: list[dict[str, Any]] = []
+        self.misses: dict[str, int] = {}
+        self.debouncer = _Debouncer()
+        self.bridge_manager = _Calls()
+        self.device_index = AqaraDeviceIndex(devices)
+        self.entry_data = {
+            "api": SimpleNamespace(get_devices=self._get_devices),
+            "device_index": self.device_index,
+            "state_store": _Calls(),
+            "occupancy": _Calls(),
+            "count_statistics": None,
+            "bridge_manager": self.bridge_manager,
+            "fleet_sweeper": _Calls(),
+            "poll_scheduler": _Calls(),
+        }
+
+    async def _get_devices(self) -> list[dict[str, Any]]:
+        return self.listing
+
+    async def run(self, listing: list[dict[str, Any]]) -> None:
+        self.listing = listing
+        await _async_discover_device_changes(
+            self.hass,
+            SimpleNamespace(entry_id="entry", title="Aqara"),
+            self.entry_data,
+            self.misses,
+            self.debouncer,
+        )
+
+
+def test_diff_devices_ignores_unsupported_models() -> None:
+    device_index = AqaraDeviceIndex([CAMERA])
+
+    added, removed = diff_devices(device_index, [CAMERA, FP2, UNSUPPORTED])
+
+    assert added == [FP2]
+    assert removed == set()
+    assert diff_devices(device_index, [UNSUPPORTED]) == ([], {CAMERA["did"]})
+
+
+@pytest.mark.asyncio
+async def test_device_is_removed_after_repeated_misses(hass) -> None:
+    await dr.async_load(hass)
+    discovery = _Discovery(hass, [CAMERA, FP2])
+
+    for _ in range(DEVICE_DISCOVERY_REMOVE_AFTER_MISSES - 1):
+        await discovery.run([CAMERA])
+        assert FP2["did"] in discovery.device_index
+    assert discovery.bridge_manager.calls == []
+
+    await discovery.run([CAMERA])
+
+    assert FP2["did"] not in discovery.device_index
+    assert CAMERA["did"] in discovery.device_index
+    assert discovery.bridge_manager.calls == [("remove_devices", ({FP2["did"]},))]
+    assert discovery.misses == {}
+    assert discovery.debouncer.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_reappearing_device_resets_its_misses(hass) -> None:
+    await dr.async_load(hass)
+    discovery = _Discovery(hass, [CAMERA, FP2])
+
+    for _ in range(DEVICE_DISCOVERY_REMOVE_AFTER_MISSES - 1):
+        await discovery.run([CAMERA])
+    await discovery.run([CAMERA, FP2])
+    assert discovery.misses == {}
+
+    await discovery.run([CAMERA])
+
+    assert FP2["did"] in discovery.device_index
+    assert discovery.misses == {FP2["did"]: 1}
+
+
+@pytest.mark.asyncio
+async def test_unsupported_models_and_empty_listings_change_nothing(hass) -> None:
+    await dr.async_load(hass)
+    discovery = _Discovery(hass, [CAMERA, FP2])
+
+    await discovery.run([CAMERA, FP2, UNSUPPORTED])
+    assert UNSUPPORTED["did"] not in discovery.device_index
+    assert discovery.misses == {}
+
+    for _ in range(DEVICE_DISCOVERY_REMOVE_AFTER_MISSES + 1):
+        await discovery.run([])
+
+    assert len(discovery.device_index) == 2
+    assert discovery.misses == {}
+    assert discovery.bridge_manager.calls == []
+    assert discovery.debouncer.calls == 0
@@ -0,0 +1,115 @@
+"""Tests for the FP2 zone arrays and how pushes update them."""
+from __future__ import annotations
+
+import logging
+import math
+
+import pytest
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.ha_aqara_devices.const import FP2_MODEL, FP2_ZONES_KEY
+from custom_components.ha_aqara_devices.device_index import AqaraDeviceIndex
+from custom_components.ha_aqara_devices.fp2_zones import AqaraFP2Zones, restore_zone_state
+from custom_components.ha_aqara_devices.push import AqaraBridgePushManager
+from custom_components.ha_aqara_devices.scheduler import AqaraPollScheduler
+
+_LOGGER = logging.getLogger(__name__)
+FP2_DID = "lumi.fp2"
+PRESENCE_1 = "3.1.85"
+PRESENCE_2 = "3.2.85"
+COUNT_1 = "13.121.85"
+MINUTE_COUNT_1 = "0.121.85"
+
+
+def test_decode_counts_only_changed_slots() -> None:
+    zones = AqaraFP2Zones()
+
+    assert zones.decode([(PRESENCE_1, "1"), (PRESENCE_2, 0), (COUNT_1, "4"), ("13.11.85", "1")]) == 3
+    assert zones.decode([(PRESENCE_1, 1), (PRESENCE_2, "0"), (COUNT_1, "5")]) == 1
+    assert zones.value("presence", 0) == 1
+    assert zones.value("presence", 1) == 0
+    assert zones.value("counts", 0) == 5
+
+
+def test_decode_unknown_values() -> None:
+    zones = AqaraFP2Zones()
+
+    # Slots start unknown, so unparseable values change nothing.
+    assert zones.decode([(PRESENCE_1, "on"), (COUNT_1, None), (MINUTE_COUNT_1, "n/a")]) == 0
+    assert zones.value("presence", 0) is None
+    assert zones.value("minute_counts", 0) is None
+
+    assert zones.decode([(MINUTE_COUNT_1, "2.5"), (PRESENCE_1, "1.0")]) == 2
+    assert zones.value("minute_counts", 0) == 2.5
+    assert zones.value("presence", 0) == 1
+
+    assert zones.decode([(MINUTE_COUNT_1, "nan"), (PRESENCE_1, "-1")]) == 2
+    assert zones.value("minute_counts", 0) is None
+    assert zones.value("presence", 0) is None
+    # NaN is unknown already; infinity decodes to the same NaN.
+    assert zones.decode([(MINUTE_COUNT_1, "inf"), (MINUTE_COUNT_1, math.nan)]) == 0
+
+
+def test_decode_out_of_range_values_are_unknown() -> None:
+    zones = AqaraFP2Zones()
+    zones.decode([(PRESENCE_1, 1), (COUNT_1, 7)])
+
+    assert zones.decode([(PRESENCE_1, 128), (COUNT_1, 2**31)]) == 2
+    assert zones.value("presence", 0) is None
+    assert zones.value("counts", 0) is None
+    assert zones.decode([(PRESENCE_1, -5), (COUNT_1, "-2")]) == 0
+
+
+def test_saved_zones_round_trip() -> None:
+    zones = AqaraFP2Zones()
+    zones.decode([(PRESENCE_1, 1), (PRESENCE_2, 0), (COUNT_1, 3), (MINUTE_COUNT_1, 1.5)])
+
+    restored = restore_zone_state({FP2_ZONES_KEY: zones.as_dict(), "online": True})
+
+    assert restored["online"] is True
+    assert isinstance(restored[FP2_ZONES_KEY], AqaraFP2Zones)
+    assert restored[FP2_ZONES_KEY].as_dict() == zones.as_dict()
+    assert restored[FP2_ZONES_KEY].occupied_zones() == 1
+    assert restored[FP2_ZONES_KEY].total_people() == 3
+
+
+@pytest.mark.asyncio
+async def test_push_batch_copies_published_zones_once(hass, session, api, monkeypatch) -> None:
+    device_index = AqaraDeviceIndex([{"did": FP2_DID, "model": FP2_MODEL}])
+    published = AqaraFP2Zones()
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, name="fp2 fast")
+    coordinator.data = {FP2_ZONES_KEY: published}
+    device_index.get(FP2_DID)["coordinators"]["fast"] = coordinator
+    manager = AqaraBridgePushManager(
+        hass,
+        session,
+        api,
+        [],
+        "token",
+        device_index,
+        [],
+        poll_scheduler=AqaraPollScheduler(hass),
+    )
+    copies: list[AqaraFP2Zones] = []
+    original_copy = AqaraFP2Zones.copy
+
+    def _counting_copy(zones: AqaraFP2Zones) -> AqaraFP2Zones:
+        copies.append(zones)
+        return original_copy(zones)
+
+    monkeypatch.setattr(AqaraFP2Zones, "copy", _counting_copy)
+
+    manager._apply_events(
+        "batch",
+        [
+            {"subjectId": FP2_DID, "resourceId": PRESENCE_1, "value": "1"},
+            {"subjectId": FP2_DID, "resourceId": PRESENCE_2, "value": "1"},
+        ],
+    )
+
+    assert copies == [published]
+    assert published.occupied_zones() is None
+    current = coordinator.data[FP2_ZONES_KEY]
+    assert current is not published
+    assert current.occupied_zones() == 2
@@ -0,0 +1,126 @@
+"""Tests for the shared binary sensor hold timers."""
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.ha_aqara_devices import hold_timers
+from custom_components.ha_aqara_devices.binary_sensor import AqaraBinarySensor
+from custom_components.ha_aqara_devices.hold_timers import AqaraHoldTimers
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Clock:
+    """Stands in for the time module and the loop timer of hold_timers."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.armed: list[float] = []
+        self.cancelled = 0
+
+    def time(self) -> float:
+        return self.now
+
+    def call_later(self, hass, delay, action):
+        self.armed.append(self.now + delay)
+
+        def _cancel() -> None:
+            self.cancelled += 1
+
+        return _cancel
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(hold_timers, "time", SimpleNamespace(time=clock.time))
+    monkeypatch.setattr(hold_timers, "async_call_later", clock.call_later)
+    return clock
+
+
+def _fire_at(timers: AqaraHoldTimers, clock: _Clock, now: float) -> None:
+    clock.now = now
+    timers._async_fire(None)
+
+
+@pytest.mark.asyncio
+async def test_reschedule_replaces_deadline(hass, clock) -> None:
+    timers = AqaraHoldTimers(hass, tick=1)
+    fired: list[str] = []
+    timers.schedule("sensor", 10, lambda: fired.append("first"))
+    timers.schedule("sensor", 20, lambda: fired.append("second"))
+
+    _fire_at(timers, clock, 10)
+    assert fired == []
+    # The stale entry was skipped and the live deadline re-armed.
+    assert timers.diagnostics()["armed_for"] == 20
+    assert timers.diagnostics()["heap_size"] == 1
+
+    _fire_at(timers, clock, 20)
+    assert fired == ["second"]
+    assert not timers.is_pending("sensor")
+
+
+@pytest.mark.asyncio
+async def test_cancel_of_last_key_disarms(hass, clock) -> None:
+    timers = AqaraHoldTimers(hass, tick=1)
+    timers.schedule("a", 10, lambda: None)
+    timers.schedule("b", 12, lambda: None)
+
+    timers.cancel("a")
+    assert clock.cancelled == 0
+    assert timers.diagnostics()["armed_for"] == 10
+
+    timers.cancel("b")
+    assert clock.cancelled == 1
+    assert timers.diagnostics()["armed_for"] is None
+    assert timers.diagnostics()["heap_size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_deadlines_in_one_tick_fire_in_one_pass(hass, clock) -> None:
+    timers = AqaraHoldTimers(hass, tick=1)
+    fired: list[str] = []
+    timers.schedule("a", 10.2, lambda: fired.append("a"))
+    timers.schedule("b", 10.9, lambda: fired.append("b"))
+    timers.schedule("c", 12.5, lambda: fired.append("c"))
+    assert clock.armed == [11]
+
+    _fire_at(timers, clock, 11)
+
+    assert sorted(fired) == ["a", "b"]
+    assert timers.diagnostics()["passes"] == 1
+    assert timers.diagnostics()["fired"] == 2
+    assert timers.diagnostics()["armed_for"] == 13
+
+
+def _event_sensor(hass, timers: AqaraHoldTimers, resource: str, written: list[str]) -> AqaraBinarySensor:
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, name=resource)
+    spec = {"inApp": resource, "name": resource, "icon": "mdi:bell", "value_type": "event", "hold_seconds": 5}
+    sensor = AqaraBinarySensor(coordinator, "lumi.test1", "Test", None, spec, "lumi.camera.gwpgl1", "G3")
+    sensor.hass = hass
+    sensor._hold_timers = timers
+    sensor.async_write_ha_state = lambda: written.append(resource)
+    return sensor
+
+
+@pytest.mark.asyncio
+async def test_removed_entity_is_never_written(hass, clock) -> None:
+    timers = AqaraHoldTimers(hass, tick=1)
+    written: list[str] = []
+    kept = _event_sensor(hass, timers, "kept", written)
+    removed = _event_sensor(hass, timers, "removed", written)
+    kept._schedule_event_clear()
+    removed._schedule_event_clear()
+
+    await removed.async_will_remove_from_hass()
+    # The sensors compute their deadline from the real clock.
+    _fire_at(timers, clock, max(kept._event_active_until, removed._event_active_until) + 1)
+
+    assert written == ["kept"]
+    assert not timers.is_pending(removed)
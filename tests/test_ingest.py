@@ -0,0 +1,89 @@
+"""Tests for the bounded ingest queue between the SSE reader and the dispatcher."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.ha_aqara_devices.ingest import AqaraIngestQueue
+
+TRIGGER = "13.1.85"
+
+
+def _event(subject_id: str, resource_id: str, value: int) -> dict:
+    return {"subjectId": subject_id, "resourceId": resource_id, "value": value}
+
+
+def _values(batches) -> list[tuple[str, str, int]]:
+    return [
+        (payload_type, event["resourceId"], event["value"])
+        for payload_type, events in batches
+        for event in events
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batches_pass_through_below_the_limit() -> None:
+    queue = AqaraIngestQueue(frozenset({TRIGGER}), max_events=4)
+    queue.put("batch", [_event("d1", "r", 1), "not an event"])
+    queue.put("batch", [])
+    queue.put("batch", [_event("d1", "r", 2)])
+
+    assert _values(await queue.get_all()) == [("batch", "r", 1), ("batch", "r", 2)]
+    assert queue.metrics()["compactions"] == 0
+    assert queue.metrics()["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_overflow_keeps_latest_state_and_every_trigger() -> None:
+    queue = AqaraIngestQueue(frozenset({TRIGGER}), max_events=3)
+    queue.put("snapshot", [_event("d1", "a", 1), _event("d1", "b", 1)])
+    queue.put("batch", [_event("d1", TRIGGER, 1), _event("d1", "a", 2)])
+    queue.put("batch", [_event("d1", TRIGGER, 2)])
+
+    # "a" moves to the position of its latest arrival; "b" keeps its snapshot value.
+    assert _values(await queue.get_all()) == [
+        ("snapshot", "b", 1),
+        ("batch", TRIGGER, 1),
+        ("batch", "a", 2),
+        ("batch", TRIGGER, 2),
+    ]
+    metrics = queue.metrics()
+    assert metrics["merged"] == 1
+    assert metrics["compactions"] == 1
+    assert metrics["enqueued"] == 5
+    assert metrics["dispatched"] == 4
+
+
+def test_distinct_resources_raise_the_compaction_threshold() -> None:
+    queue = AqaraIngestQueue(frozenset(), max_events=2)
+    for index in range(3):
+        queue.put("batch", [_event("d1", f"r{index}", index)])
+    assert queue.metrics()["compactions"] == 1
+
+    # Nothing merged, so the next compaction waits until the queue doubled.
+    for index in range(3, 6):
+        queue.put("batch", [_event("d1", f"r{index}", index)])
+    assert queue.metrics()["compactions"] == 1
+    queue.put("batch", [_event("d1", "r6", 6)])
+    assert queue.metrics()["compactions"] == 2
+    assert queue.metrics()["depth"] == 7
+
+
+@pytest.mark.asyncio
+async def test_get_all_waits_for_the_next_batch() -> None:
+    queue = AqaraIngestQueue(frozenset())
+    waiter = asyncio.ensure_future(queue.get_all())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    queue.put("batch", [_event("d1", "r", 1)])
+    assert _values(await asyncio.wait_for(waiter, 1)) == [("batch", "r", 1)]
+
+
+def test_clear_drops_pending_events() -> None:
+    queue = AqaraIngestQueue(frozenset())
+    queue.put("batch", [_event("d1", "r", 1)])
+    queue.clear()
+
+    assert queue.metrics()["depth"] == 0
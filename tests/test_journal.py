@@ -0,0 +1,85 @@
+"""Tests for the memory-mapped push event journal."""
+from __future__ import annotations
+
+import os
+
+from custom_components.ha_aqara_devices.journal import _HEADER_BYTES, _SLOT_HEADER, AqaraPushJournal
+
+
+def _open(path, **kwargs) -> AqaraPushJournal:
+    journal = AqaraPushJournal(str(path), **kwargs)
+    journal.open()
+    return journal
+
+
+def test_entries_survive_reopen(tmp_path) -> None:
+    path = tmp_path / "push.journal"
+    journal = _open(path, slot_count=8)
+    journal.append("lumi.1", "3.51.85", {"zones": [1, 0]}, 1000)
+    journal.append("lumi.2", "4.1.85", 1, "1001")
+    journal.close()
+
+    journal = _open(path, slot_count=8)
+    entries = journal.read_entries()
+    journal.close()
+
+    assert [(entry["subjectId"], entry["resourceId"], entry["value"], entry["time"]) for entry in entries] == [
+        ("lumi.1", "3.51.85", {"zones": [1, 0]}, 1000),
+        ("lumi.2", "4.1.85", 1, "1001"),
+    ]
+    assert all(isinstance(entry["received_at"], float) for entry in entries)
+    assert os.path.getsize(path) == journal.size_bytes
+
+
+def test_ring_overwrites_oldest_entries(tmp_path) -> None:
+    path = tmp_path / "push.journal"
+    journal = _open(path, slot_count=4)
+    for index in range(10):
+        journal.append("lumi.1", f"r{index}", index, index)
+    journal.close()
+
+    # The next sequence number is recovered, so appends after a reopen stay in order.
+    journal = _open(path, slot_count=4)
+    journal.append("lumi.1", "after", 10, 10)
+
+    assert [entry["resourceId"] for entry in journal.read_entries()] == ["r7", "r8", "r9", "after"]
+    journal.close()
+
+
+def test_oversized_record_is_dropped(tmp_path) -> None:
+    journal = _open(tmp_path / "push.journal", slot_count=4, slot_bytes=64)
+    journal.append("lumi.1", "r", "x" * 100, 1)
+    journal.append("lumi.1", "r", "ok", 1)
+
+    assert journal.dropped == 1
+    assert [entry["value"] for entry in journal.read_entries()] == ["ok"]
+    journal.close()
+
+
+def test_torn_slot_is_skipped(tmp_path) -> None:
+    journal = _open(tmp_path / "push.journal", slot_count=4)
+    journal.append("lumi.1", "r0", 0, 0)
+    journal.append("lumi.1", "r1", 1, 1)
+    # A crash between invalidating the slot and rewriting its header.
+    _SLOT_HEADER.pack_into(journal._map, _HEADER_BYTES + journal._slot_bytes, 0, 0)
+
+    assert [entry["resourceId"] for entry in journal.read_entries()] == ["r0"]
+    journal.close()
+
+
+def test_layout_change_starts_a_new_journal(tmp_path) -> None:
+    path = tmp_path / "push.journal"
+    journal = _open(path, slot_count=4)
+    journal.append("lumi.1", "r", 1, 1)
+    journal.close()
+
+    journal = _open(path, slot_count=8)
+    assert journal.read_entries() == []
+    journal.close()
+
+
+def test_closed_journal_ignores_appends(tmp_path) -> None:
+    journal = AqaraPushJournal(str(tmp_path / "push.journal"), slot_count=4)
+    journal.append("lumi.1", "r", 1, 1)
+
+    assert journal.read_entries() == []
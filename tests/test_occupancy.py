@@ -0,0 +1,105 @@
+"""Tests for the rolling zone occupancy analytics."""
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.ha_aqara_devices.const import FP300_MODEL
+from custom_components.ha_aqara_devices.occupancy import AqaraOccupancyAnalytics, AqaraZoneOccupancy
+
+_LOGGER = logging.getLogger(__name__)
+
+# Aligned to a bucket boundary.
+T0 = 1_000_000 * 900.0
+
+
+def _tracker(zone_count: int = 3) -> AqaraZoneOccupancy:
+    return AqaraZoneOccupancy(zone_count, T0, bucket_seconds=900, buckets=4)
+
+
+def test_entries_dwell_and_occupancy_within_a_bucket() -> None:
+    tracker = _tracker()
+    # Zone 1 is already occupied when first reported, which is not an entry.
+    tracker.observe((0, 1, -1), T0)
+    tracker.observe((1, 1, -1), T0 + 100)
+    tracker.observe((0, 1, -1), T0 + 400)
+
+    zone0, zone1, zone2 = tracker.summary(T0 + 900)
+
+    assert zone0["occupancy"] == pytest.approx(33.3)
+    assert zone0["occupied_seconds"] == 300
+    assert zone0["entries"] == 1
+    assert zone0["dwell_distribution"]["1_5m"] == 1
+    assert sum(zone0["dwell_distribution"].values()) == 1
+    assert zone1["occupancy"] == 100.0
+    assert zone1["entries"] == 0
+    assert zone2 is None
+
+
+def test_unknown_and_repeated_states_keep_the_previous_one() -> None:
+    tracker = _tracker(1)
+    tracker.observe((1,), T0)
+    tracker.observe((-1,), T0 + 100)
+    tracker.observe((1,), T0 + 200)
+
+    (zone,) = tracker.summary(T0 + 300)
+
+    assert zone["occupied_seconds"] == 300
+    assert zone["dwell_distribution"] == dict.fromkeys(zone["dwell_distribution"], 0)
+
+
+def test_occupied_zone_is_credited_across_buckets() -> None:
+    tracker = _tracker(2)
+    tracker.observe((1, 0), T0)
+    tracker.observe((0, 0), T0 + 300)
+
+    zone0, zone1 = tracker.summary(T0 + 900 * 3 + 450)
+
+    assert zone0["occupancy"] == pytest.approx(100 * 300 / 3150, abs=0.1)
+    assert zone1["occupancy"] == 0.0
+
+    tracker.observe((1, 1), T0 + 900 * 3 + 450)
+    zone0, zone1 = tracker.summary(T0 + 900 * 5)
+    assert zone1["occupied_seconds"] == 900 + 450
+    assert zone1["entries"] == 1
+
+
+def test_history_rolls_off_the_window() -> None:
+    tracker = _tracker(2)
+    tracker.observe((1, 1), T0)
+    tracker.observe((0, 1), T0 + 100)
+
+    tracker.observe((0, 0), T0 + 900 * 10)
+    zone0, zone1 = tracker.summary(T0 + 900 * 10 + 10)
+
+    assert zone0["entries"] == 0
+    assert zone0["occupancy"] == 0.0
+    assert sum(zone0["dwell_distribution"].values()) == 0
+    # Three full buckets of the window remain; the current one is 10 seconds old.
+    assert zone1["occupied_seconds"] == 2700
+    assert zone1["dwell_distribution"]["1_4h"] == 1
+
+
+@pytest.mark.asyncio
+async def test_analytics_follow_the_fast_coordinator(hass) -> None:
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, name="test-fast")
+    analytics = AqaraOccupancyAnalytics(hass, "entry")
+    analytics.add_devices(
+        [
+            {"did": "lumi.fp300", "device": {"model": FP300_MODEL}, "coordinators": {"fast": coordinator}},
+            {"did": "lumi.other", "device": {"model": "lumi.switch"}, "coordinators": {"fast": coordinator}},
+        ]
+    )
+
+    coordinator.async_set_updated_data({"report_status01": "1"})
+    await analytics.coordinator.async_refresh()
+
+    assert list(analytics.coordinator.data) == ["lumi.fp300"]
+    assert analytics.coordinator.data["lumi.fp300"][0]["entries"] == 0
+    assert analytics.diagnostics()["devices"] == 1
+
+    await analytics.async_unload()
+    assert analytics.diagnostics()["devices"] == 0
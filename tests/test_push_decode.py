@@ -0,0 +1,68 @@
+"""Large SSE payloads decoded off the event loop."""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any
+
+from aiohttp import web
+import pytest
+
+from custom_components.ha_aqara_devices import push
+
+from .common import DID, RESOURCE_ID, bridge_app, make_manager, open_stream, sse_batch, wait_for
+
+# Two UTF-8 bytes per character.
+LARGE_VALUE = "é" * 100
+
+
+def _large_payload() -> str:
+    return json.dumps(
+        {"type": "batch", "events": [{"subjectId": DID, "resourceId": RESOURCE_ID, "value": LARGE_VALUE}]},
+        ensure_ascii=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_large_payload_is_applied_before_later_events(
+    hass, session, api, bridge_server, monkeypatch
+) -> None:
+    text = _large_payload()
+    # Under the threshold by characters, over it by bytes.
+    monkeypatch.setattr(push, "SSE_EXECUTOR_DECODE_BYTES", len(text) + 1)
+    decoded_in_executor: list[bool] = []
+    decode = push._decode_sse_payload
+
+    def _slow_decode(event_name, payload, known_subjects):
+        in_executor = threading.current_thread() is not threading.main_thread()
+        decoded_in_executor.append(in_executor)
+        if in_executor:
+            time.sleep(0.2)
+        return decode(event_name, payload, known_subjects)
+
+    monkeypatch.setattr(push, "_decode_sse_payload", _slow_decode)
+
+    async def stream(request: web.Request, attempt: int) -> web.StreamResponse:
+        response = await open_stream(request)
+        await response.write(f"id: 1\nevent: batch\ndata: {text}\n\n".encode())
+        await response.write(sse_batch("2", "small"))
+        await asyncio.sleep(3600)
+        return response
+
+    app, _ = bridge_app(stream)
+    manager = make_manager(hass, session, api, [await bridge_server(app)])
+    applied: list[Any] = []
+    manager._apply_batches = lambda batches: applied.extend(
+        event["value"] for _, events in batches for event in events
+    )
+
+    await manager.async_start()
+    try:
+        await wait_for(lambda: len(applied) == 2)
+    finally:
+        await manager.async_stop()
+
+    assert decoded_in_executor == [True, False]
+    assert applied == [LARGE_VALUE, "small"]
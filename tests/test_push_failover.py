@@ -0,0 +1,136 @@
+"""Failover and active-active streaming across several bridge stand-ins."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from aiohttp import web
+import pytest
+
+from custom_components.ha_aqara_devices import push
+
+from .common import HEARTBEAT, bridge_app, make_manager, open_stream, sse_batch, wait_for
+
+# Nothing listens on port 1, so this bridge is never healthy.
+UNREACHABLE_URL = "http://127.0.0.1:1"
+
+
+@pytest.fixture(autouse=True)
+def _fast_reconnect(monkeypatch):
+    monkeypatch.setattr(push, "BRIDGE_STABLE_STREAM_SECONDS", 0)
+
+
+def _replaying_stream(values: list[str], close_after: int | None = None):
+    """Stream every value as one event, optionally closing after close_after events."""
+
+    async def stream(request: web.Request, attempt: int) -> web.StreamResponse:
+        if close_after is not None and attempt > 1:
+            return web.Response(status=503, text="gone")
+        response = await open_stream(request)
+        for index, value in enumerate(values):
+            if index == close_after:
+                return response
+            await response.write(sse_batch(str(index), value))
+            await asyncio.sleep(0.02)
+        while True:
+            await asyncio.sleep(0.1)
+            await response.write(HEARTBEAT)
+
+    return stream
+
+
+def _record_applied(manager) -> list[Any]:
+    applied: list[Any] = []
+    manager._apply_batches = lambda batches: applied.extend(
+        event["value"] for _, events in batches for event in events
+    )
+    return applied
+
+
+@pytest.mark.asyncio
+async def test_fails_over_to_next_ranked_bridge(hass, session, api, bridge_server) -> None:
+    values = ["a", "b", "c", "d", "e"]
+    app_a, seen_a = bridge_app(_replaying_stream(values, close_after=2))
+    app_b, seen_b = bridge_app(
+        _replaying_stream(values),
+        lambda: {"status": "UP", "rocketmqStarted": True, "lastError": "slow consumer"},
+    )
+    url_a = await bridge_server(app_a)
+    url_b = await bridge_server(app_b)
+    # Listed worst first: ranking, not configuration order, picks the bridge.
+    manager = make_manager(hass, session, api, [UNREACHABLE_URL, f"{url_b}/", url_a])
+    applied = _record_applied(manager)
+
+    await manager.async_start()
+    try:
+        await wait_for(lambda: len(applied) == len(values))
+        await wait_for(lambda: manager._connected_bridges == {url_b})
+    finally:
+        await manager.async_stop()
+
+    # After a stable stream the first bridge is retried once, resuming from its own position.
+    assert seen_a == [None, "1"]
+    # Event IDs are per bridge, so the second bridge is not asked to resume from the first one's.
+    assert seen_b == [None]
+    # The events the first bridge already delivered are not applied twice.
+    assert applied == values
+    bridges = {bridge["url"]: bridge for bridge in manager.diagnostics()["bridges"]}
+    assert not bridges[UNREACHABLE_URL]["healthy"]
+    assert bridges[url_a]["last_event_id"] == "1"
+    assert bridges[url_b]["last_event_id"] == "4"
+
+
+@pytest.mark.asyncio
+async def test_active_active_streams_from_two_bridges(hass, session, api, bridge_server) -> None:
+    values = ["a", "b", "c"]
+    app_a, seen_a = bridge_app(_replaying_stream(values))
+    app_b, seen_b = bridge_app(_replaying_stream(values))
+    urls = [await bridge_server(app_a), await bridge_server(app_b)]
+    manager = make_manager(hass, session, api, urls, active_active=True)
+    applied = _record_applied(manager)
+
+    await manager.async_start()
+    try:
+        await wait_for(lambda: manager._connected_bridges == set(urls))
+        await wait_for(lambda: len(applied) == len(values))
+        await asyncio.sleep(0.2)
+        assert manager.diagnostics()["mode"] == "active-active"
+    finally:
+        await manager.async_stop()
+
+    assert seen_a == [None]
+    assert seen_b == [None]
+    assert applied == values
+
+
+@pytest.mark.asyncio
+async def test_second_lane_leaves_the_streaming_bridge_alone(
+    hass, session, api, bridge_server, caplog
+) -> None:
+    health_checks = [0]
+
+    def health() -> dict[str, Any]:
+        health_checks[0] += 1
+        return {"status": "UP", "rocketmqStarted": True}
+
+    caplog.set_level(logging.DEBUG, logger=push.__name__)
+    app, seen = bridge_app(_replaying_stream(["a"]), health)
+    url = await bridge_server(app)
+    manager = make_manager(hass, session, api, [url, UNREACHABLE_URL], active_active=True)
+
+    await manager.async_start()
+    try:
+        await wait_for(lambda: manager._connected_bridges == {url})
+        checks = health_checks[0]
+        # The second lane retries after 1 s and 2 s.
+        await asyncio.sleep(3.2)
+        assert health_checks[0] == checks
+    finally:
+        await manager.async_stop()
+
+    assert seen == [None]
+    messages = [record for record in caplog.records if "No second Aqara bridge" in record.getMessage()]
+    assert len(messages) >= 2
+    assert [record.levelname for record in messages].count("WARNING") == 1
+    assert not [record for record in caplog.records if "No Aqara bridge SSE stream" in record.getMessage()]
@@ -0,0 +1,107 @@
+"""SSE resume and event gap handling against a local bridge stand-in."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from aiohttp import web
+import pytest
+
+from custom_components.ha_aqara_devices import push
+
+from .common import DID, RESOURCE_ID, bridge_app, make_manager, open_stream, sse_batch, wait_for
+
+
+@pytest.fixture(autouse=True)
+def _fast_reconnect(monkeypatch):
+    # Any stream that connected counts as stable, so the listener reconnects at once.
+    monkeypatch.setattr(push, "BRIDGE_STABLE_STREAM_SECONDS", 0)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resumes_after_last_event_id(hass, session, api, bridge_server) -> None:
+    async def stream(request: web.Request, attempt: int) -> web.StreamResponse:
+        response = await open_stream(request)
+        if attempt == 1:
+            await response.write(sse_batch("1", "a"))
+            await response.write(sse_batch("2", "b"))
+            return response
+        await response.write(sse_batch("3", "c"))
+        await asyncio.sleep(3600)
+        return response
+
+    app, seen = bridge_app(stream)
+    manager = make_manager(hass, session, api, [await bridge_server(app)])
+    applied: list[Any] = []
+    manager._apply_batches = lambda batches: applied.extend(
+        event["value"] for _, events in batches for event in events
+    )
+
+    await manager.async_start()
+    try:
+        await wait_for(lambda: len(applied) == 3)
+    finally:
+        await manager.async_stop()
+
+    assert seen == [None, "2"]
+    assert applied == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_gap_status_restarts_stream_and_catches_up(hass, session, api, bridge_server) -> None:
+    async def stream(request: web.Request, attempt: int) -> web.StreamResponse:
+        if attempt == 2:
+            # The bridge no longer holds event 7.
+            return web.Response(status=410, text="event 7 expired")
+        response = await open_stream(request)
+        await response.write(sse_batch("7", "a"))
+        if attempt == 1:
+            return response
+        await asyncio.sleep(3600)
+        return response
+
+    app, seen = bridge_app(stream)
+    manager = make_manager(hass, session, api, [await bridge_server(app)])
+    reasons: list[str] = []
+    schedule_catch_up = manager._schedule_catch_up
+
+    def _record_catch_up(reason: str) -> None:
+        reasons.append(reason)
+        schedule_catch_up(reason)
+
+    manager._schedule_catch_up = _record_catch_up
+
+    await manager.async_start()
+    try:
+        await wait_for(lambda: len(seen) == 3)
+        await wait_for(lambda: bool(api.queries))
+    finally:
+        await manager.async_stop()
+
+    assert seen == [None, "7", None]
+    assert "event gap" in reasons
+    assert api.queries[-1] == [{"subjectId": DID, "resourceIds": [RESOURCE_ID]}]
+
+
+@pytest.mark.asyncio
+async def test_gap_notice_drops_stream_position(hass, session, api, bridge_server) -> None:
+    async def stream(request: web.Request, attempt: int) -> web.StreamResponse:
+        response = await open_stream(request)
+        await response.write(sse_batch(str(attempt), "a"))
+        if attempt == 1:
+            await response.write(b'event: reset\ndata: {"type": "reset", "reason": "bridge restarted"}\n\n')
+            return response
+        await asyncio.sleep(3600)
+        return response
+
+    app, seen = bridge_app(stream)
+    manager = make_manager(hass, session, api, [await bridge_server(app)])
+
+    await manager.async_start()
+    try:
+        await wait_for(lambda: len(seen) == 2)
+    finally:
+        await manager.async_stop()
+
+    # The reset notice came after event 1, so the reconnect must not resume from it.
+    assert seen == [None, None]
@@ -0,0 +1,147 @@
+"""Read-idle watchdog, health rechecks and the polling fallback delay."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from aiohttp import web
+import pytest
+
+from custom_components.ha_aqara_devices import push
+
+from .common import HEARTBEAT, bridge_app, make_manager, open_stream, sse_batch, wait_for
+
+
+@pytest.fixture(autouse=True)
+def _fast_watchdog(monkeypatch):
+    monkeypatch.setattr(push, "BRIDGE_STABLE_STREAM_SECONDS", 0)
+    monkeypatch.setattr(push, "BRIDGE_WATCHDOG_TICK_SECONDS", 0.05)
+    monkeypatch.setattr(push, "BRIDGE_READ_IDLE_TIMEOUT_SECONDS", 60)
+    monkeypatch.setattr(push, "BRIDGE_HEALTH_RECHECK_SECONDS", 60)
+    monkeypatch.setattr(push, "BRIDGE_POLLING_FALLBACK_DELAY_SECONDS", 60)
+
+
+async def _heartbeats(response: web.StreamResponse) -> web.StreamResponse:
+    while True:
+        await asyncio.sleep(0.1)
+        await response.write(HEARTBEAT)
+
+
+@pytest.mark.asyncio
+async def test_silent_stream_is_dropped_and_heartbeats_keep_it_open(
+    hass, session, api, bridge_server, monkeypatch
+) -> None:
+    monkeypatch.setattr(push, "BRIDGE_READ_IDLE_TIMEOUT_SECONDS", 0.5)
+
+    async def stream(request: web.Request, attempt: int) -> web.StreamResponse:
+        response = await open_stream(request)
+        await response.write(sse_batch(str(attempt), "a"))
+        if attempt == 1:
+            # A half-open stream: nothing more, but no close either.
+            await asyncio.sleep(3600)
+        return await _heartbeats(response)
+
+    app, seen = bridge_app(stream)
+    manager = make_manager(hass, session, api, [await bridge_server(app)])
+
+    await manager.async_start()
+    try:
+        await wait_for(lambda: len(seen) == 2)
+        # Heartbeats alone keep the second stream alive past the idle deadline.
+        await asyncio.sleep(1.0)
+        assert len(seen) == 2
+        assert manager._connected_bridges
+        assert not manager._polling_enabled
+    finally:
+        await manager.async_stop()
+
+    assert seen == [None, "1"]
+
+
+@pytest.mark.asyncio
+async def test_failing_health_recheck_drops_stream(hass, session, api, bridge_server, monkeypatch) -> None:
+    monkeypatch.setattr(push, "BRIDGE_HEALTH_RECHECK_SECONDS", 0.1)
+    monkeypatch.setattr(push, "BRIDGE_POLLING_FALLBACK_DELAY_SECONDS", 0.3)
+    health = {"status": "UP", "rocketmqStarted": True}
+
+    async def stream(request: web.Request, attempt: int) -> web.StreamResponse:
+        return await _heartbeats(await open_stream(request))
+
+    app, seen = bridge_app(stream, lambda: health)
+    manager = make_manager(hass, session, api, [await bridge_server(app)])
+
+    await manager.async_start()
+    try:
+        await wait_for(lambda: bool(manager._connected_bridges))
+        # The stream keeps sending heartbeats, but the RocketMQ consumer is gone.
+        health["rocketmqStarted"] = False
+        await wait_for(lambda: not manager._connected_bridges)
+        await wait_for(lambda: manager._polling_enabled)
+        bridge = manager._bridges[0]
+        assert not bridge["healthy"]
+        assert "RocketMQ consumer is not ready" in bridge["last_error"]
+        assert len(seen) == 1
+    finally:
+        await manager.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_polling_fallback_waits_for_the_delay(hass, session, api, bridge_server, monkeypatch) -> None:
+    monkeypatch.setattr(push, "BRIDGE_POLLING_FALLBACK_DELAY_SECONDS", 0.6)
+
+    async def stream(request: web.Request, attempt: int) -> web.StreamResponse:
+        if attempt > 1:
+            return web.Response(status=503, text="restarting")
+        response = await open_stream(request)
+        await response.write(sse_batch("1", "a"))
+        return response
+
+    app, _ = bridge_app(stream)
+    manager = make_manager(hass, session, api, [await bridge_server(app)])
+
+    await manager.async_start()
+    try:
+        await wait_for(lambda: manager._disconnected_at is not None)
+        dropped = time.monotonic()
+        await asyncio.sleep(0.2)
+        assert not manager._polling_enabled
+        await wait_for(lambda: manager._polling_enabled)
+        assert time.monotonic() - dropped >= 0.5
+    finally:
+        await manager.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_short_outage_does_not_enable_polling(hass, session, api, bridge_server, monkeypatch) -> None:
+    monkeypatch.setattr(push, "BRIDGE_POLLING_FALLBACK_DELAY_SECONDS", 3)
+
+    async def stream(request: web.Request, attempt: int) -> web.StreamResponse:
+        if attempt == 2:
+            return web.Response(status=503, text="restarting")
+        response = await open_stream(request)
+        await response.write(sse_batch(str(attempt), "a"))
+        if attempt == 1:
+            return response
+        return await _heartbeats(response)
+
+    app, seen = bridge_app(stream)
+    manager = make_manager(hass, session, api, [await bridge_server(app)])
+
+    await manager.async_start()
+    await wait_for(lambda: bool(manager._connected_bridges))
+    polling: list[bool] = []
+    set_polling_enabled = manager._set_polling_enabled
+
+    def _record_polling(enabled: bool) -> None:
+        polling.append(enabled)
+        set_polling_enabled(enabled)
+
+    manager._set_polling_enabled = _record_polling
+    try:
+        # The listener backs off for a second after the refused reconnect.
+        await wait_for(lambda: len(seen) == 3 and bool(manager._connected_bridges))
+        assert True not in polling
+        assert manager._cancel_polling_fallback is None
+        assert manager._disconnected_at is None
+    finally:
+        await manager.async_stop()
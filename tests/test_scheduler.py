@@ -0,0 +1,104 @@
+"""Tests for the staggered poll scheduler."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+
+import pytest
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.ha_aqara_devices.scheduler import AqaraPollScheduler, _did_jitter
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _register(hass, scheduler, order, did, label, priority, *, interval=300, push_managed=True):
+    async def fetch():
+        order.append(did)
+        await asyncio.sleep(0.01)
+        return {"did": did}
+
+    coordinator = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=f"test-{label}-{did}",
+        update_method=scheduler.limited(fetch),
+        update_interval=timedelta(seconds=interval),
+    )
+    scheduler.register(coordinator, did, label, interval, priority, push_managed=push_managed)
+    return coordinator
+
+
+def test_jitter_is_deterministic() -> None:
+    assert _did_jitter("lumi.1", "state") == _did_jitter("lumi.1", "state")
+    assert _did_jitter("lumi.1", "state") != _did_jitter("lumi.1", "medium")
+    assert 0 <= _did_jitter("lumi.1", "state") < 1
+
+
+@pytest.mark.asyncio
+async def test_phases_spread_over_the_interval(hass) -> None:
+    scheduler = AqaraPollScheduler(hass)
+    for index in range(6):
+        _register(hass, scheduler, [], f"lumi.{index}", "state", 0)
+
+    phases = sorted(scheduler._phases().values())
+
+    # One coordinator per 50 second slot.
+    assert [int(phase // 50) for phase in phases] == list(range(6))
+
+
+@pytest.mark.asyncio
+async def test_startup_refreshes_run_by_priority(hass) -> None:
+    scheduler = AqaraPollScheduler(hass, max_concurrency=1)
+    order: list[str] = []
+    _register(hass, scheduler, order, "hub", "state", 3)
+    _register(hass, scheduler, order, "lock", "state", 0)
+    deferred = _register(hass, scheduler, order, "camera", "state", 1)
+    _register(hass, scheduler, order, "presence", "state", 2)
+    scheduler.defer_startup_refresh(deferred)
+
+    await scheduler.async_start()
+    try:
+        assert order == ["lock", "presence", "hub"]
+    finally:
+        scheduler.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_polling_is_armed_only_while_enabled(hass) -> None:
+    scheduler = AqaraPollScheduler(hass)
+    managed = _register(hass, scheduler, [], "lumi.1", "state", 0)
+    unmanaged = _register(hass, scheduler, [], "lumi.2", "sanity", 0, push_managed=False)
+    # Push-managed coordinators wait for their phase before polling.
+    assert managed.update_interval is None
+    assert unmanaged.update_interval == timedelta(seconds=300)
+
+    scheduler.set_polling_enabled(False)
+    await scheduler.async_start()
+    assert not scheduler._pending
+
+    scheduler.set_polling_enabled(True)
+    assert set(scheduler._pending) == {id(managed)}
+
+    scheduler.set_polling_enabled(False)
+    assert not scheduler._pending
+    assert managed.update_interval is None
+    assert unmanaged.update_interval == timedelta(seconds=300)
+    scheduler.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_unregister_cancels_pending_activation(hass) -> None:
+    scheduler = AqaraPollScheduler(hass)
+    _register(hass, scheduler, [], "lumi.1", "state", 0)
+    _register(hass, scheduler, [], "lumi.2", "state", 0)
+    await scheduler.async_start()
+    assert len(scheduler._pending) == 2
+
+    scheduler.unregister_devices({"lumi.1"})
+
+    assert len(scheduler._pending) == 1
+    assert [row["did"] for row in scheduler.diagnostics()] == ["lumi.2"]
+    scheduler.async_shutdown()
@@ -0,0 +1,69 @@
+"""Tests for restored state and how entities report it."""
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.ha_aqara_devices.const import ATTR_RESTORED_STATE, DOMAIN, STATE_STORE_VERSION
+from custom_components.ha_aqara_devices.entity import AqaraCoordinatorEntity
+from custom_components.ha_aqara_devices.state_store import AqaraStateStore
+
+_LOGGER = logging.getLogger(__name__)
+ENTRY_ID = "entry"
+
+
+async def _make_store(hass, saved: dict) -> AqaraStateStore:
+    await Store(hass, STATE_STORE_VERSION, f"{DOMAIN}.{ENTRY_ID}.state").async_save(
+        {"saved_at": 1.0, "coordinators": saved}
+    )
+    store = AqaraStateStore(hass, ENTRY_ID)
+    await store.async_load()
+    hass.data.setdefault(DOMAIN, {})[ENTRY_ID] = {"state_store": store}
+    return store
+
+
+def _make_entity(hass, coordinator: DataUpdateCoordinator) -> AqaraCoordinatorEntity:
+    entity = AqaraCoordinatorEntity(coordinator)
+    entity.hass = hass
+    entity.platform = SimpleNamespace(config_entry=SimpleNamespace(entry_id=ENTRY_ID))
+    return entity
+
+
+@pytest.mark.asyncio
+async def test_restored_state_is_reported_until_fresh_data(hass):
+    store = await _make_store(hass, {"camera": {"alarm": "1"}})
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, name="camera")
+    store.seed([coordinator])
+    entity = _make_entity(hass, coordinator)
+    seen: list = []
+    # Registered after seeding, like the entity listeners during setup.
+    coordinator.async_add_listener(lambda: seen.append(entity.extra_state_attributes))
+
+    assert entity.extra_state_attributes == {ATTR_RESTORED_STATE: True}
+
+    # Journal replay happens before async_watch and predates the restart.
+    coordinator.async_set_updated_data({"alarm": "0"})
+    assert seen == [{ATTR_RESTORED_STATE: True}]
+
+    store.async_watch()
+    coordinator.async_set_updated_data({"alarm": "1"})
+    assert seen[-1] is None
+    assert not store.is_stale(coordinator)
+    store.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_unseeded_coordinator_is_not_restored(hass):
+    store = await _make_store(hass, {})
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, name="camera")
+    store.seed([coordinator])
+    entity = _make_entity(hass, coordinator)
+    entity._attr_extra_state_attributes = {"lock_state": "locked"}
+
+    assert entity.extra_state_attributes == {"lock_state": "locked"}
+    store.async_stop()
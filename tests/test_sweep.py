@@ -0,0 +1,72 @@
+"""Tests for the fleet sweep plan."""
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.ha_aqara_devices.const import (
+    POLL_PRIORITY_LOCK,
+    POLL_PRIORITY_PRESENCE,
+    POLL_PRIORITY_SETTINGS,
+)
+from custom_components.ha_aqara_devices.sweep import AqaraFleetSweeper
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _RecordingApi:
+    def __init__(self, coordinators: dict[str, DataUpdateCoordinator]) -> None:
+        self._coordinators = coordinators
+        self.calls: list[tuple[list[str], list[str]]] = []
+
+    async def query_resource_values(self, resources, max_resources=None):
+        published = [did for did, coordinator in self._coordinators.items() if coordinator.data is not None]
+        self.calls.append(([item["subjectId"] for item in resources], published))
+        items = [
+            {"subjectId": item["subjectId"], "resourceId": resource_id, "value": "1"}
+            for item in resources
+            for resource_id in item["resourceIds"]
+        ]
+        return items, {}
+
+
+def _poll(resource_id: str) -> dict:
+    return {
+        "resource_ids": [resource_id],
+        "extra": None,
+        "map_items": lambda items: {item["resourceId"]: item["value"] for item in items},
+    }
+
+
+@pytest.mark.asyncio
+async def test_sweep_publishes_priority_tiers_in_order(hass) -> None:
+    coordinators = {
+        did: DataUpdateCoordinator(hass, _LOGGER, name=f"test-{did}")
+        for did in ("hub", "lock", "fp2", "other_lock")
+    }
+    api = _RecordingApi(coordinators)
+    sweeper = AqaraFleetSweeper(api)
+    sweeper.add(coordinators["hub"], "hub", _poll("8.0.2116"), POLL_PRIORITY_SETTINGS)
+    sweeper.add(coordinators["lock"], "lock", _poll("13.1.85"), POLL_PRIORITY_LOCK)
+    # A device takes the priority of its most urgent coordinator.
+    sweeper.add(coordinators["fp2"], "fp2", _poll("3.51.85"), POLL_PRIORITY_PRESENCE)
+    sweeper.add(DataUpdateCoordinator(hass, _LOGGER, name="test-fp2-slow"), "fp2", _poll("14.1.85"))
+    sweeper.add(coordinators["other_lock"], "other_lock", _poll("13.1.85"), POLL_PRIORITY_LOCK)
+
+    assert [item["subjectId"] for item in sweeper.plan()] == ["lock", "other_lock", "fp2", "hub"]
+    assert sweeper.diagnostics()["requests_per_sweep"] == 3
+
+    result = await sweeper.async_sweep()
+
+    # Each tier is published before the next one is queried.
+    assert api.calls == [
+        (["lock", "other_lock"], []),
+        (["fp2"], ["lock", "other_lock"]),
+        (["hub"], ["lock", "fp2", "other_lock"]),
+    ]
+    assert result["requests"] == 3
+    assert result["items"] == 5
+    assert coordinators["hub"].data == {"8.0.2116": "1"}